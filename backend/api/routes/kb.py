@@ -0,0 +1,52 @@
+"""KB Admin API - KB 인덱스 상태 조회 및 핫 리로드"""
+from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
+from backend.core.auth import require_auth
+from backend.services.kb_service import kb_service
+from typing import Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/kb/status")
+async def get_kb_status() -> Dict[str, Any]:
+    """
+    KB 인덱스 상태 조회
+
+    - version: 인덱스 빌드 순번 (재로드마다 증가)
+    - source_hash: KB 원본 파일 내용 해시
+    """
+    return kb_service.get_index_status()
+
+
+@router.post("/kb/reload", status_code=status.HTTP_202_ACCEPTED)
+async def reload_kb(
+    background_tasks: BackgroundTasks,
+    force: bool = False,
+    user_id: str = Depends(require_auth)
+) -> Dict[str, Any]:
+    """
+    KB 핫 리로드 (백그라운드)
+
+    - 새 인덱스를 백그라운드에서 완전히 빌드한 뒤 원자적으로 교체
+    - 진행 중인 검색은 기존 인덱스로 완료됨 (재시작 불필요)
+    - force=false면 KB 파일 내용이 바뀐 경우에만 재빌드
+    """
+    try:
+        background_tasks.add_task(kb_service.reload, force)
+
+        logger.info(f"[KB] Reload scheduled by user {user_id} (force={force})")
+
+        return {
+            "status": "scheduled",
+            "current": kb_service.get_index_status()
+        }
+
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to schedule KB reload: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"KB 재로드 실패: {str(e)}"
+        )
@@ -1,11 +1,21 @@
 """Runs API - 1p 생성 작업 관리"""
-from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends, status, BackgroundTasks, Query
+from backend.core.config import settings
 from backend.core.database import get_supabase_admin
 from backend.core.auth import require_auth
 from backend.models.schemas import RunCreate, RunResponse, RunProgress
-from backend.services.run_service import execute_pipeline_async
+from backend.services.job_queue import QueueFullError
+from backend.services.run_service import (
+    RERUN_NODES,
+    execute_pipeline_async,
+    execute_rerun_async,
+    find_rerun_checkpoint,
+    get_run_queue,
+    resolve_rerun_node,
+    update_run_status,
+)
 from supabase import Client
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 from datetime import datetime
 
@@ -13,6 +23,77 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# 큐가 가득 찼을 때 클라이언트 재시도 권장 간격 (초)
+QUEUE_FULL_RETRY_AFTER = 30
+
+
+def _queue_full_error() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="대기 중인 작업이 너무 많습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": str(QUEUE_FULL_RETRY_AFTER)}
+    )
+
+
+def _schedule_run(
+    run_id: str,
+    payload: Dict[str, Any],
+    background_tasks: BackgroundTasks,
+    task,
+    *task_args
+):
+    """
+    Run 실행 등록
+    
+    - 작업 큐 사용 시: payload를 큐에 등록 (확인 이후 다른 요청이 큐를 채웠으면 run을 실패 처리하고 503)
+    - background: API 프로세스의 백그라운드 작업으로 task(*task_args) 실행
+    """
+    if settings.run_queue_backend != "background":
+        try:
+            get_run_queue().enqueue(run_id, payload)
+        except QueueFullError as e:
+            update_run_status(run_id, "failed", error_message=str(e), completed_at=datetime.now())
+            raise _queue_full_error()
+        logger.info(f"[RUN] Run {run_id} enqueued for workers")
+    else:
+        background_tasks.add_task(task, *task_args)
+        logger.info(f"[RUN] Background task scheduled for run {run_id}")
+
+
+def _insert_run(supabase: Client, user_id: str, run_params: Dict[str, Any]) -> Dict[str, Any]:
+    """run 레코드 생성 (status=pending)"""
+    run_result = supabase.table("runs").insert({
+        "user_id": user_id,
+        "params_json": run_params,
+        "status": "pending",
+        "progress_json": {
+            "current_node": None,
+            "percent": 0.0,
+            "timestamp": datetime.now().isoformat()
+        }
+    }).execute()
+    
+    if not run_result.data:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Run 생성 실패"
+        )
+    
+    return run_result.data[0]
+
+
+def _run_response(run: Dict[str, Any]) -> RunResponse:
+    return RunResponse(
+        id=run["id"],
+        user_id=run["user_id"],
+        status=run["status"],
+        progress_json=RunProgress(**run["progress_json"]),
+        params_json=run["params_json"],
+        error_message=None,
+        created_at=run["created_at"],
+        completed_at=None
+    )
+
 
 @router.post("/runs", response_model=RunResponse, status_code=status.HTTP_201_CREATED)
 async def create_run(
@@ -25,11 +106,18 @@ async def create_run(
     1p 생성 작업 생성
     
     - run 레코드 생성 (status=pending)
-    - 백그라운드 작업 등록 (Phase 2.3에서 구현)
+    - RUN_QUEUE_BACKEND=background: API 프로세스의 백그라운드 작업으로 실행
+    - RUN_QUEUE_BACKEND=sqlite: 작업 큐에 등록 → 워커가 실행 (큐가 가득 차면 503 + Retry-After)
     
     **참고**: 현재 user_id는 임시 UUID 사용 (Phase 2.4 인증 구현 후 실제 사용자로 변경)
     """
+    use_queue = settings.run_queue_backend != "background"
+    
     try:
+        # 백프레셔: 큐가 가득 차 있으면 run 레코드를 만들기 전에 거절
+        if use_queue and not get_run_queue().has_capacity():
+            raise _queue_full_error()
+        
         # 도서 존재 확인
         books_result = supabase.table("books") \
             .select("id") \
@@ -51,27 +139,16 @@ async def create_run(
             "remind_enabled": run_data.remind_enabled
         }
         
-        run_result = supabase.table("runs").insert({
-            "user_id": user_id,
-            "params_json": run_params,
-            "status": "pending",
-            "progress_json": {
-                "current_node": None,
-                "percent": 0.0,
-                "timestamp": datetime.now().isoformat()
-            }
-        }).execute()
-        
-        if not run_result.data:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Run 생성 실패"
-            )
+        run = _insert_run(supabase, user_id, run_params)
         
-        run = run_result.data[0]
-        
-        # 백그라운드 작업 등록
-        background_tasks.add_task(
+        _schedule_run(
+            run["id"],
+            {
+                "book_ids": run_data.book_ids,
+                "mode": run_data.mode,
+                "format": run_data.format
+            },
+            background_tasks,
             execute_pipeline_async,
             run["id"],
             run_data.book_ids,
@@ -80,18 +157,8 @@ async def create_run(
         )
         
         logger.info(f"[RUN] Created run {run['id']} with {len(run_data.book_ids)} books (mode={run_data.mode})")
-        logger.info(f"[RUN] Background task scheduled for run {run['id']}")
-        
-        return RunResponse(
-            id=run["id"],
-            user_id=run["user_id"],
-            status=run["status"],
-            progress_json=RunProgress(**run["progress_json"]),
-            params_json=run["params_json"],
-            error_message=None,
-            created_at=run["created_at"],
-            completed_at=None
-        )
+        
+        return _run_response(run)
         
     except HTTPException:
         raise
@@ -103,6 +170,114 @@ async def create_run(
         )
 
 
+@router.post("/runs/{run_id}/rerun", response_model=RunResponse, status_code=status.HTTP_201_CREATED)
+async def rerun(
+    run_id: str,
+    background_tasks: BackgroundTasks,
+    from_node: str = Query("producer", alias="from", description="재실행 시작 노드 (integrator | producer)"),
+    format: Optional[str] = Query(None, pattern="^(content|service)$", description="형식 변경 (생략 시 원본 유지)"),
+    user_id: str = Depends(require_auth),
+    supabase: Client = Depends(get_supabase_admin)
+):
+    """
+    완료된 run을 특정 노드부터 재실행 (새 run 생성)
+    
+    - 원본 run의 체크포인트에서 from 노드 직전 상태를 새 run으로 포크
+    - AnchorMapper/Reviewer 등 앞선 노드 결과는 재사용, from 노드 이후만 다시 실행
+    - format을 바꾸면 from과 관계없이 integrator부터 실행
+    - 체크포인트가 없으면 (메모리 체크포인터 재시작, 보존 기간 경과 등) 409
+    """
+    if from_node not in RERUN_NODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"재실행 가능한 노드: {', '.join(RERUN_NODES)}"
+        )
+    
+    use_queue = settings.run_queue_backend != "background"
+    
+    try:
+        if use_queue and not get_run_queue().has_capacity():
+            raise _queue_full_error()
+        
+        source_result = supabase.table("runs") \
+            .select("*") \
+            .eq("id", run_id) \
+            .execute()
+        
+        if not source_result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Run을 찾을 수 없습니다"
+            )
+        
+        source = source_result.data[0]
+        
+        if source["user_id"] != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="재실행 권한이 없습니다"
+            )
+        
+        if source["status"] in ("pending", "running"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="실행 중인 run은 재실행할 수 없습니다"
+            )
+        
+        # format 변경 시 integrator부터 (통합 결과가 format별로 생성됨)
+        from_node = resolve_rerun_node(from_node, source["params_json"].get("format"), format)
+        
+        if await find_rerun_checkpoint(run_id, from_node) is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"'{from_node}' 재실행에 필요한 체크포인트가 없습니다. 새 run을 생성해주세요"
+            )
+        
+        run_params = {
+            **source["params_json"],
+            "format": format or source["params_json"].get("format"),
+            "rerun_of": run_id,
+            "from_node": from_node
+        }
+        run = _insert_run(supabase, user_id, run_params)
+        
+        _schedule_run(
+            run["id"],
+            {"rerun_of": run_id, "from_node": from_node, "format": format},
+            background_tasks,
+            execute_rerun_async,
+            run["id"],
+            run_id,
+            from_node,
+            format
+        )
+        
+        logger.info(f"[RUN] Created re-run {run['id']} of {run_id} from {from_node}")
+        
+        return _run_response(run)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"[ERROR] Failed to create re-run: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Run 재실행 실패: {str(e)}"
+        )
+
+
+@router.get("/runs/queue")
+async def get_run_queue_status():
+    """
+    Run 작업 큐 상태 조회
+    
+    - 상태별 작업 수 (pending, running, done, failed)와 대기 상한
+    """
+    if settings.run_queue_backend == "background":
+        return {"backend": "background"}
+    return get_run_queue().stats()
+
+
 @router.get("/runs/{run_id}")
 async def get_run_status(
     run_id: str,
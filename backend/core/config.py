@@ -29,6 +29,63 @@ class Settings(BaseSettings):
     api_host: str = Field(default="0.0.0.0", alias="API_HOST")
     api_port: int = Field(default=8000, alias="API_PORT")
     
+    # 시작 시 KB 로드 + 그래프 컴파일 백그라운드 워밍업 (False면 최초 사용 시 로드)
+    warmup_on_startup: bool = Field(default=True, alias="WARMUP_ON_STARTUP")
+    
+    # KB 파일 변경 감시 (변경 시 인덱스 재빌드 후 원자적 교체)
+    kb_watch_enabled: bool = Field(default=False, alias="KB_WATCH_ENABLED")
+    kb_watch_interval: float = Field(default=5.0, alias="KB_WATCH_INTERVAL")
+    
+    # KB 검색 백엔드 (tfidf | dense | hybrid), dense/hybrid는 KB 임베딩 사용
+    kb_retrieval_backend: str = Field(default="tfidf", alias="KB_RETRIEVAL_BACKEND")
+    kb_embedding_model: str = Field(default="text-embedding-3-small", alias="KB_EMBEDDING_MODEL")
+    kb_hybrid_alpha: float = Field(default=0.5, alias="KB_HYBRID_ALPHA")
+    
+    # KB 도메인 파일 병렬 파싱 (프로세스 풀, 대용량/다도메인 KB에서만 이득)
+    kb_parallel_load: bool = Field(default=False, alias="KB_PARALLEL_LOAD")
+    
+    # KB 검색 결과 LRU 캐시 (최대 항목 수, 0이면 비활성화) / TTL (초)
+    kb_query_cache_size: int = Field(default=1024, alias="KB_QUERY_CACHE_SIZE")
+    kb_query_cache_ttl: float = Field(default=3600.0, alias="KB_QUERY_CACHE_TTL")
+    
+    # LLM 클라이언트 공유 연결 풀 (노드 설정별 ChatOpenAI 재사용)
+    llm_max_connections: int = Field(default=100, alias="LLM_MAX_CONNECTIONS")
+    llm_max_keepalive_connections: int = Field(default=20, alias="LLM_MAX_KEEPALIVE_CONNECTIONS")
+    llm_keepalive_expiry: float = Field(default=60.0, alias="LLM_KEEPALIVE_EXPIRY")
+    llm_timeout: float = Field(default=120.0, alias="LLM_TIMEOUT")
+    
+    # LLM 응답 캐시 (none | memory | sqlite | postgres), 노드별 사용 여부는 models_config
+    llm_cache_backend: str = Field(default="memory", alias="LLM_CACHE_BACKEND")
+    llm_cache_path: str = Field(default=".cache/llm_cache.db", alias="LLM_CACHE_PATH")
+    llm_cache_size: int = Field(default=512, alias="LLM_CACHE_SIZE")
+    # Reviewer 출력 재사용 (LLM 응답 캐시 저장소 공유, LLM_CACHE_BACKEND=none이면 비활성화)
+    review_memo_enabled: bool = Field(default=True, alias="REVIEW_MEMO_ENABLED")
+    
+    # Run 실행 방식 (background: API 프로세스 BackgroundTasks | sqlite: 작업 큐 + 별도 워커)
+    run_queue_backend: str = Field(default="background", alias="RUN_QUEUE_BACKEND")
+    run_queue_path: str = Field(default=".cache/run_queue.db", alias="RUN_QUEUE_PATH")
+    run_queue_max_pending: int = Field(default=100, alias="RUN_QUEUE_MAX_PENDING")
+    run_queue_max_attempts: int = Field(default=3, alias="RUN_QUEUE_MAX_ATTEMPTS")
+    
+    # LangGraph 체크포인터 (memory | sqlite | postgres), sqlite/postgres는 재시작 후에도 run 재실행(POST /runs/{id}/rerun) 가능
+    checkpoint_backend: str = Field(default="sqlite", alias="CHECKPOINT_BACKEND")
+    checkpoint_path: str = Field(default=".cache/checkpoints.db", alias="CHECKPOINT_PATH")
+    checkpoint_postgres_url: Optional[str] = Field(default=None, alias="CHECKPOINT_POSTGRES_URL")
+    # 체크포인트 보존: 완료 run 압축(최신 + 재실행 포크 지점만 유지), 보존 기간(시간, 0이면 무제한), 최대 thread 수
+    checkpoint_compact: bool = Field(default=True, alias="CHECKPOINT_COMPACT")
+    checkpoint_retention_hours: float = Field(default=168.0, alias="CHECKPOINT_RETENTION_HOURS")
+    checkpoint_max_threads: int = Field(default=200, alias="CHECKPOINT_MAX_THREADS")
+    checkpoint_sweep_interval: float = Field(default=600.0, alias="CHECKPOINT_SWEEP_INTERVAL")
+    
+    # 워커 (python -m backend.worker): 동시 실행 run 수, 리스/하트비트 주기 (초)
+    worker_concurrency: int = Field(default=4, alias="WORKER_CONCURRENCY")
+    worker_lease_seconds: float = Field(default=120.0, alias="WORKER_LEASE_SECONDS")
+    worker_heartbeat_interval: float = Field(default=30.0, alias="WORKER_HEARTBEAT_INTERVAL")
+    worker_poll_interval: float = Field(default=1.0, alias="WORKER_POLL_INTERVAL")
+    
+    # 도메인 레지스트리 설정 파일 (None이면 backend/core/domains.json)
+    kb_domains_config: Optional[str] = Field(default=None, alias="KB_DOMAINS_CONFIG")
+    
     # CORS
     cors_origins: list[str] = Field(
         default=["http://localhost:3000", "http://127.0.0.1:3000"],
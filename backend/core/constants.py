@@ -1,23 +1,15 @@
 """Constants - Single Source of Truth for domain names"""
 
-# 도메인 정의 (DB/CSV 표준: 슬래시 포함)
-DOMAINS = [
-    "경제/경영",
-    "과학/기술",
-    "역사/사회",
-    "인문/자기계발"
-]
+from backend.core.domain_registry import domain_registry
+
+# 도메인 정의 (DB/CSV 표준: 슬래시 포함, 설정 파일 기반 레지스트리에서 로드)
+DOMAINS = domain_registry.db_domains
 
 # 도메인 매핑 (KB 파일명용: 슬래시 없음)
-DOMAIN_TO_KB = {
-    "경제/경영": "경제경영",
-    "과학/기술": "과학기술",
-    "역사/사회": "역사사회",
-    "인문/자기계발": "인문자기계발"
-}
+DOMAIN_TO_KB = domain_registry.db_to_kb
 
 # 역매핑 (KB → DB)
-KB_TO_DOMAIN = {v: k for k, v in DOMAIN_TO_KB.items()}
+KB_TO_DOMAIN = domain_registry.kb_to_db
 
 # LangGraph 노드 이름
 LANGGRAPH_NODES = [
@@ -0,0 +1,113 @@
+"""Domain Registry - 설정 파일 기반 도메인 레지스트리
+
+KB 파일 탐색, Reviewer 병렬 실행(Send) 폭, 도메인별 검색 인덱스가 모두
+이 레지스트리를 기준으로 동작하므로, 도메인 추가/제외는 코드 수정 없이
+설정 파일(JSON)만 바꾸면 된다.
+
+설정 파일 위치: 환경변수 KB_DOMAINS_CONFIG (없으면 backend/core/domains.json)
+
+형식:
+    {
+      "kb_file_pattern": "지식베이스생성_{kb_name}_구글스튜디오.md",
+      "domains": [
+        {"name": "경제/경영", "kb_name": "경제경영"},
+        {"name": "과학/기술", "kb_name": "과학기술", "kb_file": "custom.md", "enabled": false}
+      ]
+    }
+"""
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent / "domains.json"
+DEFAULT_KB_FILE_PATTERN = "지식베이스생성_{kb_name}_구글스튜디오.md"
+
+
+@dataclass(frozen=True)
+class DomainConfig:
+    """단일 도메인 설정"""
+    name: str       # DB/CSV 표준 이름 (슬래시 포함, 예: 경제/경영)
+    kb_name: str    # KB 파일명/anchor_id용 이름 (슬래시 없음, 예: 경제경영)
+    kb_file: str    # KB 파일명 (kb_dir 기준 상대 경로)
+
+
+class DomainRegistry:
+    """활성 도메인 목록 (설정 순서 유지, 불변)"""
+
+    def __init__(self, domains: List[DomainConfig]):
+        if not domains:
+            raise ValueError("Domain registry requires at least one enabled domain")
+        kb_names = [d.kb_name for d in domains]
+        if len(set(kb_names)) != len(kb_names):
+            raise ValueError(f"Duplicate kb_name in domain registry: {kb_names}")
+
+        self.domains: Tuple[DomainConfig, ...] = tuple(domains)
+        self._by_kb_name: Dict[str, DomainConfig] = {d.kb_name: d for d in domains}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "DomainRegistry":
+        """설정 딕셔너리 → 레지스트리 (enabled=false 도메인 제외)"""
+        pattern = data.get("kb_file_pattern", DEFAULT_KB_FILE_PATTERN)
+        domains = []
+        for entry in data.get("domains", []):
+            if not entry.get("enabled", True):
+                continue
+            kb_name = entry.get("kb_name") or entry["name"].replace("/", "")
+            domains.append(DomainConfig(
+                name=entry["name"],
+                kb_name=kb_name,
+                kb_file=entry.get("kb_file") or pattern.format(kb_name=kb_name),
+            ))
+        return cls(domains)
+
+    @property
+    def kb_domains(self) -> List[str]:
+        """KB 도메인 이름 목록 (슬래시 없음)"""
+        return [d.kb_name for d in self.domains]
+
+    @property
+    def db_domains(self) -> List[str]:
+        """DB/CSV 표준 도메인 이름 목록 (슬래시 포함)"""
+        return [d.name for d in self.domains]
+
+    @property
+    def db_to_kb(self) -> Dict[str, str]:
+        return {d.name: d.kb_name for d in self.domains}
+
+    @property
+    def kb_to_db(self) -> Dict[str, str]:
+        return {d.kb_name: d.name for d in self.domains}
+
+    def get(self, kb_name: str) -> Optional[DomainConfig]:
+        return self._by_kb_name.get(kb_name)
+
+    def kb_file(self, kb_name: str) -> str:
+        """KB 도메인 → KB 파일명 (미등록 도메인은 기본 패턴)"""
+        domain = self._by_kb_name.get(kb_name)
+        return domain.kb_file if domain else DEFAULT_KB_FILE_PATTERN.format(kb_name=kb_name)
+
+    def describe(self) -> str:
+        """프롬프트용 도메인 목록 (예: 경제경영, 과학기술)"""
+        return ", ".join(self.kb_domains)
+
+    def __len__(self) -> int:
+        return len(self.domains)
+
+
+def load_domain_registry(path: Optional[Union[str, Path]] = None) -> DomainRegistry:
+    """
+    설정 파일에서 도메인 레지스트리 로드
+
+    Args:
+        path: 설정 파일 경로 (None이면 KB_DOMAINS_CONFIG 환경변수 → 기본 domains.json)
+    """
+    if path is None:
+        path = os.environ.get("KB_DOMAINS_CONFIG") or DEFAULT_CONFIG_PATH
+    with open(path, "r", encoding="utf-8") as f:
+        return DomainRegistry.from_dict(json.load(f))
+
+
+# 전역 레지스트리 (프로세스 시작 시 1회 로드)
+domain_registry = load_domain_registry()
@@ -28,6 +28,11 @@ class ModelsConfig:
     
     # GPT-5 시리즈는 temperature=1.0만 지원
     GPT5_TEMP = 1.0
+    
+    # 응답 캐시 (정확 일치) 사용 노드
+    # temperature > 0 노드는 샘플링 결과가 고정되므로 RESPONSE_CACHE_ALLOW_SAMPLING에도 있어야 사용
+    RESPONSE_CACHE_NODES = ("anchor_mapper", "reviewer", "integrator", "producer")
+    RESPONSE_CACHE_ALLOW_SAMPLING = ()
 
     @classmethod
     def get_model(cls, node_name: str) -> str:
@@ -61,6 +66,14 @@ class ModelsConfig:
         
         return temp
 
+    @classmethod
+    def use_response_cache(cls, node_name: str) -> bool:
+        """노드 응답 캐시 사용 여부 (opt-in + temperature 0, 또는 샘플링 캐시 명시 허용)"""
+        node = node_name.lower()
+        if node not in cls.RESPONSE_CACHE_NODES:
+            return False
+        return cls.get_temperature(node) == 0.0 or node in cls.RESPONSE_CACHE_ALLOW_SAMPLING
+
 
 # Global instance
 models_config = ModelsConfig()
@@ -0,0 +1,563 @@
+"""Durable Checkpointer - SQLite 파일 기반 LangGraph 체크포인트 저장소
+
+MemorySaver는 프로세스 메모리에만 상태를 보관하므로 재시작하면 run의 체크포인트가
+사라지고, API/워커 프로세스 간에도 공유되지 않는다. SQLiteCheckpointSaver는
+thread_id(=run_id)별 체크포인트와 중간 쓰기(pending writes)를 파일에 저장하여
+완료된 run을 특정 노드부터 재실행(포크)할 수 있게 한다.
+
+- 체크포인트: 채널 값을 포함한 전체 상태를 serde(JsonPlus)로 직렬화하여 1행
+- 쓰기: (checkpoint, task, idx)별 1행 (특수 채널은 덮어쓰기, 일반 쓰기는 최초 1회)
+- 비동기 메서드는 동기 구현을 스레드에서 실행 (sqlite3 연결은 스레드별)
+
+보존 정책 (저장소 크기/프로세스 메모리 상한):
+  - 압축(prune_thread): 완료된 run은 최신 체크포인트 + 재실행 포크 지점만 남김
+  - 만료(evict_threads): 마지막 체크포인트가 보존 기간보다 오래된 thread, 최대 thread 수 초과분 삭제
+  - memory 백엔드(BoundedMemorySaver)는 최대 thread 수를 넘으면 가장 오래된 thread부터 삭제
+"""
+import asyncio
+import logging
+import random
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_BACKENDS = ("memory", "sqlite", "postgres")
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """SQLite 체크포인트 저장소 (단일 노드, 다중 프로세스 공유)"""
+
+    def __init__(self, path: Union[str, Path], *, serde: Any = None):
+        super().__init__(serde=serde)
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().executescript(
+            """
+            CREATE TABLE IF NOT EXISTS checkpoints (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                parent_checkpoint_id TEXT,
+                type TEXT NOT NULL,
+                checkpoint BLOB NOT NULL,
+                metadata_type TEXT NOT NULL,
+                metadata BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+            );
+            CREATE TABLE IF NOT EXISTS writes (
+                thread_id TEXT NOT NULL,
+                checkpoint_ns TEXT NOT NULL DEFAULT '',
+                checkpoint_id TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                idx INTEGER NOT NULL,
+                channel TEXT NOT NULL,
+                type TEXT NOT NULL,
+                value BLOB NOT NULL,
+                task_path TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+            );
+            CREATE INDEX IF NOT EXISTS checkpoints_created_at ON checkpoints (created_at);
+            """
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            # 새 파일에만 적용 (evict_threads 후 삭제된 페이지 반환), WAL 전환보다 먼저
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # ============================================
+    # 조회
+    # ============================================
+
+    def _to_tuple(self, conn: sqlite3.Connection, row: sqlite3.Row) -> CheckpointTuple:
+        thread_id, checkpoint_ns, checkpoint_id = row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"]
+        writes = conn.execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id)
+        ).fetchall()
+        parent_checkpoint_id = row["parent_checkpoint_id"]
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint=self.serde.loads_typed((row["type"], row["checkpoint"])),
+            metadata=self.serde.loads_typed((row["metadata_type"], row["metadata"])),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+            pending_writes=[
+                (write["task_id"], write["channel"], self.serde.loads_typed((write["type"], write["value"])))
+                for write in writes
+            ],
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """체크포인트 조회 (checkpoint_id가 없으면 thread의 최신 체크포인트)"""
+        conn = self._connect()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        if checkpoint_id := get_checkpoint_id(config):
+            row = conn.execute(
+                "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                (thread_id, checkpoint_ns, checkpoint_id)
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT * FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                "ORDER BY checkpoint_id DESC LIMIT 1",
+                (thread_id, checkpoint_ns)
+            ).fetchone()
+        return self._to_tuple(conn, row) if row else None
+
+    def list(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[CheckpointTuple]:
+        """체크포인트 목록 (최신순, 메타데이터 필터는 역직렬화 후 비교)"""
+        conn = self._connect()
+        clauses, params = [], []
+        if config:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_checkpoint_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_checkpoint_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = conn.execute(
+            f"SELECT * FROM checkpoints {where} ORDER BY thread_id, checkpoint_ns, checkpoint_id DESC",
+            params
+        ).fetchall()
+
+        for row in rows:
+            if limit is not None and limit <= 0:
+                break
+            checkpoint_tuple = self._to_tuple(conn, row)
+            if filter and not all(
+                checkpoint_tuple.metadata.get(key) == value for key, value in filter.items()
+            ):
+                continue
+            if limit is not None:
+                limit -= 1
+            yield checkpoint_tuple
+
+    # ============================================
+    # 저장
+    # ============================================
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트 저장 (채널 값 포함 전체 상태)"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(checkpoint)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+        self._connect().execute(
+            "INSERT OR REPLACE INTO checkpoints "
+            "(thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, type, checkpoint, "
+            "metadata_type, metadata, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                thread_id,
+                checkpoint_ns,
+                checkpoint["id"],
+                config["configurable"].get("checkpoint_id"),
+                checkpoint_type,
+                checkpoint_blob,
+                metadata_type,
+                metadata_blob,
+                time.time(),
+            )
+        )
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """중간 쓰기 저장 (특수 채널은 덮어쓰기, 일반 쓰기는 이미 있으면 유지)"""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+        rows = []
+        for idx, (channel, value) in enumerate(writes):
+            value_type, value_blob = self.serde.dumps_typed(value)
+            rows.append((
+                thread_id, checkpoint_ns, checkpoint_id, task_id,
+                WRITES_IDX_MAP.get(channel, idx), channel, value_type, value_blob, task_path
+            ))
+        columns = "(thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, type, value, task_path)"
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO writes {columns} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [row for row in rows if row[4] >= 0]
+            )
+            conn.executemany(
+                f"INSERT OR REPLACE INTO writes {columns} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [row for row in rows if row[4] < 0]
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def delete_thread(self, thread_id: str) -> None:
+        """thread(run)의 체크포인트/쓰기 전체 삭제"""
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DELETE FROM checkpoints WHERE thread_id = ?", (thread_id,))
+            conn.execute("DELETE FROM writes WHERE thread_id = ?", (thread_id,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # ============================================
+    # 보존 정책 (압축/만료)
+    # ============================================
+
+    def prune_thread(self, thread_id: str, keep: Iterable[str]) -> int:
+        """
+        thread의 체크포인트 중 keep(checkpoint_id)만 남기고 삭제 (중간 쓰기 포함)
+        
+        Returns:
+            삭제된 체크포인트 수
+        """
+        keep = list(keep)
+        placeholders = ", ".join("?" for _ in keep)
+        condition = f"thread_id = ? AND checkpoint_id NOT IN ({placeholders})"
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            removed = conn.execute(f"DELETE FROM checkpoints WHERE {condition}", (thread_id, *keep)).rowcount
+            conn.execute(f"DELETE FROM writes WHERE {condition}", (thread_id, *keep))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+
+    def evict_threads(self, older_than: Optional[float] = None, max_threads: Optional[int] = None) -> List[str]:
+        """
+        오래된 thread 삭제
+        
+        Args:
+            older_than: 마지막 체크포인트 이후 경과 시간(초)이 이보다 크면 삭제 (None이면 미적용)
+            max_threads: 최신 thread를 이 수만큼만 유지 (None이면 미적용)
+        
+        Returns:
+            삭제된 thread_id 목록
+        """
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT thread_id, MAX(created_at) AS last_at FROM checkpoints "
+            "GROUP BY thread_id ORDER BY last_at DESC"
+        ).fetchall()
+        cutoff = time.time() - older_than if older_than is not None else None
+        evicted = [
+            row["thread_id"] for rank, row in enumerate(rows)
+            if (cutoff is not None and row["last_at"] < cutoff)
+            or (max_threads is not None and rank >= max_threads)
+        ]
+        for thread_id in evicted:
+            self.delete_thread(thread_id)
+        if evicted:
+            conn.execute("PRAGMA incremental_vacuum")
+        return evicted
+
+    def get_next_version(self, current: Optional[str], channel: None) -> str:
+        """채널 버전 (MemorySaver와 같은 "정수.난수" 문자열 형식)"""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ============================================
+    # 비동기 (스레드에서 동기 구현 실행)
+    # ============================================
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: Optional[RunnableConfig],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[RunnableConfig] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items: List[CheckpointTuple] = await asyncio.to_thread(
+            lambda: list(self.list(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aprune_thread(self, thread_id: str, keep: Iterable[str]) -> int:
+        return await asyncio.to_thread(self.prune_thread, thread_id, list(keep))
+
+    async def aevict_threads(self, older_than: Optional[float] = None, max_threads: Optional[int] = None) -> List[str]:
+        return await asyncio.to_thread(self.evict_threads, older_than, max_threads)
+
+
+class BoundedMemorySaver(MemorySaver):
+    """
+    최대 thread 수가 제한된 MemorySaver (프로세스 내, 초과 시 가장 오래된 thread 삭제)
+    
+    MemorySaver는 완료된 run의 전체 상태 이력을 프로세스가 끝날 때까지 보관하므로
+    API 프로세스 메모리가 run 수에 비례해 계속 늘어난다.
+    """
+
+    def __init__(self, max_threads: int = 200, *, serde: Any = None):
+        super().__init__(serde=serde)
+        self.max_threads = max_threads
+        self._touched: "OrderedDict[str, float]" = OrderedDict()  # thread_id → 마지막 저장 시각
+        self._lock = threading.RLock()
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        with self._lock:
+            saved = super().put(config, checkpoint, metadata, new_versions)
+            thread_id = config["configurable"]["thread_id"]
+            self._touched[thread_id] = time.time()
+            self._touched.move_to_end(thread_id)
+            if self.max_threads and len(self._touched) > self.max_threads:
+                self.evict_threads(max_threads=self.max_threads)
+            return saved
+
+    def delete_thread(self, thread_id: str) -> None:
+        with self._lock:
+            super().delete_thread(thread_id)
+            self._touched.pop(thread_id, None)
+
+    def prune_thread(self, thread_id: str, keep: Iterable[str]) -> int:
+        """keep(checkpoint_id)만 남기고 삭제 (남은 체크포인트가 참조하지 않는 채널 값도 삭제)"""
+        keep = set(keep)
+        removed = 0
+        with self._lock:
+            referenced = set()
+            for checkpoint_ns, checkpoints in self.storage.get(thread_id, {}).items():
+                for checkpoint_id in list(checkpoints):
+                    if checkpoint_id not in keep:
+                        del checkpoints[checkpoint_id]
+                        self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+                        removed += 1
+                        continue
+                    checkpoint = self.serde.loads_typed(checkpoints[checkpoint_id][0])
+                    referenced.update(
+                        (thread_id, checkpoint_ns, channel, version)
+                        for channel, version in checkpoint["channel_versions"].items()
+                    )
+            for key in [key for key in self.blobs if key[0] == thread_id and key not in referenced]:
+                del self.blobs[key]
+        return removed
+
+    def evict_threads(self, older_than: Optional[float] = None, max_threads: Optional[int] = None) -> List[str]:
+        """오래된 thread 삭제 (SQLiteCheckpointSaver.evict_threads와 같은 기준)"""
+        with self._lock:
+            threads = list(reversed(self._touched.items()))  # 최신순
+            cutoff = time.time() - older_than if older_than is not None else None
+            evicted = [
+                thread_id for rank, (thread_id, last_at) in enumerate(threads)
+                if (cutoff is not None and last_at < cutoff)
+                or (max_threads is not None and rank >= max_threads)
+            ]
+            for thread_id in evicted:
+                self.delete_thread(thread_id)
+        return evicted
+
+    async def aprune_thread(self, thread_id: str, keep: Iterable[str]) -> int:
+        return self.prune_thread(thread_id, keep)
+
+    async def aevict_threads(self, older_than: Optional[float] = None, max_threads: Optional[int] = None) -> List[str]:
+        return self.evict_threads(older_than, max_threads)
+
+
+# ============================================
+# 보존 정책 실행 (run 완료 후)
+# ============================================
+
+async def compact_thread(graph, thread_id: str, keep_next: Iterable[str] = ()) -> int:
+    """
+    완료된 thread 압축: 최신 체크포인트 + 다음 노드가 keep_next에 속하는 체크포인트(재실행 포크 지점)만 유지
+    
+    Args:
+        graph: 컴파일된 그래프 (체크포인트별 다음 노드 계산)
+        thread_id: 압축할 thread (run_id)
+        keep_next: 재실행 시작 노드 (예: RERUN_NODES)
+    
+    Returns:
+        삭제된 체크포인트 수 (압축을 지원하지 않는 체크포인터면 0)
+    """
+    checkpointer = graph.checkpointer
+    if not hasattr(checkpointer, "aprune_thread"):
+        return 0
+    keep_next = set(keep_next)
+    keep: List[str] = []
+    async for snapshot in graph.aget_state_history({"configurable": {"thread_id": thread_id}}):
+        if not keep or keep_next.intersection(snapshot.next):
+            keep.append(snapshot.config["configurable"]["checkpoint_id"])
+    if not keep:
+        return 0
+    return await checkpointer.aprune_thread(thread_id, keep)
+
+
+async def evict_threads(
+    checkpointer: BaseCheckpointSaver,
+    retention_seconds: Optional[float] = None,
+    max_threads: Optional[int] = None
+) -> List[str]:
+    """보존 기간/최대 thread 수를 넘은 thread 삭제 (지원하지 않는 체크포인터면 빈 목록)"""
+    if not hasattr(checkpointer, "aevict_threads"):
+        return []
+    evicted = await checkpointer.aevict_threads(retention_seconds, max_threads)
+    if evicted:
+        logger.info(f"[CHECKPOINT] Evicted {len(evicted)} thread(s)")
+    return evicted
+
+
+async def reset_thread(checkpointer: Optional[BaseCheckpointSaver], thread_id: str) -> bool:
+    """
+    이전 시도의 체크포인트 삭제 (같은 thread로 처음부터 다시 실행할 때)
+    
+    reviews/messages 등 operator.add 필드는 같은 thread에 새 입력을 넣으면
+    이전 시도의 값 뒤에 이어 붙으므로, 재시도 전에 thread를 비운다.
+    
+    Returns:
+        삭제 여부 (체크포인트가 없으면 False)
+    """
+    if checkpointer is None:
+        return False
+    if await checkpointer.aget_tuple({"configurable": {"thread_id": thread_id}}) is None:
+        return False
+    await checkpointer.adelete_thread(thread_id)
+    return True
+
+
+def create_checkpointer(
+    backend: str,
+    path: Optional[Union[str, Path]] = None,
+    max_threads: int = 200,
+    postgres_url: Optional[str] = None
+) -> BaseCheckpointSaver:
+    """
+    설정 → 체크포인터 생성
+
+    Args:
+        backend: "memory" (프로세스 내, 재시작 시 소멸) | "sqlite" (파일, 재실행 API 지원)
+                 | "postgres" (다중 노드 공유, langgraph-checkpoint-postgres 필요)
+        path: sqlite 파일 경로
+        max_threads: memory 백엔드 최대 thread 수
+        postgres_url: postgres 연결 문자열
+    """
+    if backend == "memory":
+        return BoundedMemorySaver(max_threads=max_threads)
+    if backend == "sqlite":
+        return SQLiteCheckpointSaver(path or ".cache/checkpoints.db")
+    if backend == "postgres":
+        if not postgres_url:
+            raise ValueError("CHECKPOINT_POSTGRES_URL is required for the postgres checkpointer")
+        try:
+            from backend.langgraph_pipeline.checkpointer_postgres import PostgresCheckpointSaver
+        except ImportError as e:
+            raise ImportError(
+                "postgres checkpointer requires langgraph-checkpoint-postgres and psycopg-pool "
+                "(pip install langgraph-checkpoint-postgres psycopg[binary] psycopg-pool)"
+            ) from e
+        return PostgresCheckpointSaver.from_url(postgres_url)
+    raise ValueError(f"Unknown checkpointer backend: {backend} (expected one of {CHECKPOINT_BACKENDS})")
@@ -0,0 +1,93 @@
+"""Postgres Checkpointer - 다중 노드 공유 LangGraph 체크포인트 저장소 (운영)
+
+langgraph-checkpoint-postgres의 AsyncPostgresSaver에 보존 정책을 추가한다.
+SQLiteCheckpointSaver와 같은 aprune_thread/aevict_threads를 제공하므로
+run 완료 후 정리(compact_thread, evict_threads)를 백엔드 구분 없이 사용한다.
+
+- 테이블(checkpoints, checkpoint_blobs, checkpoint_writes)은 aopen()의 setup()이 생성
+- 비동기 전용 (API/워커 모두 이벤트 루프에서 그래프 실행), 이벤트 루프 안에서 생성해야 함
+- Supabase 트랜잭션 풀러(pgbouncer) 호환을 위해 prepared statement 비활성화
+
+필요 패키지: langgraph-checkpoint-postgres, psycopg[binary], psycopg-pool
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+
+class PostgresCheckpointSaver(AsyncPostgresSaver):
+    """AsyncPostgresSaver + 압축/만료 (연결 풀은 aopen/aclose로 관리)"""
+
+    @classmethod
+    def from_url(cls, url: str, max_size: int = 10) -> "PostgresCheckpointSaver":
+        """연결 문자열 → 저장소 (풀은 aopen에서 열림)"""
+        pool = AsyncConnectionPool(
+            url,
+            open=False,
+            max_size=max_size,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row}
+        )
+        return cls(pool)
+
+    async def aopen(self):
+        """연결 풀 열기 + 테이블 생성/마이그레이션"""
+        await self.conn.open()
+        await self.setup()
+
+    async def aclose(self):
+        await self.conn.close()
+
+    async def aprune_thread(self, thread_id: str, keep: Iterable[str]) -> int:
+        """
+        thread의 체크포인트 중 keep(checkpoint_id)만 남기고 삭제
+
+        남은 체크포인트의 channel_versions가 참조하지 않는 채널 값(blob)도 함께 삭제한다.
+
+        Returns:
+            삭제된 체크포인트 수
+        """
+        keep = list(keep)
+        async with self.conn.connection() as conn, conn.transaction():
+            cursor = await conn.execute(
+                "DELETE FROM checkpoints WHERE thread_id = %s AND NOT (checkpoint_id = ANY(%s))",
+                (thread_id, keep)
+            )
+            removed = cursor.rowcount
+            await conn.execute(
+                "DELETE FROM checkpoint_writes WHERE thread_id = %s AND NOT (checkpoint_id = ANY(%s))",
+                (thread_id, keep)
+            )
+            await conn.execute(
+                "DELETE FROM checkpoint_blobs b WHERE b.thread_id = %s AND NOT EXISTS ("
+                "SELECT 1 FROM checkpoints c WHERE c.thread_id = b.thread_id "
+                "AND c.checkpoint_ns = b.checkpoint_ns "
+                "AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version)",
+                (thread_id,)
+            )
+        return removed
+
+    async def aevict_threads(self, older_than: Optional[float] = None, max_threads: Optional[int] = None) -> List[str]:
+        """
+        오래된 thread 삭제 (SQLiteCheckpointSaver.evict_threads와 같은 기준)
+
+        Returns:
+            삭제된 thread_id 목록
+        """
+        async with self.conn.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT thread_id, MAX((checkpoint ->> 'ts')::timestamptz) AS last_at FROM checkpoints "
+                "GROUP BY thread_id ORDER BY last_at DESC"
+            )
+            rows = await cursor.fetchall()
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=older_than) if older_than is not None else None
+        evicted = [
+            row["thread_id"] for rank, row in enumerate(rows)
+            if (cutoff is not None and row["last_at"] < cutoff)
+            or (max_threads is not None and rank >= max_threads)
+        ]
+        for thread_id in evicted:
+            await self.adelete_thread(thread_id)
+        return evicted
@@ -2,22 +2,17 @@
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.constants import Send
-from backend.langgraph_pipeline.state import OnePagerState
+from backend.langgraph_pipeline.state import OnePagerState, create_reviewer_input
 from backend.langgraph_pipeline.nodes.anchor_mapper import anchor_mapper_node
-from backend.langgraph_pipeline.nodes.reviewers import (
-    reviewer_economics,
-    reviewer_science,
-    reviewer_history,
-    reviewer_humanities,
-    review_domain_node
-)
+from backend.langgraph_pipeline.nodes.reviewers import review_domain_node
 from backend.langgraph_pipeline.nodes.integrator import integrator_node
 from backend.langgraph_pipeline.nodes.producer import producer_node
 from backend.langgraph_pipeline.nodes.validator import validator_node
 from backend.langgraph_pipeline.utils import assemble_final_1p
 from langchain_core.messages import HumanMessage
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +51,8 @@ def create_workflow() -> StateGraph:
          → Integrator → Producer → Validator → END
     
     Validator 실패 시 → AnchorMapper로 재시도
+    
+    LLM 노드는 비동기(ainvoke)이므로 graph.astream / graph.ainvoke로 실행한다.
     """
     # StateGraph 생성
     workflow = StateGraph(OnePagerState)
@@ -71,10 +68,10 @@ def create_workflow() -> StateGraph:
     # 엣지 연결
     workflow.add_edge(START, "anchor_mapper")
     
-    # AnchorMapper → 4개 Reviewer (병렬)
+    # AnchorMapper → 도메인별 Reviewer (병렬, 도메인 수는 레지스트리 설정)
     workflow.add_conditional_edges(
         "anchor_mapper",
-        initiate_reviews,  # Send() API로 4개 Reviewer 병렬 실행
+        initiate_reviews,  # Send() API로 도메인별 Reviewer 병렬 실행
         ["review_domain"]
     )
     
@@ -97,21 +94,22 @@ def create_workflow() -> StateGraph:
     return workflow
 
 
-def compile_graph(workflow: StateGraph, use_checkpointer: bool = True):
+def compile_graph(workflow: StateGraph, use_checkpointer: bool = True, checkpointer=None):
     """
     그래프 컴파일
     
     Args:
         workflow: StateGraph 인스턴스
-        use_checkpointer: 체크포인터 사용 여부 (재시도 기능)
+        use_checkpointer: 체크포인터 사용 여부 (재시도/재실행 기능)
+        checkpointer: 체크포인트 저장소 (None이면 MemorySaver)
     
     Returns:
         컴파일된 그래프
     """
     if use_checkpointer:
-        memory = MemorySaver()
-        graph = workflow.compile(checkpointer=memory)
-        logger.info("[OK] Graph compiled with checkpointer (retry enabled)")
+        checkpointer = checkpointer or MemorySaver()
+        graph = workflow.compile(checkpointer=checkpointer)
+        logger.info(f"[OK] Graph compiled with checkpointer: {type(checkpointer).__name__}")
     else:
         graph = workflow.compile()
         logger.info("[OK] Graph compiled without checkpointer")
@@ -119,24 +117,38 @@ def compile_graph(workflow: StateGraph, use_checkpointer: bool = True):
     return graph
 
 
+# 재실행 시작 가능 노드 → 포크한 상태를 기록할 선행 노드 (as_node)
+RERUN_NODES = {
+    "integrator": "review_domain",
+    "producer": "integrator",
+}
+
+
+def resolve_rerun_node(from_node: str, source_format: Optional[str], format: Optional[str] = None) -> str:
+    """
+    재실행 시작 노드 결정 (format을 바꾸면 integrator부터)
+    
+    Integrator가 format별 프롬프트로 integration_result/format_reasoning을 만들므로
+    producer부터 재실행하면 이전 format의 통합 결과가 그대로 남는다.
+    """
+    if format and format != source_format:
+        return "integrator"
+    return from_node
+
+
 def initiate_reviews(state: OnePagerState):
     """
-    4개 도메인 Reviewer를 병렬로 시작 (Send() API)
+    도메인 레지스트리의 도메인 수만큼 Reviewer를 병렬로 시작 (Send() API)
     
     Returns:
         Send() 명령 리스트
     """
     from backend.services.kb_service import kb_service
-    domains = kb_service.KB_DOMAINS  # ["경제경영", "과학기술", "역사사회", "인문자기계발"]
+    domains = kb_service.KB_DOMAINS  # 설정 파일(domains.json) 기반 레지스트리 순서
     
+    # 전체 State 대신 도메인별 최소 입력만 전달 (복사/체크포인트 크기 절감)
     return [
-        Send(
-            "review_domain",
-            {
-                **state,
-                "current_domain": domain  # 각 Reviewer가 자신의 도메인 알 수 있게
-            }
-        )
+        Send("review_domain", create_reviewer_input(state, domain))
         for domain in domains
     ]
 
@@ -165,25 +177,60 @@ def should_retry(state: OnePagerState) -> bool:
 # Global workflow and graph instances (lazy initialization)
 _workflow = None
 _graph = None
+_graph_lock = threading.Lock()
+_checkpointer = None  # None이면 MemorySaver (프로세스 내)
+
+
+def configure_checkpointer(checkpointer):
+    """
+    체크포인터 설정 (앱/워커 시작 시, 다음 get_graph 호출에서 재컴파일)
+    
+    SQLite 등 영속 체크포인터를 쓰면 재시작 후에도 완료된 run을 특정 노드부터 재실행할 수 있다.
+    """
+    global _checkpointer, _graph
+    with _graph_lock:
+        _checkpointer = checkpointer
+        _graph = None
+
+
+def get_checkpointer():
+    """설정된 체크포인터 (None이면 미설정 - 그래프 컴파일 시 MemorySaver)"""
+    return _checkpointer
+
+
+async def open_checkpointer():
+    """체크포인터 연결 준비 (postgres: 연결 풀 열기 + 테이블 생성, 그 외 백엔드는 없음)"""
+    if hasattr(_checkpointer, "aopen"):
+        await _checkpointer.aopen()
+
+
+async def close_checkpointer():
+    if hasattr(_checkpointer, "aclose"):
+        await _checkpointer.aclose()
 
 
 def get_graph():
     """
-    Graph 인스턴스 가져오기 (lazy initialization)
+    Graph 인스턴스 가져오기 (lazy initialization, 스레드 안전)
     
     모듈 캐싱 문제를 방지하고 최신 노드 코드를 반영
+    모듈 import 시에는 컴파일하지 않음 (최초 사용 시 1회)
     """
     global _workflow, _graph
     
     if _graph is None:
-        logger.info("[INFO] Initializing graph (first time)...")
-        _workflow = create_workflow()
-        _graph = compile_graph(_workflow, use_checkpointer=True)
-        logger.info("[OK] Graph initialized")
+        with _graph_lock:
+            if _graph is None:
+                logger.info("[INFO] Initializing graph (first time)...")
+                _workflow = create_workflow()
+                _graph = compile_graph(_workflow, use_checkpointer=True, checkpointer=_checkpointer)
+                logger.info("[OK] Graph initialized")
     
     return _graph
 
 
-# Backward compatibility
-graph = get_graph()
-
+def __getattr__(name: str):
+    """Backward compatibility: `from ...graph import graph` → 지연 컴파일된 graph"""
+    if name == "graph":
+        return get_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
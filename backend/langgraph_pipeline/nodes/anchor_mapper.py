@@ -1,26 +1,23 @@
-"""AnchorMapper Node - 도서 요약을 4개 도메인별 앵커에 매핑"""
+"""AnchorMapper Node - 도서 요약을 도메인별 앵커에 매핑"""
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from backend.langgraph_pipeline.state import OnePagerState
 from backend.services.kb_service import kb_service
 from backend.core.models_config import models_config
+from backend.services.llm_registry import llm_registry
 from typing import Dict, Any
 import logging
 
 logger = logging.getLogger(__name__)
 
-# KB 도메인 리스트 (KB 검색용 - 슬래시 없음)
-KB_DOMAINS = kb_service.KB_DOMAINS
 
-
-def anchor_mapper_node(state: OnePagerState) -> Dict[str, Any]:
+async def anchor_mapper_node(state: OnePagerState) -> Dict[str, Any]:
     """
     AnchorMapper 노드
 
     역할:
     1. 도서 요약을 분석
-    2. 4개 도메인별로 KB 검색
+    2. 도메인 레지스트리의 도메인별로 KB 검색
     3. 각 도메인당 가장 관련 있는 앵커 1개 선택
     4. 합치/상충/누락/경계 분석
 
@@ -60,10 +57,28 @@ def anchor_mapper_node(state: OnePagerState) -> Dict[str, Any]:
     # 각 도메인별 앵커 찾기
     anchors = {}
     anchor_details = []
-
-    for domain in KB_DOMAINS:
-        # KB 검색 (단일 책 요약 사용)
-        results = kb_service.search(query=book_summary, domain=domain, top_k=3)
+    kb_hits = {}
+
+    # KB 도메인 리스트 (KB 검색용 - 슬래시 없음, 레지스트리 설정 순서)
+    kb_domains = kb_service.KB_DOMAINS
+
+    # KB 일괄 검색 (단일 책 요약 × 전체 도메인, 벡터화/유사도 계산 1회, 공유 스레드 풀에서 실행)
+    domain_results = (await kb_service.asearch_many([book_summary], domains=kb_domains, top_k=3))[0]
+
+    for domain in kb_domains:
+        results = domain_results.get(domain, [])
+
+        # 검색 결과 보존 (Reviewer가 재검색 없이 동일 후보군 사용)
+        kb_hits[domain] = [
+            {
+                "anchor_id": result.item.anchor_id,
+                "content": result.item.content,
+                "similarity_score": result.similarity_score,
+                "is_fusion": result.item.is_fusion,
+                "is_integrated_knowledge": result.item.is_integrated_knowledge,
+            }
+            for result in results
+        ]
 
         if results:
             # 가장 유사도 높은 앵커 선택
@@ -89,10 +104,10 @@ def anchor_mapper_node(state: OnePagerState) -> Dict[str, Any]:
             anchors[domain] = f"{domain}_default_001"
 
     # 앵커 분석 (LLM 사용)
-    anchor_analysis = analyze_anchors(anchor_details, book_summary)
+    anchor_analysis = await analyze_anchors(anchor_details, book_summary)
     
-    # 사용 가능한 모든 KB 앵커 리스트 (가짜 앵커 방지용)
-    available_anchors = [item.anchor_id for item in kb_service.all_items]
+    # 사용 가능한 모든 KB 앵커 (가짜 앵커 방지용, 인덱스 로드 시 생성된 불변 튜플 재사용)
+    available_anchors = kb_service.get_anchor_ids()
     logger.info(f"[OK] Available anchors: {len(available_anchors)} items")
 
     logger.info("[DONE] AnchorMapper")
@@ -101,6 +116,7 @@ def anchor_mapper_node(state: OnePagerState) -> Dict[str, Any]:
         "anchors": anchors,
         "anchor_analysis": anchor_analysis,
         "available_anchors": available_anchors,
+        "kb_hits": kb_hits,
         "messages": [
             HumanMessage(
                 content=f"Mapped anchors: {anchors}\nAnalysis: {anchor_analysis}",
@@ -110,7 +126,7 @@ def anchor_mapper_node(state: OnePagerState) -> Dict[str, Any]:
     }
 
 
-def analyze_anchors(anchor_details: list[Dict], book_summary: str) -> str:
+async def analyze_anchors(anchor_details: list[Dict], book_summary: str) -> str:
     """
     앵커 간 관계 분석 (합치/상충/누락/경계)
 
@@ -121,10 +137,7 @@ def analyze_anchors(anchor_details: list[Dict], book_summary: str) -> str:
     Returns:
         분석 결과 (합치/상충/누락/경계)
     """
-    llm = ChatOpenAI(
-        model=models_config.ANCHOR_MAPPER_MODEL, 
-        temperature=models_config.get_temperature("anchor_mapper")
-    )
+    llm = llm_registry.for_node("anchor_mapper")
 
     # 앵커 내용 요약
     anchor_summary = "\n".join(
@@ -134,7 +147,7 @@ def analyze_anchors(anchor_details: list[Dict], book_summary: str) -> str:
         ]
     )
 
-    system_prompt = """당신은 4개 도메인(경제경영, 과학기술, 역사사회, 인문자기계발)의 앵커 간 관계를 분석하는 전문가입니다.
+    system_prompt = f"""당신은 {len(kb_service.KB_DOMAINS)}개 도메인({', '.join(kb_service.KB_DOMAINS)})의 앵커 간 관계를 분석하는 전문가입니다.
 
 다음 4가지를 분석하세요:
 1. **합치**: 어떤 앵커들이 유사한 방향을 가리키는가?
@@ -155,7 +168,7 @@ def analyze_anchors(anchor_details: list[Dict], book_summary: str) -> str:
     messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
 
     try:
-        response = llm.invoke(messages)
+        response = await llm.ainvoke(messages)
         
         # 토큰 사용량 로깅 (로그 파일만)
         usage = response.response_metadata.get('usage', {})
@@ -1,11 +1,12 @@
-"""Integrator Node - 4개 리뷰를 통합"""
-from langchain_openai import ChatOpenAI
+"""Integrator Node - 도메인별 리뷰를 통합"""
 from langchain_core.messages import HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from backend.langgraph_pipeline.state import OnePagerState
 from backend.langgraph_pipeline.utils import format_review_for_integrator
+from backend.core.domain_registry import domain_registry
 from backend.core.models_config import models_config
+from backend.services.llm_registry import llm_registry
 from typing import Dict, Any
 import logging
 
@@ -27,13 +28,13 @@ class IntegrationResult(BaseModel):
     conclusion: str = Field(..., description="최종 결론 1줄")
 
 
-def integrator_node(state: OnePagerState) -> Dict[str, Any]:
+async def integrator_node(state: OnePagerState) -> Dict[str, Any]:
     """
     Integrator 노드
     
     역할:
-    - Synthesis 모드: 4개 리뷰 → 긴장축 2-3개 추출
-    - Simple Merge 모드: 4개 리뷰 병치 + 결론
+    - Synthesis 모드: 도메인별 리뷰 → 긴장축 2-3개 추출
+    - Simple Merge 모드: 도메인별 리뷰 병치 + 결론
     
     Args:
         state: OnePagerState
@@ -61,18 +62,18 @@ def integrator_node(state: OnePagerState) -> Dict[str, Any]:
     logger.info(formatted_reviews[:800])
     
     if mode == "synthesis":
-        result = integrate_synthesis_mode(formatted_reviews, format_type)
+        result = await integrate_synthesis_mode(formatted_reviews, format_type)
     else:  # simple_merge
-        result = integrate_simple_merge_mode(formatted_reviews, format_type)
+        result = await integrate_simple_merge_mode(formatted_reviews, format_type)
     
     logger.info(f"[DONE] Integrator ({mode} mode)")
     
     return result
 
 
-def integrate_synthesis_mode(reviews_text: str, format_type: str) -> Dict[str, Any]:
+async def integrate_synthesis_mode(reviews_text: str, format_type: str) -> Dict[str, Any]:
     """
-    Synthesis 모드: 긴장축 추출 (4개 리뷰 → 2-3개 긴장축)
+    Synthesis 모드: 긴장축 추출 (도메인별 리뷰 → 2-3개 긴장축)
     
     Args:
         reviews_text: 포맷된 리뷰 텍스트
@@ -81,12 +82,7 @@ def integrate_synthesis_mode(reviews_text: str, format_type: str) -> Dict[str, A
     Returns:
         부분 state 업데이트
     """
-    llm = ChatOpenAI(
-        model=models_config.INTEGRATOR_MODEL, 
-        temperature=models_config.get_temperature("integrator")
-    )
-    
-    system_prompt = f"""당신은 4개 도메인(경제경영, 과학기술, 역사사회, 인문자기계발)의 리뷰를 통합하여 **긴장축(Tension Axes)**을 추출하는 전문가입니다.
+    system_prompt = f"""당신은 {len(domain_registry)}개 도메인({domain_registry.describe()})의 리뷰를 통합하여 **긴장축(Tension Axes)**을 추출하는 전문가입니다.
 
 **긴장축 예시** (모범 사례):
 - **의미 기반 자기개선** × **성과 비교 사회** (상충)
@@ -94,7 +90,7 @@ def integrate_synthesis_mode(reviews_text: str, format_type: str) -> Dict[str, A
 - **개인 루틴** × **사회적 노이즈/제약** (경계)
 
 **목표**:
-1. 4개 리뷰에서 **2-3개의 핵심 긴장축** 추출
+1. {len(domain_registry)}개 리뷰에서 **2-3개의 핵심 긴장축** 추출
 2. 각 긴장축은 **명확한 대립 관계** (상충/경계/대립)
 3. **일반적 표현 금지** (예: "효율 vs 윤리", "단기 vs 장기") 
    → 책과 KB의 구체적 내용 반영
@@ -106,17 +102,17 @@ def integrate_synthesis_mode(reviews_text: str, format_type: str) -> Dict[str, A
 
 출력은 JSON 형식으로 제공하세요."""
     
-    user_prompt = f"""4개 도메인 리뷰:
+    user_prompt = f"""{len(domain_registry)}개 도메인 리뷰:
 
 {reviews_text}
 
 위 리뷰를 분석하여 긴장축을 추출하세요."""
     
     try:
-        # Structured output 사용
-        structured_llm = llm.with_structured_output(IntegrationResult)
+        # Structured output 사용 (레지스트리 공유 클라이언트)
+        structured_llm = llm_registry.for_node("integrator", IntegrationResult)
         
-        response = structured_llm.invoke([
+        response = await structured_llm.ainvoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
@@ -170,9 +166,9 @@ def integrate_synthesis_mode(reviews_text: str, format_type: str) -> Dict[str, A
         }
 
 
-def integrate_simple_merge_mode(reviews_text: str, format_type: str) -> Dict[str, Any]:
+async def integrate_simple_merge_mode(reviews_text: str, format_type: str) -> Dict[str, Any]:
     """
-    Simple Merge 모드: 4개 리뷰 병치 + 결론
+    Simple Merge 모드: 도메인별 리뷰 병치 + 결론
     
     Args:
         reviews_text: 포맷된 리뷰 텍스트
@@ -181,28 +177,25 @@ def integrate_simple_merge_mode(reviews_text: str, format_type: str) -> Dict[str
     Returns:
         부분 state 업데이트
     """
-    llm = ChatOpenAI(
-        model=models_config.INTEGRATOR_MODEL, 
-        temperature=models_config.get_temperature("integrator")
-    )
+    llm = llm_registry.for_node("integrator")
     
-    system_prompt = f"""당신은 4개 도메인의 리뷰를 병치하고 간단한 결론을 작성하는 전문가입니다.
+    system_prompt = f"""당신은 {len(domain_registry)}개 도메인의 리뷰를 병치하고 간단한 결론을 작성하는 전문가입니다.
 
 목표:
-1. 4개 리뷰를 그대로 나열 (병치)
+1. {len(domain_registry)}개 리뷰를 그대로 나열 (병치)
 2. 형식({format_type})에 맞는 분기 사유 1줄
 3. 전체를 관통하는 결론 1줄
 
 간결하고 명확하게 작성하세요."""
     
-    user_prompt = f"""4개 도메인 리뷰:
+    user_prompt = f"""{len(domain_registry)}개 도메인 리뷰:
 
 {reviews_text}
 
 위 리뷰를 병치하고 결론을 작성하세요."""
     
     try:
-        response = llm.invoke([
+        response = await llm.ainvoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
@@ -215,7 +208,7 @@ def integrate_simple_merge_mode(reviews_text: str, format_type: str) -> Dict[str
                    f"output={usage.get('completion_tokens', 0)}, "
                    f"total={usage.get('total_tokens', 0)}")
         
-        integration_text = f"""## 4개 도메인 리뷰 (병치)
+        integration_text = f"""## {len(domain_registry)}개 도메인 리뷰 (병치)
 
 {reviews_text}
 
@@ -1,9 +1,9 @@
 """Producer Node - 1-pager 생성"""
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from backend.langgraph_pipeline.state import OnePagerState
 from backend.core.models_config import models_config
+from backend.services.llm_registry import llm_registry
 from typing import Dict, Any, Optional
 import logging
 import re
@@ -11,7 +11,7 @@ import re
 logger = logging.getLogger(__name__)
 
 
-def producer_node(state: OnePagerState) -> Dict[str, Any]:
+async def producer_node(state: OnePagerState) -> Dict[str, Any]:
     """
     Producer 노드
     
@@ -40,7 +40,7 @@ def producer_node(state: OnePagerState) -> Dict[str, Any]:
         logger.warning("[WARN] No available_anchors provided - fake anchor prevention may not work")
     
     # 1p 제안서 생성 (LLM 창작)
-    proposal_md = create_onepager_proposal(
+    proposal_md = await create_onepager_proposal(
         integration_result=integration_result,
         book_summary=book_summary,
         available_anchors=available_anchors
@@ -65,7 +65,7 @@ def producer_node(state: OnePagerState) -> Dict[str, Any]:
     }
 
 
-def create_onepager_proposal(
+async def create_onepager_proposal(
     integration_result: str,
     book_summary: str,
     available_anchors: list[str]
@@ -85,10 +85,7 @@ def create_onepager_proposal(
     Returns:
         1p 제안서 Markdown (제목~CTA)
     """
-    llm = ChatOpenAI(
-        model=models_config.PRODUCER_MODEL, 
-        temperature=models_config.get_temperature("producer")
-    )
+    llm = llm_registry.for_node("producer")
 
     system_prompt = """당신은 전문가 수준의 1p 제안서를 작성하는 전문가입니다.
 
@@ -177,7 +174,7 @@ def create_onepager_proposal(
 6. 위 목록에 없는 가짜 앵커 생성 절대 금지!"""
 
     try:
-        response = llm.invoke(
+        response = await llm.ainvoke(
             [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
         )
         
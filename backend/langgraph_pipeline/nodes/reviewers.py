@@ -1,12 +1,14 @@
-"""Reviewer Nodes - 4개 도메인별 리뷰 에이전트"""
-from langchain_openai import ChatOpenAI
+"""Reviewer Nodes - 도메인별 리뷰 에이전트 (도메인 레지스트리 기반)"""
 from langgraph.prebuilt import create_react_agent
 from langchain_core.messages import SystemMessage, HumanMessage
-from backend.langgraph_pipeline.state import OnePagerState
+from backend.langgraph_pipeline.state import OnePagerState, ReviewerInput, create_reviewer_input
 from backend.tools.kb_search import create_kb_search_tool
 from backend.langgraph_pipeline.utils import agent_node
+from backend.core.domain_registry import domain_registry
 from backend.core.models_config import models_config
 from backend.services.kb_service import kb_service
+from backend.services.llm_registry import llm_registry
+from backend.services.review_memo import review_memo, review_prompt_version
 from pydantic import BaseModel, Field
 from typing import Dict, Any
 import functools
@@ -39,7 +41,7 @@ def create_reviewer_prompt(domain: str) -> str:
     도메인별 Reviewer 프롬프트 생성 (품질 개선 버전)
     
     Args:
-        domain: 도메인 (경제경영/과학기술/역사사회/인문자기계발)
+        domain: KB 도메인 (도메인 레지스트리의 kb_name)
     
     Returns:
         Enhanced system prompt
@@ -71,39 +73,34 @@ def create_reviewer_prompt(domain: str) -> str:
 """
 
 
-def review_domain_node(state: OnePagerState, domain: str = None) -> Dict[str, Any]:
+async def review_domain_node(state: ReviewerInput) -> Dict[str, Any]:
     """
     특정 도메인에 대한 리뷰 수행
     
     Args:
-        state: OnePagerState
-        domain: 도메인 (None이면 state['current_domain'] 사용)
+        state: ReviewerInput (initiate_reviews가 Send()로 전달하는 도메인별 입력)
     
     Returns:
         부분 state 업데이트
     """
-    # domain이 None이면 state에서 가져오기 (Send() API 사용 시)
-    if domain is None:
-        domain = state.get("current_domain", "경제경영")
+    domain = state["domain"]
     
     logger.info(f"[START] Reviewer_{domain}")
     
     # 입력 준비
-    anchor_id = state.get("anchors", {}).get(domain, "")
-    book_ids = state.get("book_ids", [])
+    anchor_id = state.get("anchor_id", "")
+    book_id = state.get("book_id", "")
     
     # 1권만 처리
-    if not book_ids:
+    if not book_id:
         logger.error(f"[{domain}] No book_ids provided")
         # error_message는 반환하지 않음 (병렬 실행 시 충돌 방지)
         return {"messages": [HumanMessage(content=f"[{domain}] Error: No book_ids", name=f"Reviewer_{domain}")]}
     
-    book_id = book_ids[0]
-    
     # 단일 책 요약 직접 사용
-    book_summary = state.get("book_summary", "")
-    book_title = state.get("book_title", f"Book {book_id}")
-    book_topic = state.get("book_topic", "주제 없음")
+    book_summary = state.get("summary", "")
+    book_title = state.get("title", f"Book {book_id}")
+    book_topic = state.get("topic", "주제 없음")
     
     # 디버그 로그
     logger.info(f"[DEBUG] Reviewer_{domain} received:")
@@ -116,19 +113,22 @@ def review_domain_node(state: OnePagerState, domain: str = None) -> Dict[str, An
         logger.error(f"[FAIL] Reviewer_{domain}: No book summary!")
         return {"error_message": f"[{domain}] No book summary provided"}
     
-    # KB 추가 검색 (책 요약 기반)
-    additional_kb = kb_service.search(book_summary, domain=domain, top_k=3)
+    # KB 추가 참조 (AnchorMapper 검색 결과 재사용 → 앵커 선택과 동일한 후보군)
+    additional_kb = state.get("kb_refs")
+    if additional_kb is None:
+        # AnchorMapper 결과가 없는 경우 (단독 실행 등) 직접 검색
+        logger.info(f"[INFO] Reviewer_{domain}: No cached KB hits, searching KB")
+        additional_kb = [
+            {"anchor_id": kb.item.anchor_id, "content": kb.item.content}
+            for kb in await kb_service.asearch(book_summary, domain=domain, top_k=3)
+        ]
     additional_insights = "\n".join([
-        f"- [{kb.item.anchor_id}] {kb.item.content[:100]}..."
+        f"- [{kb['anchor_id']}] {kb['content'][:100]}..."
         for kb in additional_kb
     ])
     
-    # Structured LLM 생성 (GPT-5 시리즈는 temperature=1.0 자동 적용)
-    llm = ChatOpenAI(
-        model=models_config.REVIEWER_MODEL, 
-        temperature=models_config.get_temperature("reviewer")
-    )
-    structured_llm = llm.with_structured_output(DomainReview)
+    # Structured LLM (레지스트리 공유 클라이언트, GPT-5 시리즈는 temperature=1.0 자동 적용)
+    structured_llm = llm_registry.for_node("reviewer", DomainReview)
     
     system_prompt = f"""{create_reviewer_prompt(domain)}
 
@@ -155,9 +155,35 @@ def review_domain_node(state: OnePagerState, domain: str = None) -> Dict[str, An
 위 책을 할당된 앵커 관점에서 평가하여 advantages, problems, conditions를 작성하세요.
 반드시 "이 책의 [구체적 부분]은..." 형식으로 시작하고, 모든 문장에 [anchor_id]를 포함하세요."""
     
+    # 이전 run의 같은 (도서, 도메인, 앵커, 프롬프트 버전) 리뷰 재사용
+    memo_key = review_memo.key(
+        book_id,
+        domain,
+        anchor_id,
+        review_prompt_version(
+            system_prompt,
+            DomainReview,
+            models_config.get_model("reviewer"),
+            models_config.get_temperature("reviewer")
+        ),
+        user_prompt
+    )
+    memoized = await review_memo.aget(memo_key)
+    if memoized is not None:
+        logger.info(f"[MEMO] Reviewer_{domain}: reused review for anchor {anchor_id}")
+        return {
+            "reviews": [memoized],
+            "messages": [
+                HumanMessage(
+                    content=f"[{domain}] Review completed (memoized)",
+                    name=f"Reviewer_{domain}"
+                )
+            ]
+        }
+    
     # Structured output 실행
     try:
-        response = structured_llm.invoke([
+        response = await structured_llm.ainvoke([
             SystemMessage(content=system_prompt),
             HumanMessage(content=user_prompt)
         ])
@@ -185,6 +211,8 @@ def review_domain_node(state: OnePagerState, domain: str = None) -> Dict[str, An
             "raw_content": f"장점: {response.advantages}\n\n문제: {response.problems}\n\n조건: {response.conditions}"
         }
         
+        await review_memo.aput(memo_key, review)
+        
         logger.info(f"[DONE] Reviewer_{domain}")
         
         return {
@@ -209,24 +237,25 @@ def review_domain_node(state: OnePagerState, domain: str = None) -> Dict[str, An
         }
 
 
+async def review_domain_from_state(state: OnePagerState, domain: str) -> Dict[str, Any]:
+    """전체 State에서 도메인 입력을 만들어 리뷰 (Send() 없이 도메인별 노드로 실행할 때)"""
+    return await review_domain_node(create_reviewer_input(state, domain))
+
+
 # functools.partial로 각 도메인별 노드 생성
-def create_reviewer_nodes():
+def create_reviewer_nodes(registry=None):
     """
-    4개 도메인별 Reviewer 노드 생성
+    도메인 레지스트리의 도메인별 Reviewer 노드 생성
+    
+    Args:
+        registry: DomainRegistry (None이면 전역 설정)
     
     Returns:
         {domain: node_function} 딕셔너리
     """
+    registry = registry or domain_registry
     nodes = {}
-    for domain in DOMAINS:
-        nodes[domain] = functools.partial(review_domain_node, domain=domain)
+    for domain in registry.kb_domains:
+        nodes[domain] = functools.partial(review_domain_from_state, domain=domain)
     
     return nodes
-
-
-# 개별 노드 함수 (그래프에 추가할 때 사용)
-reviewer_economics = functools.partial(review_domain_node, domain="경제경영")
-reviewer_science = functools.partial(review_domain_node, domain="과학기술")
-reviewer_history = functools.partial(review_domain_node, domain="역사사회")
-reviewer_humanities = functools.partial(review_domain_node, domain="인문자기계발")
-
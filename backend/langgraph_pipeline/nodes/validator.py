@@ -2,7 +2,7 @@
 from backend.langgraph_pipeline.state import OnePagerState
 from backend.langgraph_pipeline.utils import calculate_anchored_by_percent, extract_anchor_ids
 from langchain_core.messages import HumanMessage
-from typing import Dict, Any
+from typing import AbstractSet, Collection, Dict, Any
 import re
 import logging
 
@@ -36,7 +36,10 @@ def validator_node(state: OnePagerState) -> Dict[str, Any]:
     
     onepager_md = state.get("onepager_md", "")
     unique_sentences = state.get("unique_sentences", [])
-    available_anchors = state.get("available_anchors", [])
+    # run이 사용한 앵커 목록 기준 (KB 재로드/이전 체크포인트 재실행에도 일관), 집합으로 앵커당 O(1) 검증
+    # state에 없을 때만 현재 KB 앵커 집합 사용
+    run_anchors = state.get("available_anchors")
+    available_anchors = frozenset(run_anchors) if run_anchors else kb_service.get_anchor_set()
     
     if not onepager_md:
         logger.error("[FAIL] No 1p to validate")
@@ -85,7 +88,7 @@ def validator_node(state: OnePagerState) -> Dict[str, Any]:
 def validate_onepager(
     onepager_md: str, 
     unique_sentences: list[str],
-    available_anchors: list[str] = None
+    available_anchors: Collection[str] = None
 ) -> Dict[str, Any]:
     """
     1p 검증 로직 (품질 개선: 가짜 앵커 검증 추가)
@@ -179,17 +182,10 @@ def validate_anchor_ids(anchor_ids: list[str]) -> list[str]:
     Returns:
         유효하지 않은 앵커 ID 리스트
     """
-    invalid = []
-    
-    for anchor_id in anchor_ids:
-        item = kb_service.get_item_by_anchor(anchor_id)
-        if not item:
-            invalid.append(anchor_id)
-    
-    return invalid
+    return [anchor_id for anchor_id in anchor_ids if not kb_service.has_anchor(anchor_id)]
 
 
-def validate_fake_anchors(onepager_md: str, available_anchors: list[str]) -> Dict[str, Any]:
+def validate_fake_anchors(onepager_md: str, available_anchors: Collection[str]) -> Dict[str, Any]:
     """
     가짜 앵커 검출 (품질 개선 핵심 기능)
     
@@ -198,7 +194,7 @@ def validate_fake_anchors(onepager_md: str, available_anchors: list[str]) -> Dic
     
     Args:
         onepager_md: 1p Markdown 텍스트
-        available_anchors: 사용 가능한 KB 앵커 리스트
+        available_anchors: 사용 가능한 KB 앵커 (리스트 또는 집합)
     
     Returns:
         {
@@ -210,8 +206,11 @@ def validate_fake_anchors(onepager_md: str, available_anchors: list[str]) -> Dic
     # 1p 텍스트에서 사용된 모든 앵커 추출
     used_anchors = extract_anchor_ids(onepager_md)
     
-    # available_anchors set으로 변환 (빠른 조회)
-    available_set = set(available_anchors)
+    # available_anchors set으로 변환 (빠른 조회, 이미 집합이면 그대로 사용)
+    if isinstance(available_anchors, AbstractSet):
+        available_set = available_anchors
+    else:
+        available_set = set(available_anchors)
     
     # 가짜 앵커 찾기
     fake_anchors = [anchor for anchor in used_anchors if anchor not in available_set]
@@ -29,7 +29,8 @@ class OnePagerState(TypedDict):
     # === AnchorMapper 결과 ===
     anchors: Dict[str, str]  # {domain: anchor_id}
     anchor_analysis: Optional[str]  # 합치/상충/누락/경계 분석
-    available_anchors: Optional[List[str]]  # 사용 가능한 모든 KB 앵커 리스트 (가짜 앵커 방지)
+    available_anchors: Optional[Sequence[str]]  # 사용 가능한 모든 KB 앵커 리스트 (가짜 앵커 방지)
+    kb_hits: Optional[Dict[str, List[Dict]]]  # {domain: [{anchor_id, content, similarity_score, ...}]} (Reviewer 재사용)
     
     # === Reviewer 결과 (누적) ===
     reviews: Annotated[List[Dict], operator.add]  # [{domain, advantages, problems, conditions, anchor_id}]
@@ -58,6 +59,37 @@ class OnePagerState(TypedDict):
     retry_count: Optional[int]  # 재시도 횟수
 
 
+class ReviewerInput(TypedDict):
+    """
+    Reviewer 팬아웃(Send) 입력 - 도메인 리뷰에 필요한 값만 전달
+    
+    전체 State(messages, available_anchors 등)를 도메인 수만큼 복사/체크포인트하지 않도록
+    initiate_reviews가 도메인별로 이 입력만 만들어 보낸다.
+    """
+    book_id: str  # 도서 ID (메모 키)
+    summary: str  # 책 요약
+    title: Optional[str]  # 책 제목
+    topic: Optional[str]  # 주제
+    domain: str  # 리뷰 도메인
+    anchor_id: str  # AnchorMapper가 할당한 앵커
+    kb_refs: Optional[List[Dict]]  # AnchorMapper의 이 도메인 KB 검색 결과 (None이면 Reviewer가 직접 검색)
+
+
+def create_reviewer_input(state: OnePagerState, domain: str) -> ReviewerInput:
+    """전체 State → 도메인 Reviewer 입력"""
+    book_ids = state.get("book_ids") or []
+    book_id = book_ids[0] if book_ids else ""
+    return ReviewerInput(
+        book_id=book_id,
+        summary=state.get("book_summary", ""),
+        title=state.get("book_title", f"Book {book_id}"),
+        topic=state.get("book_topic", "주제 없음"),
+        domain=domain,
+        anchor_id=(state.get("anchors") or {}).get(domain, ""),
+        kb_refs=(state.get("kb_hits") or {}).get(domain)
+    )
+
+
 # 초기 State 생성 헬퍼
 def create_initial_state(
     book_ids: List[str],
@@ -91,6 +123,7 @@ def create_initial_state(
         anchors={},
         anchor_analysis=None,
         available_anchors=None,
+        kb_hits=None,
         tension_axes=None,
         integration_result=None,
         format_reasoning=None,
@@ -1,5 +1,6 @@
 """Utility functions for LangGraph nodes"""
 from langchain_core.messages import HumanMessage, AIMessage
+from backend.core.domain_registry import domain_registry
 from backend.langgraph_pipeline.state import OnePagerState
 from typing import Dict, Any, Callable
 import functools
@@ -261,9 +262,9 @@ def assemble_final_1p(state: OnePagerState) -> str:
 > **결론**: {conclusion if conclusion else 'N/A'}"""
     else:
         # 병치 기반 - 간소화 (도메인 리뷰에 이미 있으므로 요약만)
-        통합기록 = f"""# 통합 기록 (4개 관점 병치)
+        통합기록 = f"""# 통합 기록 ({len(domain_registry)}개 관점 병치)
 
-4개 도메인별로 장점, 문제, 조건을 분석하였습니다. (상세 내용은 위 '도메인 리뷰 카드' 참조)
+{len(domain_registry)}개 도메인별로 장점, 문제, 조건을 분석하였습니다. (상세 내용은 위 '도메인 리뷰 카드' 참조)
 
 **분기 사유**: 각 도메인별 관점이 서로 다른 측면을 강조하므로 병치 방식으로 제시합니다.
 
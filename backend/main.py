@@ -1,24 +1,64 @@
 """FastAPI application entry point"""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from backend.core.config import settings
+# 프로세스 환경 설정 (OpenAI 키, 도메인 레지스트리 - KB/그래프 모듈 import 전에 적용)
+from backend.services.bootstrap import configure_logging, configure_services
+import asyncio
 import logging
-import os
 
-# Set environment variables for LangChain/OpenAI
-os.environ["OPENAI_API_KEY"] = settings.openai_api_key
-
-# Configure logging
-logging.basicConfig(
-    level=settings.log_level,
-    format="[%(levelname)s] %(asctime)s - %(name)s - %(message)s"
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
-# KB Service auto-loads on import (see kb_service.py)
-# Verify KB is loaded
-from backend.services.kb_service import kb_service
-logger.info(f"[INIT] KB Service status: {len(kb_service.all_items)} items loaded")
+
+def warm_up():
+    """KB 로드 + LangGraph 컴파일 (KB를 사용하지 않는 라우트는 워밍업과 무관하게 즉시 응답)"""
+    from backend.services.kb_service import kb_service
+    from backend.langgraph_pipeline.graph import get_graph
+    
+    kb_service.ensure_loaded()
+    get_graph()
+    logger.info(f"[INIT] Warm-up complete: {len(kb_service.all_items)} KB items loaded")
+
+
+def _log_warmup_result(task: asyncio.Task):
+    """백그라운드 워밍업 실패 기록 (KB 로드 오류가 조용히 사라지지 않도록)"""
+    if task.cancelled():
+        logger.warning("[INIT] Warm-up cancelled")
+    elif task.exception() is not None:
+        logger.error(f"[INIT] Warm-up failed: {task.exception()!r}", exc_info=task.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명주기 - 시작 시 백그라운드 워밍업 (선택)"""
+    from backend.langgraph_pipeline.graph import close_checkpointer, open_checkpointer
+    from backend.services.llm_registry import llm_registry
+    
+    configure_services()
+    await open_checkpointer()
+    
+    if settings.warmup_on_startup:
+        # 시작을 막지 않도록 스레드에서 실행 (첫 요청과 겹치면 지연 로딩 락으로 1회만 로드)
+        app.state.warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+        app.state.warmup_task.add_done_callback(_log_warmup_result)
+    else:
+        logger.info("[INIT] Warm-up disabled (KB/graph load on first use)")
+    
+    if settings.kb_watch_enabled:
+        from backend.services.kb_service import kb_service
+        kb_service.start_file_watcher(settings.kb_watch_interval)
+    
+    yield
+    
+    await llm_registry.aclose()
+    await close_checkpointer()
+    
+    if settings.kb_watch_enabled:
+        from backend.services.kb_service import kb_service
+        kb_service.stop_file_watcher()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -26,7 +66,8 @@ app = FastAPI(
     description="KB-based 1-pager generation service using LangGraph",
     version="0.1.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -59,7 +100,7 @@ async def health_check():
 
 
 # Include API routers
-from backend.api.routes import upload, libraries, books, fusion, runs, artifacts, reminders, history
+from backend.api.routes import upload, libraries, books, fusion, runs, artifacts, reminders, history, kb
 
 app.include_router(upload.router, prefix="/api", tags=["upload"])
 app.include_router(libraries.router, prefix="/api", tags=["libraries"])
@@ -69,6 +110,7 @@ app.include_router(runs.router, prefix="/api", tags=["runs"])
 app.include_router(artifacts.router, prefix="/api", tags=["artifacts"])
 app.include_router(reminders.router, prefix="/api", tags=["reminders"])
 app.include_router(history.router, prefix="/api", tags=["history"])
+app.include_router(kb.router, prefix="/api", tags=["kb"])
 
 
 if __name__ == "__main__":
@@ -35,12 +35,38 @@ class KBSearchResult(BaseModel):
     similarity_score: float = Field(..., ge=0.0, le=1.0)
 
 
+class KBFileIntegrity(BaseModel):
+    """KB 파일(도메인)별 무결성 점검 결과"""
+    domain: str
+    file: str
+    exists: bool = True
+    items: int = 0
+    insights: int = 0
+    integrated_sections: int = 0
+    subcategories: int = 0
+    orphan_subcategories: List[str] = Field(default_factory=list, description="인사이트 행이 없는 소분류")
+    missing_integrated: List[str] = Field(default_factory=list, description="통합지식 섹션이 없는 소분류")
+    empty_insights: List[str] = Field(default_factory=list, description="내용이 비어 있는 아이템 anchor_id")
+
+
+class KBIntegrityReport(BaseModel):
+    """KB 로드 시 무결성 점검 리포트"""
+    ok: bool = Field(..., description="오류(중복 ID, 빈 인사이트, 누락 파일) 없음")
+    has_warnings: bool = Field(default=False, description="경고(고아 소분류, 통합지식 누락) 존재")
+    total_items: int
+    duplicate_anchor_ids: Dict[str, int] = Field(default_factory=dict, description="중복 anchor_id → 개수")
+    duplicate_kb_ids: Dict[str, int] = Field(default_factory=dict, description="중복 kb_id → 개수")
+    files: List[KBFileIntegrity] = Field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
 class KBStats(BaseModel):
     """KB 통계"""
     total_items: int
     fusion_items: int
     items_by_domain: dict[str, int]
     items_by_subcategory: dict[str, int]
+    integrity: Optional[KBIntegrityReport] = None
 
 
 # ============================================
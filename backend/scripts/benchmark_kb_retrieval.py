@@ -0,0 +1,177 @@
+"""KB 검색 품질/비용 벤치마크 (분석기 × 어휘 상한 × 검색 백엔드 비교)
+
+100권 CSV의 각 도서 (Topic + 요약)를 쿼리로 전체 KB를 검색하고,
+해당 도서를 참고 도서(reference_books)로 가진 KB 아이템을 정답으로 평가한다.
+
+지표:
+- Hit@k     상위 k개 중 정답이 하나라도 있는 쿼리 비율
+- Recall@k  정답 아이템 중 상위 k개에 포함된 비율 (쿼리 평균)
+- MRR       첫 정답 순위의 역수 평균 (상위 100개 내)
+- Domain@k  상위 k개 중 도서와 같은 도메인 아이템 비율
+- 비용      학습 시간, 어휘 수, 매트릭스 nnz/메모리, 쿼리당 검색 지연
+
+Usage:
+    python -m backend.scripts.benchmark_kb_retrieval
+    python -m backend.scripts.benchmark_kb_retrieval --top-k 10 --configs word:1000 morpheme:none char:5000
+    python -m backend.scripts.benchmark_kb_retrieval --backend hybrid --embedding-model hashing-256
+"""
+import argparse
+import csv
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.services.kb_retrieval import BACKENDS, create_backend
+from backend.services.kb_service import KBService
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+DEFAULT_CSV = Path(__file__).parent.parent.parent / "docs" / "100권 노션 원본_수정.csv"
+
+# (analyzer, max_features) 기본 비교 대상
+DEFAULT_CONFIGS = [
+    "word:1000", "word:none",
+    "morpheme:1000", "morpheme:none",
+    "char:1000", "char:5000", "char:none",
+]
+
+MRR_DEPTH = 100
+
+
+def parse_config(spec: str) -> Tuple[str, Optional[int]]:
+    """"analyzer:max_features" → (analyzer, max_features) (none = 제한 없음)"""
+    analyzer, _, cap = spec.partition(":")
+    max_features = None if cap in ("", "none") else int(cap)
+    return analyzer, max_features
+
+
+def load_queries(csv_path: Path) -> List[Dict]:
+    """CSV → [{title, domain, query}]"""
+    with open(csv_path, "r", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+
+    queries = []
+    for row in rows:
+        title = (row.get("Title") or "").strip()
+        if not title:
+            continue
+        queries.append({
+            "title": title,
+            "domain": KBService.DOMAIN_MAPPING.get((row.get("구분") or "").strip()),
+            "query": f"{row.get('Topic') or ''} {row.get('요약') or ''}".strip(),
+        })
+    return queries
+
+
+def relevant_rows(service: KBService, title: str) -> set:
+    """도서 제목을 참고 도서로 가진 KB 아이템 행 인덱스"""
+    return {
+        row for row, item in enumerate(service.all_items)
+        if any(book and (title in book or book in title) for book in item.reference_books)
+    }
+
+
+def benchmark(
+    analyzer: str,
+    max_features: Optional[int],
+    queries: List[Dict],
+    top_k: int,
+    backend_args: Optional[Dict] = None
+) -> Dict:
+    """단일 설정 벤치마크 (스냅샷 미사용 → 학습/임베딩 시간 포함)"""
+    # 쿼리 지연 측정을 위해 검색 결과 캐시 비활성화
+    service = KBService(
+        use_snapshot=False,
+        query_cache_size=0,
+        analyzer=analyzer,
+        max_features=max_features,
+        backend=create_backend(**backend_args) if backend_args else None
+    )
+
+    start = time.perf_counter()
+    service.load_all_domains()
+    fit_seconds = time.perf_counter() - start
+
+    matrix = service.tfidf_matrix
+    row_of = {item.anchor_id: row for row, item in enumerate(service.all_items)}
+    depth = max(top_k, MRR_DEPTH)
+
+    hits, recalls, reciprocal_ranks, domain_precisions, latencies = [], [], [], [], []
+    for q in queries:
+        relevant = relevant_rows(service, q["title"])
+
+        start = time.perf_counter()
+        results = service.search(q["query"], top_k=depth, prioritize_integrated=False)
+        latencies.append(time.perf_counter() - start)
+
+        ranked = [row_of[r.item.anchor_id] for r in results]
+        top = ranked[:top_k]
+        if q["domain"]:
+            domain_precisions.append(
+                sum(1 for r in results[:top_k] if r.item.domain == q["domain"]) / max(len(top), 1)
+            )
+        if not relevant:
+            continue
+
+        hits.append(1.0 if relevant.intersection(top) else 0.0)
+        recalls.append(len(relevant.intersection(top)) / len(relevant))
+        first = next((rank for rank, row in enumerate(ranked, 1) if row in relevant), None)
+        reciprocal_ranks.append(1.0 / first if first else 0.0)
+
+    return {
+        "config": f"{analyzer}:{max_features if max_features is not None else 'none'}",
+        "features": matrix.shape[1],
+        "nnz": matrix.nnz,
+        "matrix_kb": (matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes) / 1024,
+        "fit_ms": fit_seconds * 1000,
+        "query_ms": float(np.mean(latencies)) * 1000,
+        "hit": float(np.mean(hits)),
+        "recall": float(np.mean(recalls)),
+        "mrr": float(np.mean(reciprocal_ranks)),
+        "domain": float(np.mean(domain_precisions)),
+        "evaluated": len(hits),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KB retrieval benchmark")
+    parser.add_argument("--csv", type=Path, default=DEFAULT_CSV, help="도서 CSV 경로")
+    parser.add_argument("--top-k", type=int, default=5, help="평가 상위 k")
+    parser.add_argument("--configs", nargs="+", default=DEFAULT_CONFIGS, help="analyzer:max_features 목록")
+    parser.add_argument("--backend", choices=BACKENDS, default="tfidf", help="검색 백엔드")
+    parser.add_argument("--embedding-model", default="text-embedding-3-small", help="dense/hybrid 임베딩 모델")
+    parser.add_argument("--alpha", type=float, default=0.5, help="hybrid 밀집 점수 가중치")
+    args = parser.parse_args()
+
+    backend_args = {"name": args.backend, "embedding_model": args.embedding_model, "alpha": args.alpha}
+
+    queries = load_queries(args.csv)
+    print(f"[START] {len(queries)} queries from {args.csv.name}, top_k={args.top_k}, backend={args.backend}")
+    print()
+
+    header = (
+        f"{'config':<15} {'features':>8} {'nnz':>8} {'matrix_kb':>9} {'fit_ms':>8} {'query_ms':>8} "
+        f"{'Hit@k':>6} {'Recall@k':>8} {'MRR':>6} {'Domain@k':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for spec in args.configs:
+        analyzer, max_features = parse_config(spec)
+        r = benchmark(analyzer, max_features, queries, args.top_k, backend_args)
+        print(
+            f"{r['config']:<15} {r['features']:>8} {r['nnz']:>8} {r['matrix_kb']:>9.1f} "
+            f"{r['fit_ms']:>8.1f} {r['query_ms']:>8.2f} {r['hit']:>6.3f} {r['recall']:>8.3f} "
+            f"{r['mrr']:>6.3f} {r['domain']:>8.3f}"
+        )
+
+    print()
+    print(f"[OK] Evaluated {r['evaluated']} queries with at least one referencing KB item")
+
+
+if __name__ == "__main__":
+    main()
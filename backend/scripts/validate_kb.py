@@ -0,0 +1,54 @@
+"""KB 무결성 검증 CLI (CI/배포 전 점검용)
+
+KB 파일을 직접 파싱(스냅샷 미사용)하여 중복 anchor_id/kb_id, 빈 인사이트,
+고아 소분류, 파일별 통합지식 섹션 수를 점검한다.
+
+종료 코드: 0 = 통과, 1 = 오류 (--strict면 경고도 실패 처리)
+
+Usage:
+    python -m backend.scripts.validate_kb
+    python -m backend.scripts.validate_kb --strict --json
+    python -m backend.scripts.validate_kb --kb-dir path/to/docs
+"""
+import argparse
+import logging
+import sys
+
+from backend.services.kb_integrity import format_integrity_report
+from backend.services.kb_service import KBService
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate KB markdown files")
+    parser.add_argument("--kb-dir", default=None, help="KB 파일 디렉토리 (기본: 프로젝트 docs/)")
+    parser.add_argument("--strict", action="store_true", help="경고(고아 소분류, 통합지식 누락)도 실패 처리")
+    parser.add_argument("--json", action="store_true", help="리포트를 JSON으로 출력")
+    args = parser.parse_args()
+
+    service = KBService(kb_dir=args.kb_dir, use_snapshot=False)
+    service.load_all_domains()
+    report = service.index.integrity
+
+    if args.json:
+        print(report.model_dump_json(indent=2))
+    else:
+        for line in format_integrity_report(report):
+            print(line)
+        print()
+
+    # JSON 모드에서는 요약을 stderr로 (stdout은 JSON만)
+    out = sys.stderr if args.json else sys.stdout
+    failed = not report.ok or (args.strict and report.has_warnings)
+    if failed:
+        print(f"[FAIL] KB integrity check failed ({report.total_items} items, {report.elapsed_ms:.1f}ms)", file=out)
+        return 1
+
+    print(f"[SUCCESS] KB integrity check passed ({report.total_items} items, {report.elapsed_ms:.1f}ms)", file=out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Bootstrap - API 서버와 워커 프로세스 공통 시작 설정
+
+backend.main(FastAPI 앱)과 backend.worker(작업 큐 워커)가 같은 설정으로
+KB/LLM/체크포인터 서비스를 구성한다. 워커가 앱 모듈(라우터 전체)을 import하지 않도록
+앱과 분리된 서비스 계층에 둔다.
+
+import 시 프로세스 환경변수를 먼저 설정하므로 KB/그래프 모듈보다 먼저 import해야 한다.
+"""
+import logging
+import os
+
+from backend.core.config import settings
+
+# Set environment variables for LangChain/OpenAI
+os.environ["OPENAI_API_KEY"] = settings.openai_api_key
+# 도메인 레지스트리 설정 파일 (KB/그래프 모듈 import 전에 설정)
+if settings.kb_domains_config:
+    os.environ.setdefault("KB_DOMAINS_CONFIG", settings.kb_domains_config)
+
+
+def configure_logging():
+    """로그 형식/레벨 설정 (LOG_LEVEL)"""
+    logging.basicConfig(
+        level=settings.log_level,
+        format="[%(levelname)s] %(asctime)s - %(name)s - %(message)s"
+    )
+
+
+def configure_services():
+    """설정 → KB/LLM 서비스 적용 (API 서버와 워커 프로세스 공통)"""
+    from backend.services.kb_service import kb_service
+    from backend.services.llm_registry import llm_registry
+    
+    if settings.kb_parallel_load:
+        kb_service.PARALLEL_LOAD = True
+    
+    kb_service.configure_query_cache(settings.kb_query_cache_size, settings.kb_query_cache_ttl)
+    
+    llm_registry.configure(
+        settings.llm_max_connections,
+        settings.llm_max_keepalive_connections,
+        settings.llm_keepalive_expiry,
+        settings.llm_timeout
+    )
+    
+    from backend.services.llm_cache import create_llm_cache
+    from backend.services.review_memo import review_memo
+    llm_cache = create_llm_cache(
+        settings.llm_cache_backend,
+        path=settings.llm_cache_path,
+        max_size=settings.llm_cache_size
+    )
+    llm_registry.configure_response_cache(llm_cache)
+    review_memo.configure(llm_cache if settings.review_memo_enabled else None)
+    
+    # 그래프 컴파일(워밍업) 전에 설정
+    from backend.langgraph_pipeline.checkpointer import create_checkpointer
+    from backend.langgraph_pipeline.graph import configure_checkpointer
+    configure_checkpointer(create_checkpointer(
+        settings.checkpoint_backend,
+        path=settings.checkpoint_path,
+        max_threads=settings.checkpoint_max_threads,
+        postgres_url=settings.checkpoint_postgres_url
+    ))
+    
+    if settings.kb_retrieval_backend != "tfidf":
+        # 워밍업 전에 설정 (KB 로드 시 임베딩까지 준비)
+        from backend.services.kb_retrieval import create_backend
+        kb_service.set_backend(create_backend(
+            settings.kb_retrieval_backend,
+            embedding_model=settings.kb_embedding_model,
+            alpha=settings.kb_hybrid_alpha
+        ))
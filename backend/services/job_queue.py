@@ -0,0 +1,323 @@
+"""Job Queue - 파이프라인 run 작업 큐 (클레임/하트비트 리스, 백프레셔)
+
+API 프로세스는 run 레코드를 만들고 큐에 넣기만 하며, 실제 실행은 별도 워커
+프로세스(backend/worker.py)가 큐에서 클레임하여 수행한다.
+
+- enqueue: 대기 작업 수가 max_pending 이상이면 QueueFullError (백프레셔)
+- claim: 가장 오래된 대기 작업(또는 리스가 만료된 실행 중 작업)을 원자적으로 가져감
+- heartbeat: 실행 중 리스 연장 (워커가 죽으면 리스 만료 후 다른 워커가 재클레임)
+- complete / fail: 종료 처리 (fail은 max_attempts 미만이면 재시도 대기로 되돌림)
+- reap_expired: 리스가 만료됐는데 재시도 한도를 다 쓴 작업을 실패 처리 → run_id 목록
+- keep_lease: 실행 중 주기적 하트비트 (일시 오류는 재시도, 리스를 잃거나 만료되면 반환)
+
+구현체는 JobQueue 인터페이스를 따르며, 단일 노드 배포용 SQLiteJobQueue를 제공한다.
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """대기 작업 수가 상한에 도달 (호출자는 나중에 재시도)"""
+
+
+@dataclass(frozen=True)
+class Job:
+    """클레임된 작업"""
+    id: str
+    run_id: str
+    payload: Dict[str, Any]
+    attempts: int
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+
+
+class JobQueue(ABC):
+    """작업 큐 인터페이스"""
+
+    @abstractmethod
+    def enqueue(self, run_id: str, payload: Dict[str, Any]) -> str:
+        """작업 추가 → job_id (가득 차면 QueueFullError)"""
+
+    @abstractmethod
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        """다음 작업 클레임 (없으면 None)"""
+
+    @abstractmethod
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        """리스 연장 (다른 워커가 가져갔거나 종료된 작업이면 False)"""
+
+    @abstractmethod
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        """작업 완료 처리"""
+
+    @abstractmethod
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True) -> bool:
+        """작업 실패 처리 (retry이고 한도 미만이면 대기 상태로 복귀) → 재시도 예정 여부"""
+
+    @abstractmethod
+    def reap_expired(self) -> List[str]:
+        """재시도 한도를 다 쓴 리스 만료 작업 실패 처리 → 해당 run_id 목록"""
+
+    @abstractmethod
+    def has_capacity(self) -> bool:
+        """새 작업을 받을 수 있는지 (백프레셔 사전 확인)"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """상태별 작업 수"""
+
+
+class SQLiteJobQueue(JobQueue):
+    """
+    SQLite 파일 기반 작업 큐 (단일 노드, 다중 워커 프로세스 공유)
+
+    클레임은 BEGIN IMMEDIATE 트랜잭션(쓰기 잠금) 안에서 조회 + 갱신하므로
+    여러 워커 프로세스가 같은 작업을 동시에 가져가지 않는다.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_pending: int = 100,
+        max_attempts: int = 3
+    ):
+        self.path = str(path)
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # 연결은 스레드별로 보관 (sqlite3 연결은 스레드 간 공유 불가)
+        self._local = threading.local()
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _init_schema(self):
+        conn = self._connect()
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                run_id TEXT NOT NULL UNIQUE,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker_id TEXT,
+                lease_expires_at REAL,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs (status, created_at);
+            """
+        )
+
+    def _pending_count(self, conn: sqlite3.Connection) -> int:
+        return conn.execute("SELECT COUNT(*) FROM jobs WHERE status = ?", (PENDING,)).fetchone()[0]
+
+    def enqueue(self, run_id: str, payload: Dict[str, Any]) -> str:
+        conn = self._connect()
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self._pending_count(conn) >= self.max_pending:
+                raise QueueFullError(f"Run queue is full ({self.max_pending} pending jobs)")
+            conn.execute(
+                "INSERT INTO jobs (id, run_id, payload, status, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, run_id, json.dumps(payload, ensure_ascii=False), PENDING, now, now)
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return job_id
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Job]:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 리스 만료 작업은 재시도 한도 내에서만 재클레임 (초과분은 reap_expired가 정리)
+            row = conn.execute(
+                "SELECT * FROM jobs "
+                "WHERE status = ? OR (status = ? AND lease_expires_at < ? AND attempts < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (PENDING, RUNNING, now, self.max_attempts)
+            ).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return None
+            lease_expires_at = now + lease_seconds
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, lease_expires_at = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (RUNNING, worker_id, lease_expires_at, now, row["id"])
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return Job(
+            id=row["id"],
+            run_id=row["run_id"],
+            payload=json.loads(row["payload"]),
+            attempts=row["attempts"] + 1,
+            worker_id=worker_id,
+            lease_expires_at=lease_expires_at,
+        )
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        now = time.time()
+        cursor = self._connect().execute(
+            "UPDATE jobs SET lease_expires_at = ?, updated_at = ? "
+            "WHERE id = ? AND worker_id = ? AND status = ?",
+            (now + lease_seconds, now, job_id, worker_id, RUNNING)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: str, worker_id: str) -> bool:
+        cursor = self._connect().execute(
+            "UPDATE jobs SET status = ?, lease_expires_at = NULL, updated_at = ? "
+            "WHERE id = ? AND worker_id = ? AND status = ?",
+            (DONE, time.time(), job_id, worker_id, RUNNING)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: str, worker_id: str, error: str, retry: bool = True) -> bool:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT attempts FROM jobs WHERE id = ? AND worker_id = ? AND status = ?",
+                (job_id, worker_id, RUNNING)
+            ).fetchone()
+            retry = retry and row is not None and row["attempts"] < self.max_attempts
+            if row is not None:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL, "
+                    "error = ?, updated_at = ? WHERE id = ?",
+                    (PENDING if retry else FAILED, error, time.time(), job_id)
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return retry
+
+    def reap_expired(self) -> List[str]:
+        conn = self._connect()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT id, run_id FROM jobs WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+                (RUNNING, now, self.max_attempts)
+            ).fetchall()
+            conn.executemany(
+                "UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL, "
+                "error = 'lease expired', updated_at = ? WHERE id = ?",
+                [(FAILED, now, row["id"]) for row in rows]
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return [row["run_id"] for row in rows]
+
+    def has_capacity(self) -> bool:
+        return self._pending_count(self._connect()) < self.max_pending
+
+    def stats(self) -> Dict[str, Any]:
+        rows = self._connect().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (PENDING, RUNNING, DONE, FAILED)}
+        counts.update({status: count for status, count in rows})
+        return {"backend": "sqlite", "max_pending": self.max_pending, **counts}
+
+
+def create_job_queue(
+    backend: str,
+    path: Optional[Union[str, Path]] = None,
+    max_pending: int = 100,
+    max_attempts: int = 3
+) -> JobQueue:
+    """
+    설정 → 작업 큐 생성
+
+    Args:
+        backend: "sqlite" (현재 지원 구현체)
+        path: SQLite 파일 경로
+        max_pending: 대기 작업 상한 (초과 시 enqueue 거부)
+        max_attempts: 작업당 최대 실행 횟수 (워커 장애/실패 포함)
+    """
+    if backend == "sqlite":
+        return SQLiteJobQueue(path or ".cache/run_queue.db", max_pending=max_pending, max_attempts=max_attempts)
+    raise ValueError(f"Unknown job queue backend: {backend}")
+
+
+async def keep_lease(
+    queue: JobQueue,
+    job: Job,
+    worker_id: str,
+    lease_seconds: float,
+    interval: float,
+    on_renew: Optional[Callable[[], Awaitable[Any]]] = None
+):
+    """
+    실행 중 리스 연장 루프 (리스를 잃으면 반환 → 호출자가 실행 취소)
+
+    하트비트 예외(SQLite 잠금, 네트워크 오류 등)는 기록 후 다음 주기에 재시도한다.
+    반환 조건은 queue.heartbeat가 False(다른 워커가 재클레임/종료됨)이거나
+    마지막으로 연장한 리스 만료 시각이 지난 경우뿐이다.
+
+    Args:
+        on_renew: 연장 성공 후 호출 (runs.heartbeat_at 기록 등, 실패해도 리스 유지)
+    """
+    remaining = job.lease_expires_at - time.time() if job.lease_expires_at else lease_seconds
+    deadline = time.monotonic() + remaining
+    while True:
+        await asyncio.sleep(min(interval, max(deadline - time.monotonic(), 0.0)))
+        started = time.monotonic()
+        try:
+            alive = await asyncio.to_thread(queue.heartbeat, job.id, worker_id, lease_seconds)
+        except Exception as e:
+            if time.monotonic() >= deadline:
+                logger.error(f"[WORKER] Lease of job {job.id} expired after heartbeat failures: {e}")
+                return
+            logger.warning(f"[WORKER] Heartbeat failed for job {job.id} (retrying): {e}")
+            continue
+        if not alive:
+            logger.warning(f"[WORKER] Lease of job {job.id} lost")
+            return
+        deadline = started + lease_seconds
+        if on_renew is not None:
+            try:
+                await on_renew()
+            except Exception as e:
+                logger.warning(f"[WORKER] Heartbeat side effect failed for job {job.id}: {e}")
@@ -0,0 +1,141 @@
+"""KB Index - 불변 KB 검색 인덱스 스냅샷
+
+KBService는 현재 인덱스 객체 참조 하나만 보유하고, 재로드 시 새 인덱스를 완전히
+빌드한 뒤 참조를 교체한다. 검색은 시작 시점의 인덱스 참조만 사용하므로
+빌드 중인(반쯤 만들어진) 매트릭스를 보지 않는다.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from backend.models.schemas import KBIntegrityReport, KBItem
+from backend.services.kb_record import KBRecord
+from backend.services.kb_snapshot import KBQueryVectorizer
+
+# 통합지식 우선 검색 시 순위 점수 가산치 (반환 점수는 원래 유사도)
+INTEGRATED_BONUS = 0.05
+
+
+@dataclass(frozen=True)
+class KBIndex:
+    """KB 아이템 + TF-IDF 인덱스 (생성 후 변경 불가)"""
+
+    kb_items: Mapping[str, Tuple[KBItem, ...]]  # {domain: items} (도메인 순서 유지)
+    all_items: Tuple[KBItem, ...]  # kb_items 순서대로 이어붙인 전체 아이템 (= 매트릭스 행 순서)
+    vectorizer: Optional[KBQueryVectorizer]
+    tfidf_matrix: Optional[csr_matrix]  # 행 단위 L2 정규화된 (n_items × n_features)
+    domain_rows: Mapping[str, np.ndarray]  # {domain: 행 인덱스 배열}
+    domain_matrices: Mapping[str, csr_matrix]  # {domain: 행 구간 CSR 뷰}
+    anchor_index: Mapping[str, KBItem]  # {anchor_id: item} (중복 시 첫 아이템)
+    anchor_ids: Tuple[str, ...]  # 전체 anchor_id (행 순서)
+    anchor_set: FrozenSet[str]  # 유효 anchor_id 집합 (O(1) 검증용)
+    version: int = 0  # 빌드 순번 (재로드마다 증가)
+    source_hash: Optional[str] = None  # KB 원본 파일 내용 해시
+    built_at: datetime = field(default_factory=datetime.now)
+    embeddings: Optional[np.ndarray] = None  # 행 단위 L2 정규화된 float32 (n_items × dim), 밀집 검색용
+    embedding_model: Optional[str] = None  # embeddings 생성 모델 이름
+    integrity: Optional[KBIntegrityReport] = None  # 로드 시 무결성 점검 리포트
+    integrated_bonus: np.ndarray = field(
+        default_factory=lambda: np.zeros(0)
+    )  # 행별 통합지식 가산치 (통합지식 INTEGRATED_BONUS, 그 외 0), 순위 계산용
+    records: Tuple[KBRecord, ...] = ()  # all_items와 같은 순서의 경량 레코드 (검색 결과용)
+
+    def domain_slice(self, domain: Optional[str] = None) -> slice:
+        """도메인 행 구간 (도메인이 없거나 None이면 전체)"""
+        rows = self.domain_rows.get(domain) if domain else None
+        if rows is None:
+            return slice(0, len(self.all_items))
+        if len(rows) == 0:
+            return slice(0, 0)
+        return slice(int(rows[0]), int(rows[-1]) + 1)
+
+    @classmethod
+    def empty(cls) -> "KBIndex":
+        """로드 전 빈 인덱스"""
+        return cls(
+            kb_items=MappingProxyType({}),
+            all_items=(),
+            vectorizer=None,
+            tfidf_matrix=None,
+            domain_rows=MappingProxyType({}),
+            domain_matrices=MappingProxyType({}),
+            anchor_index=MappingProxyType({}),
+            anchor_ids=(),
+            anchor_set=frozenset(),
+        )
+
+    @classmethod
+    def build(
+        cls,
+        kb_items: Mapping[str, List[KBItem]],
+        vectorizer: Optional[KBQueryVectorizer],
+        tfidf_matrix: Optional[csr_matrix],
+        version: int,
+        source_hash: Optional[str] = None
+    ) -> "KBIndex":
+        """도메인별 아이템 + 학습된 매트릭스로 인덱스 생성 (도메인별 행 구간, anchor 조회 인덱스 사전 계산)"""
+        frozen_items = {domain: tuple(items) for domain, items in kb_items.items()}
+        all_items = tuple(item for items in frozen_items.values() for item in items)
+
+        # anchor_id 조회 인덱스 (기존 선형 탐색과 동일하게 첫 아이템 우선)
+        anchor_index: Dict[str, KBItem] = {}
+        for item in all_items:
+            anchor_index.setdefault(item.anchor_id, item)
+        anchor_ids = tuple(item.anchor_id for item in all_items)
+
+        # 통합지식 가산치 벡터 (검색마다 아이템 순회 없이 행 구간 슬라이스로 사용)
+        integrated_bonus = np.fromiter(
+            (INTEGRATED_BONUS if item.is_integrated_knowledge else 0.0 for item in all_items),
+            dtype=np.float64,
+            count=len(all_items)
+        )
+        integrated_bonus.setflags(write=False)
+
+        # 검색 결과용 경량 레코드 (검색마다 pydantic 모델 생성/검증 없음)
+        records = tuple(KBRecord.from_item(item) for item in all_items)
+
+        domain_rows: Dict[str, np.ndarray] = {}
+        domain_matrices: Dict[str, csr_matrix] = {}
+        if tfidf_matrix is not None:
+            offset = 0
+            for domain, items in frozen_items.items():
+                rows = np.arange(offset, offset + len(items), dtype=np.int64)
+                rows.setflags(write=False)
+                domain_rows[domain] = rows
+                domain_matrices[domain] = row_block(tfidf_matrix, offset, offset + len(items))
+                offset += len(items)
+
+        return cls(
+            kb_items=MappingProxyType(frozen_items),
+            all_items=all_items,
+            vectorizer=vectorizer,
+            tfidf_matrix=tfidf_matrix,
+            domain_rows=MappingProxyType(domain_rows),
+            domain_matrices=MappingProxyType(domain_matrices),
+            anchor_index=MappingProxyType(anchor_index),
+            anchor_ids=anchor_ids,
+            anchor_set=frozenset(anchor_ids),
+            integrated_bonus=integrated_bonus,
+            records=records,
+            version=version,
+            source_hash=source_hash,
+        )
+
+
+def row_block(matrix: csr_matrix, start: int, stop: int) -> csr_matrix:
+    """연속 행 구간 CSR 뷰 (data/indices 복사 없음 → 메모리 매핑 페이지 공유 유지)"""
+    indptr = np.asarray(matrix.indptr[start:stop + 1])
+    begin, end = int(indptr[0]), int(indptr[-1])
+    block = csr_matrix(
+        (matrix.data[begin:end], matrix.indices[begin:end], indptr - begin),
+        shape=(stop - start, matrix.shape[1]),
+        copy=False
+    )
+    # scipy는 큰 배열의 뷰를 생성자에서 복사하므로 뷰를 직접 재할당
+    block.data = matrix.data[begin:end]
+    block.indices = matrix.indices[begin:end]
+    return block
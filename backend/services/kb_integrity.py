@@ -0,0 +1,122 @@
+"""KB Integrity - KB 로드 시 무결성 점검 (중복 ID, 빈 인사이트, 고아 소분류, 통합지식 섹션)
+
+모든 집계는 collections.Counter 기반 단일 패스(아이템 수에 선형)로 수행되어
+KB 로드 시점과 CI(backend/scripts/validate_kb.py)에서 밀리초 단위로 실행된다.
+"""
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+from backend.models.schemas import KBFileIntegrity, KBIntegrityReport, KBItem
+from backend.services.kb_parser import SUBCATEGORY_HEADER
+
+
+def scan_subcategories(file_path: Path) -> Optional[List[str]]:
+    """KB 파일의 소분류 헤더 이름 목록 (등장 순서, 파일 없으면 None)"""
+    if not file_path.exists():
+        return None
+    with open(file_path, "r", encoding="utf-8") as f:
+        return [match.group(1).strip() for match in map(SUBCATEGORY_HEADER.match, f) if match]
+
+
+def build_integrity_report(
+    kb_items: Mapping[str, Sequence[KBItem]],
+    kb_files: Sequence[Tuple[str, Path]]
+) -> KBIntegrityReport:
+    """
+    KB 무결성 리포트 생성
+
+    Args:
+        kb_items: {domain: 파싱된 아이템}
+        kb_files: [(domain, file_path)] (헤더 스캔 대상)
+
+    Returns:
+        KBIntegrityReport (ok=False: 중복 ID / 빈 인사이트 / 누락 파일)
+    """
+    start = time.perf_counter()
+
+    anchor_counts: Counter = Counter()
+    kb_id_counts: Counter = Counter()
+    files = []
+
+    for domain, file_path in kb_files:
+        items = kb_items.get(domain, ())
+        headers = scan_subcategories(file_path)
+        if headers is None:
+            files.append(KBFileIntegrity(domain=domain, file=file_path.name, exists=False))
+            continue
+
+        insight_counts: Counter = Counter()
+        integrated_counts: Counter = Counter()
+        empty_insights = []
+        for item in items:
+            anchor_counts[item.anchor_id] += 1
+            kb_id_counts[item.kb_id] += 1
+            if item.is_integrated_knowledge:
+                integrated_counts[item.subcategory] += 1
+            else:
+                insight_counts[item.subcategory] += 1
+            if not item.content.strip():
+                empty_insights.append(item.anchor_id)
+
+        # 소분류 = 헤더 + 아이템에 등장한 이름 (등장 순서 유지)
+        subcategories = list(dict.fromkeys(headers + [item.subcategory for item in items]))
+        files.append(KBFileIntegrity(
+            domain=domain,
+            file=file_path.name,
+            items=len(items),
+            insights=sum(insight_counts.values()),
+            integrated_sections=sum(integrated_counts.values()),
+            subcategories=len(subcategories),
+            orphan_subcategories=[name for name in subcategories if not insight_counts[name]],
+            missing_integrated=[
+                name for name in subcategories if insight_counts[name] and not integrated_counts[name]
+            ],
+            empty_insights=empty_insights,
+        ))
+
+    duplicate_anchor_ids = {aid: count for aid, count in anchor_counts.items() if count > 1}
+    duplicate_kb_ids = {kid: count for kid, count in kb_id_counts.items() if count > 1}
+
+    ok = not (
+        duplicate_anchor_ids
+        or duplicate_kb_ids
+        or any(not f.exists or f.empty_insights for f in files)
+    )
+    has_warnings = any(f.orphan_subcategories or f.missing_integrated for f in files)
+
+    return KBIntegrityReport(
+        ok=ok,
+        has_warnings=has_warnings,
+        total_items=sum(anchor_counts.values()),
+        duplicate_anchor_ids=duplicate_anchor_ids,
+        duplicate_kb_ids=duplicate_kb_ids,
+        files=files,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
+
+
+def format_integrity_report(report: KBIntegrityReport) -> List[str]:
+    """리포트 → 로그/CLI 출력용 문자열 목록"""
+    lines = []
+    for f in report.files:
+        if not f.exists:
+            lines.append(f"[FAIL] {f.domain}: KB file not found ({f.file})")
+            continue
+        lines.append(
+            f"[{f.domain}] {f.items} items = {f.insights} insights + "
+            f"{f.integrated_sections} integrated sections, {f.subcategories} subcategories"
+        )
+        if f.empty_insights:
+            lines.append(f"  [FAIL] Empty insights: {', '.join(f.empty_insights)}")
+        if f.orphan_subcategories:
+            lines.append(f"  [WARN] Orphan subcategories (no insights): {', '.join(f.orphan_subcategories)}")
+        if f.missing_integrated:
+            lines.append(f"  [WARN] Missing integrated knowledge: {', '.join(f.missing_integrated)}")
+
+    for label, duplicates in (("anchor_id", report.duplicate_anchor_ids), ("kb_id", report.duplicate_kb_ids)):
+        for dup_id, count in duplicates.items():
+            lines.append(f"[FAIL] Duplicate {label}: {dup_id} (x{count})")
+
+    return lines
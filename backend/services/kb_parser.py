@@ -0,0 +1,150 @@
+"""KB Parser - KB 마크다운 스트리밍 파서 (단일 패스 상태 머신)
+
+파일을 줄 단위로 한 번만 순회하며 KBItem을 즉시 yield한다.
+메모리 사용량은 파일 크기와 무관하게 통합지식 블록 하나 크기로 제한되며,
+모듈 수준 함수이므로 도메인별 프로세스 병렬 파싱에도 그대로 사용할 수 있다.
+
+KB 파일 형식:
+    ### **소분류: XXX**
+    | 핵심 인사이트 | 참고 도서 |
+    | :---- | :---- |
+    | 인사이트 내용 **(융합형)** | 도서1, 도서2 |
+    **통합 지식**
+    통합지식 내용 (다음 소분류 헤더 전까지)
+"""
+import logging
+import re
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from backend.models.schemas import KBItem
+
+logger = logging.getLogger(__name__)
+
+# 소분류 헤더 감지: ### **소분류: XXX**
+SUBCATEGORY_HEADER = re.compile(r"###\s+\*\*소분류:\s*(.+?)\*\*")
+# 소분류 섹션 시작 (통합지식 블록 종료 조건)
+SECTION_START = re.compile(r"###\s+\*\*소분류:")
+# 통합지식 섹션 감지: **통합 지식** 또는 **통합지식**
+INTEGRATED_HEADER = re.compile(r"\*\*통합\s*지식\*\*")
+
+FUSION_MARK = "**(융합형)**"
+
+
+def iter_kb_items(lines: Iterable[str], domain: str) -> Iterator[KBItem]:
+    """
+    KB 마크다운 줄 스트림 → KBItem (개별 인사이트 + 통합지식)
+
+    상태: 현재 소분류, 인사이트 순번, 통합지식 블록 수집 중 여부
+
+    Args:
+        lines: 줄 이터레이터 (파일 객체 등, 줄 끝 개행 포함 가능)
+        domain: KB 도메인
+    """
+    subcategory: Optional[str] = None
+    kb_index = 1
+    # 통합지식 블록 수집 중이면 내용 줄 리스트, 아니면 None
+    integrated_lines: Optional[List[str]] = None
+
+    for raw_line in lines:
+        line = raw_line.rstrip("\n")
+
+        if integrated_lines is not None:
+            # 다음 소분류 섹션 전까지 빈 줄을 제외하고 수집
+            if not SECTION_START.match(line):
+                stripped = line.strip()
+                if stripped:
+                    integrated_lines.append(stripped)
+                continue
+            if integrated_lines:
+                yield _integrated_item(domain, subcategory, integrated_lines)
+            integrated_lines = None
+            # 섹션 시작 줄은 아래에서 일반 줄로 처리
+
+        header_match = SUBCATEGORY_HEADER.match(line)
+        if header_match:
+            subcategory = header_match.group(1).strip()
+            continue
+
+        if not subcategory:
+            continue
+
+        stripped = line.strip()
+        if stripped.startswith("|") and not stripped.startswith("| :"):
+            item = _insight_item(line, domain, subcategory, kb_index)
+            if item is not None:
+                yield item
+                kb_index += 1
+        elif INTEGRATED_HEADER.match(line):
+            integrated_lines = []
+
+    if integrated_lines:
+        yield _integrated_item(domain, subcategory, integrated_lines)
+
+
+def iter_kb_file(file_path: Path, domain: str) -> Iterator[KBItem]:
+    """KB 파일 스트리밍 파싱 (줄 단위 읽기)"""
+    with open(file_path, "r", encoding="utf-8") as f:
+        yield from iter_kb_items(f, domain)
+
+
+def parse_kb_file(file_path: Path, domain: str) -> List[KBItem]:
+    """KB 파일 파싱 → KBItem 리스트"""
+    return list(iter_kb_file(file_path, domain))
+
+
+def parse_kb_file_timed(file_path: Path, domain: str) -> Tuple[List[KBItem], float]:
+    """KB 파일 파싱 + 소요 시간(초) (도메인별 프로세스 풀 작업 단위)"""
+    start = time.perf_counter()
+    items = parse_kb_file(file_path, domain)
+    return items, time.perf_counter() - start
+
+
+def _insight_item(line: str, domain: str, subcategory: str, kb_index: int) -> Optional[KBItem]:
+    """테이블 행 → 개별 인사이트 (헤더 행/불완전한 행은 None)"""
+    parts = [p.strip() for p in line.split("|")]
+
+    # 유효한 테이블 행인지 확인 (최소 4개 파트: '', 인사이트, 도서, '')
+    if len(parts) < 4 or not parts[1] or not parts[2]:
+        return None
+
+    insight_text, books_text = parts[1], parts[2]
+
+    # 헤더 행 건너뛰기
+    if "핵심 인사이트" in insight_text or "참고 도서" in books_text:
+        return None
+
+    # 융합형 플래그 감지
+    is_fusion = FUSION_MARK in insight_text
+    if is_fusion:
+        insight_text = insight_text.replace(FUSION_MARK, "").strip()
+
+    return KBItem(
+        kb_id=f"kb_{domain}_{kb_index:04d}",
+        domain=domain,
+        subcategory=subcategory,
+        anchor_id=f"{domain}_{subcategory.replace('/', '_')}_{kb_index:03d}",
+        content=insight_text,
+        is_fusion=is_fusion,
+        is_integrated_knowledge=False,
+        # 참고 도서 파싱 (쉼표로 구분)
+        reference_books=[b.strip() for b in books_text.split(",")]
+    )
+
+
+def _integrated_item(domain: str, subcategory: str, content_lines: List[str]) -> KBItem:
+    """통합지식 블록 → KBItem (anchor_id: {domain}·{subcategory} 통합지식)"""
+    anchor_id = f"{domain}·{subcategory} 통합지식"
+    logger.info(f"[OK] Parsed integrated knowledge: {anchor_id}")
+
+    return KBItem(
+        kb_id=f"kb_{domain}_integrated_{subcategory}",
+        domain=domain,
+        subcategory=subcategory,
+        anchor_id=anchor_id,
+        content=" ".join(content_lines),
+        is_fusion=False,
+        is_integrated_knowledge=True,
+        reference_books=[]  # 통합지식은 참고 도서 없음
+    )
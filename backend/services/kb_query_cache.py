@@ -0,0 +1,89 @@
+"""KB Query Cache - 검색 결과 LRU 캐시 (TTL, 히트/미스 카운터)
+
+같은 도서를 반복 생성하면 AnchorMapper/Reviewer/kb_search 도구가 동일한 쿼리를
+그대로 다시 검색한다. 결과(불변 KBHit 목록)를 정규화된 쿼리 해시 + 검색 파라미터
++ 인덱스 버전 키로 보관하여 벡터화/유사도 계산을 생략한다.
+
+키에 인덱스 버전이 포함되므로 재로드 후에는 이전 결과가 조회되지 않으며,
+KBService는 인덱스/백엔드 교체 시 clear()로 메모리도 즉시 비운다.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+def normalize_query(query: str) -> str:
+    """공백 정규화 (앞뒤 공백 제거, 연속 공백/개행 → 공백 1개)"""
+    return " ".join(query.split())
+
+
+def query_digest(query: str) -> str:
+    """정규화된 쿼리 해시 (긴 요약 쿼리도 고정 길이 키)"""
+    return hashlib.blake2b(normalize_query(query).encode("utf-8"), digest_size=16).hexdigest()
+
+
+class KBQueryCache:
+    """스레드 안전 LRU + TTL 캐시 (max_size=0이면 비활성화)"""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = 3600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시 조회 (없거나 만료 시 None, 미스 카운트)"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if self.ttl is None or time.monotonic() - stored_at < self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                # 만료 항목 제거
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any):
+        """캐시 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """전체 항목 제거 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 (상태 API/로그용)"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
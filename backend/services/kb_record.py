@@ -0,0 +1,62 @@
+"""KB Record - 검색 경로용 경량 레코드 (slots 데이터클래스)
+
+인덱스 빌드 시 KBItem(pydantic)마다 KBRecord를 1회 생성해 두고, 검색 결과는
+검증 없는 KBHit(레코드 참조 + 점수)으로 반환한다. 서비스/도구/노드 내부에서는
+KBHit을 그대로 사용하고, pydantic 변환(to_result)은 API 경계에서만 수행한다.
+
+KBHit.item / similarity_score 속성 이름은 KBSearchResult와 동일하다.
+"""
+from dataclasses import dataclass
+from typing import Tuple
+
+from backend.models.schemas import KBItem, KBSearchResult
+
+
+@dataclass(frozen=True, slots=True)
+class KBRecord:
+    """KBItem의 불변 경량 표현 (필드 이름 동일)"""
+    kb_id: str
+    domain: str
+    subcategory: str
+    anchor_id: str
+    content: str
+    is_fusion: bool
+    is_integrated_knowledge: bool
+    reference_books: Tuple[str, ...]
+
+    @classmethod
+    def from_item(cls, item: KBItem) -> "KBRecord":
+        return cls(
+            kb_id=item.kb_id,
+            domain=item.domain,
+            subcategory=item.subcategory,
+            anchor_id=item.anchor_id,
+            content=item.content,
+            is_fusion=item.is_fusion,
+            is_integrated_knowledge=item.is_integrated_knowledge,
+            reference_books=tuple(item.reference_books),
+        )
+
+    def to_item(self) -> KBItem:
+        """API 경계용 pydantic 모델 변환"""
+        return KBItem(
+            kb_id=self.kb_id,
+            domain=self.domain,
+            subcategory=self.subcategory,
+            anchor_id=self.anchor_id,
+            content=self.content,
+            is_fusion=self.is_fusion,
+            is_integrated_knowledge=self.is_integrated_knowledge,
+            reference_books=list(self.reference_books),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class KBHit:
+    """검색 결과 1건 (검증 없음, 점수는 원래 유사도)"""
+    item: KBRecord
+    similarity_score: float
+
+    def to_result(self) -> KBSearchResult:
+        """API 경계용 KBSearchResult 변환 (점수 범위 검증 포함)"""
+        return KBSearchResult(item=self.item.to_item(), similarity_score=self.similarity_score)
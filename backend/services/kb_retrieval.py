@@ -0,0 +1,260 @@
+"""KB Retrieval Backends - KB 검색 유사도 계산 백엔드 (TF-IDF / 밀집 임베딩 / 하이브리드)
+
+KBService.search/search_many는 후보 선택(top-k, 통합지식 가중치, min_score)만 담당하고
+쿼리 × KB 아이템 유사도 계산은 RetrievalBackend에 위임한다.
+
+- TfidfBackend:  TF-IDF 코사인 유사도 (기본)
+- DenseBackend:  사전 계산된 KB 임베딩 (float32, .npy 메모리 매핑) · 쿼리 임베딩 (행렬 곱 1회, exact top-k)
+- HybridBackend: alpha × dense + (1 - alpha) × tfidf 점수 융합
+
+임베딩 함수(EmbedFn: 텍스트 리스트 → (n × dim) 배열)는 주입 가능하며,
+테스트/오프라인 환경에서는 결정적 로컬 임베딩(HashingEmbedder)을 사용한다.
+"""
+import logging
+import os
+import re
+import uuid
+import zlib
+from dataclasses import replace
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+
+from backend.services.kb_index import KBIndex
+from backend.services.kb_tokenizer import get_analyzer
+
+logger = logging.getLogger(__name__)
+
+# 텍스트 리스트 → (n_texts × dim) 임베딩 배열
+EmbedFn = Callable[[List[str]], np.ndarray]
+
+BACKENDS = ("tfidf", "dense", "hybrid")
+
+
+class RetrievalBackend:
+    """검색 백엔드 인터페이스"""
+
+    name = "base"
+
+    def prepare(self, index: KBIndex, cache_dir: Optional[Path] = None) -> KBIndex:
+        """
+        새 인덱스에 백엔드 부가 데이터 준비 (기본: 없음)
+
+        인덱스는 불변이므로 필요한 데이터를 채운 새 인덱스를 반환한다.
+
+        Args:
+            index: 빌드된 KB 인덱스
+            cache_dir: 부가 데이터 캐시 디렉토리 (인덱스 스냅샷 디렉토리, 없으면 메모리에만 유지)
+        """
+        return index
+
+    def score(self, index: KBIndex, queries: List[str], domain: Optional[str] = None) -> np.ndarray:
+        """
+        쿼리 × 후보 아이템 유사도 [0, 1]
+
+        Args:
+            index: KB 인덱스
+            queries: 검색 쿼리 리스트
+            domain: 도메인 (None이거나 인덱스에 없으면 전체 KB)
+
+        Returns:
+            (n_queries × n_candidates) 유사도 매트릭스 (후보 순서 = 인덱스 행 순서)
+        """
+        raise NotImplementedError
+
+
+class TfidfBackend(RetrievalBackend):
+    """TF-IDF 코사인 유사도 (행/쿼리 모두 L2 정규화 → 내적)"""
+
+    name = "tfidf"
+
+    def score(self, index: KBIndex, queries: List[str], domain: Optional[str] = None) -> np.ndarray:
+        matrix = index.domain_matrices.get(domain) if domain else None
+        if matrix is None:
+            matrix = index.tfidf_matrix
+
+        query_matrix = index.vectorizer.transform(queries)
+        scores = query_matrix.dot(matrix.T).toarray()
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores
+
+
+class DenseBackend(RetrievalBackend):
+    """
+    밀집 임베딩 유사도
+
+    KB 아이템 임베딩은 인덱스 준비 시 1회 계산하여 스냅샷 디렉토리에
+    embeddings_{model}.npy로 저장하고, 이후에는 메모리 매핑으로 로드한다.
+    """
+
+    name = "dense"
+
+    def __init__(self, embed_fn: EmbedFn, model_name: str, batch_size: int = 64):
+        self.embed_fn = embed_fn
+        self.model_name = model_name
+        self.batch_size = batch_size
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """텍스트 → 행 단위 L2 정규화된 float32 임베딩"""
+        batches = [
+            np.asarray(self.embed_fn(texts[i:i + self.batch_size]), dtype=np.float32)
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        vectors = np.vstack(batches) if batches else np.empty((0, 0), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+    def prepare(self, index: KBIndex, cache_dir: Optional[Path] = None) -> KBIndex:
+        if not index.all_items:
+            return index
+        if index.embeddings is not None and index.embedding_model == self.model_name:
+            return index
+
+        embeddings = self._load_embeddings(index, cache_dir)
+        if embeddings is None:
+            embeddings = self.embed([item.content for item in index.all_items])
+            logger.info(
+                f"[OK] KB embeddings computed ({self.model_name}): "
+                f"{embeddings.shape[0]} items × {embeddings.shape[1]} dims"
+            )
+            embeddings = self._save_embeddings(embeddings, cache_dir)
+
+        return replace(index, embeddings=embeddings, embedding_model=self.model_name)
+
+    def score(self, index: KBIndex, queries: List[str], domain: Optional[str] = None) -> np.ndarray:
+        if index.embeddings is None or index.embedding_model != self.model_name:
+            raise RuntimeError(f"KB embeddings not prepared for model {self.model_name}")
+
+        block = index.embeddings[index.domain_slice(domain)]
+        scores = (self.embed(queries) @ block.T).astype(np.float64)
+        np.clip(scores, 0.0, 1.0, out=scores)
+        return scores
+
+    def _cache_path(self, cache_dir: Optional[Path]) -> Optional[Path]:
+        if cache_dir is None or not Path(cache_dir).is_dir():
+            return None
+        slug = re.sub(r"[^\w.-]", "_", self.model_name)
+        return Path(cache_dir) / f"embeddings_{slug}.npy"
+
+    def _load_embeddings(self, index: KBIndex, cache_dir: Optional[Path]) -> Optional[np.ndarray]:
+        """캐시된 임베딩 메모리 매핑 로드 (행 수 불일치/손상 시 None)"""
+        path = self._cache_path(cache_dir)
+        if path is None or not path.exists():
+            return None
+        try:
+            embeddings = np.load(path, mmap_mode="r")
+            if embeddings.ndim != 2 or embeddings.shape[0] != len(index.all_items):
+                logger.warning(f"[WARN] KB embeddings cache shape mismatch: {path}")
+                return None
+            logger.info(f"[OK] KB embeddings loaded ({self.model_name}): {path}")
+            return embeddings
+        except Exception as e:
+            logger.error(f"[FAIL] KB embeddings load error ({path}): {e}")
+            return None
+
+    def _save_embeddings(self, embeddings: np.ndarray, cache_dir: Optional[Path]) -> np.ndarray:
+        """임베딩 저장 후 메모리 매핑으로 다시 로드 (캐시 디렉토리 없으면 읽기 전용 메모리 배열)"""
+        path = self._cache_path(cache_dir)
+        if path is not None:
+            tmp_path = path.with_name(f".tmp_{uuid.uuid4().hex[:8]}_{path.name}")
+            try:
+                np.save(tmp_path, embeddings)
+                os.replace(tmp_path, path)
+                return np.load(path, mmap_mode="r")
+            except Exception as e:
+                logger.error(f"[FAIL] KB embeddings save error ({path}): {e}")
+                tmp_path.unlink(missing_ok=True)
+
+        embeddings.setflags(write=False)
+        return embeddings
+
+
+class HybridBackend(RetrievalBackend):
+    """TF-IDF + 밀집 임베딩 점수 선형 융합 (alpha = 밀집 점수 가중치)"""
+
+    name = "hybrid"
+
+    def __init__(self, dense: DenseBackend, alpha: float = 0.5, sparse: Optional[TfidfBackend] = None):
+        if not 0.0 <= alpha <= 1.0:
+            raise ValueError(f"alpha must be in [0, 1], got {alpha}")
+        self.dense = dense
+        self.sparse = sparse or TfidfBackend()
+        self.alpha = alpha
+
+    def prepare(self, index: KBIndex, cache_dir: Optional[Path] = None) -> KBIndex:
+        return self.dense.prepare(self.sparse.prepare(index, cache_dir), cache_dir)
+
+    def score(self, index: KBIndex, queries: List[str], domain: Optional[str] = None) -> np.ndarray:
+        dense_scores = self.dense.score(index, queries, domain)
+        sparse_scores = self.sparse.score(index, queries, domain)
+        return self.alpha * dense_scores + (1.0 - self.alpha) * sparse_scores
+
+
+class HashingEmbedder:
+    """
+    결정적 로컬 임베딩 (토큰 해싱 → 부호 있는 버킷 카운트)
+
+    외부 모델/네트워크 없이 동작하며 프로세스 간 결과가 동일하다 (crc32 해시).
+    테스트와 오프라인 개발용.
+    """
+
+    def __init__(self, dim: int = 256, analyzer: str = "char"):
+        self.dim = dim
+        self._analyze = get_analyzer(analyzer)
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in self._analyze(text):
+                h = zlib.crc32(token.encode("utf-8"))
+                vectors[row, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        return vectors
+
+
+class OpenAIEmbedder:
+    """OpenAI 임베딩 API (langchain_openai, 최초 호출 시 클라이언트 생성)"""
+
+    def __init__(self, model: str = "text-embedding-3-small"):
+        self.model = model
+        self._client = None
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        if self._client is None:
+            from langchain_openai import OpenAIEmbeddings
+            self._client = OpenAIEmbeddings(model=self.model)
+        return np.asarray(self._client.embed_documents(list(texts)), dtype=np.float32)
+
+
+def create_backend(
+    name: str = "tfidf",
+    embedding_model: str = "text-embedding-3-small",
+    alpha: float = 0.5
+) -> RetrievalBackend:
+    """
+    설정값으로 검색 백엔드 생성
+
+    Args:
+        name: "tfidf" | "dense" | "hybrid"
+        embedding_model: 임베딩 모델 ("hashing-{dim}"이면 로컬 HashingEmbedder)
+        alpha: hybrid 밀집 점수 가중치
+
+    Raises:
+        ValueError: 알 수 없는 백엔드 이름
+    """
+    if name == "tfidf":
+        return TfidfBackend()
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown KB retrieval backend: {name} (expected one of {BACKENDS})")
+
+    if embedding_model.startswith("hashing"):
+        _, _, dim = embedding_model.partition("-")
+        embed_fn = HashingEmbedder(dim=int(dim) if dim else 256)
+    else:
+        embed_fn = OpenAIEmbedder(embedding_model)
+
+    dense = DenseBackend(embed_fn, model_name=embedding_model)
+    if name == "dense":
+        return dense
+    return HybridBackend(dense, alpha=alpha)
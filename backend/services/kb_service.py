@@ -1,194 +1,600 @@
 """Knowledge Base Service - KB 파일 파싱 및 검색"""
-import re
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import Counter
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Optional, Dict
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from typing import Any, FrozenSet, List, Mapping, Optional, Dict, Tuple
+from scipy.sparse import csr_matrix
 import numpy as np
 import logging
 
-from backend.models.schemas import KBItem, KBSearchResult, KBStats
+from backend.core.domain_registry import DomainRegistry, domain_registry
+from backend.models.schemas import KBItem, KBStats
+from backend.services.kb_index import KBIndex
+from backend.services.kb_integrity import build_integrity_report, format_integrity_report
+from backend.services.kb_parser import parse_kb_file, parse_kb_file_timed
+from backend.services.kb_query_cache import KBQueryCache, query_digest
+from backend.services.kb_record import KBHit
+from backend.services.kb_retrieval import RetrievalBackend, TfidfBackend
+from backend.services.kb_snapshot import (
+    KBQueryVectorizer,
+    compute_source_hash,
+    load_snapshot,
+    save_snapshot,
+)
+from backend.services.kb_tokenizer import ANALYZERS, get_analyzer
 
 logger = logging.getLogger(__name__)
 
+# 생성자 인자 미지정 표시 (max_features=None은 "어휘 제한 없음"이므로 별도 구분)
+_UNSET = object()
+
 
 class KBService:
     """KB 파일 파싱 및 검색 서비스"""
     
+    # 도메인 목록/매핑 (설정 파일 기반 레지스트리, backend/core/domains.json)
     # KB 파일명용 도메인 (슬래시 없음)
-    KB_DOMAINS = ["경제경영", "과학기술", "역사사회", "인문자기계발"]
+    KB_DOMAINS = domain_registry.kb_domains
     
     # DB/CSV 표준 도메인 (슬래시 있음)
-    DB_DOMAINS = ["경제/경영", "과학/기술", "역사/사회", "인문/자기계발"]
+    DB_DOMAINS = domain_registry.db_domains
     
     # 매핑
-    DOMAIN_MAPPING = {
-        "경제/경영": "경제경영",
-        "과학/기술": "과학기술",
-        "역사/사회": "역사사회",
-        "인문/자기계발": "인문자기계발"
-    }
+    DOMAIN_MAPPING = domain_registry.db_to_kb
     
     # 역매핑
-    KB_TO_DB = {v: k for k, v in DOMAIN_MAPPING.items()}
+    KB_TO_DB = domain_registry.kb_to_db
+    
+    # TF-IDF 어휘 상한 (None이면 제한 없음, morpheme 분석기 기준 전체 어휘 약 1.5k)
+    MAX_FEATURES = None
+    
+    # TF-IDF 분석기 ("word" | "morpheme" | "char", kb_tokenizer 참고)
+    # 벤치마크(backend/scripts/benchmark_kb_retrieval.py) 기준 morpheme이 재현율 최고
+    ANALYZER = "morpheme"
+    
+    # char 분석기 n-gram 범위
+    NGRAM_RANGE = (2, 3)
+    
+    # 도메인별 KB 파일 병렬 파싱 (프로세스 풀, 도메인 수/KB 크기가 클 때 사용)
+    PARALLEL_LOAD = False
+    
+    # 검색 결과 LRU 캐시 (최대 항목 수, 0이면 비활성화) / 만료 시간 (초, None이면 만료 없음)
+    QUERY_CACHE_SIZE = 1024
+    QUERY_CACHE_TTL = 3600.0
+    
+    # 비동기 검색(asearch) 공유 스레드 풀 크기 (유사도 계산 중 NumPy/SciPy가 GIL 해제)
+    SEARCH_WORKERS = 4
+    _search_executor: Optional[ThreadPoolExecutor] = None
+    _search_executor_lock = threading.Lock()
     
-    def __init__(self, kb_dir: str = None):
+    def __init__(
+        self,
+        kb_dir: str = None,
+        index_dir: str = None,
+        use_snapshot: bool = True,
+        analyzer: Optional[str] = None,
+        max_features: Any = _UNSET,
+        ngram_range: Optional[Tuple[int, int]] = None,
+        backend: Optional[RetrievalBackend] = None,
+        parallel_load: Optional[bool] = None,
+        max_workers: Optional[int] = None,
+        registry: Optional[DomainRegistry] = None,
+        query_cache_size: Optional[int] = None,
+        query_cache_ttl: Any = _UNSET
+    ):
+        # backend/services/kb_service.py → backend/ → project_root/
+        project_root = Path(__file__).parent.parent.parent
         # 프로젝트 루트의 docs/ 디렉토리 찾기
         if kb_dir is None:
-            # backend/services/kb_service.py → backend/ → project_root/
-            project_root = Path(__file__).parent.parent.parent
             kb_dir = project_root / "docs"
+        # 인덱스 스냅샷 저장 위치 (.cache/kb_index/{source_hash}/)
+        if index_dir is None:
+            index_dir = project_root / ".cache" / "kb_index"
         self.kb_dir = Path(kb_dir)
-        self.kb_items: Dict[str, List[KBItem]] = {}
-        self.all_items: List[KBItem] = []
-        self.vectorizer: Optional[TfidfVectorizer] = None
-        self.tfidf_matrix = None
+        self.index_dir = Path(index_dir)
+        self.use_snapshot = use_snapshot
+        # 인덱싱 파라미터 (지정 시 클래스 기본값 대체, max_features=None은 어휘 제한 없음)
+        if analyzer is not None:
+            if analyzer not in ANALYZERS:
+                raise ValueError(f"Unknown KB analyzer: {analyzer} (expected one of {ANALYZERS})")
+            self.ANALYZER = analyzer
+        if max_features is not _UNSET:
+            self.MAX_FEATURES = max_features
+        if ngram_range is not None:
+            self.NGRAM_RANGE = tuple(ngram_range)
+        if parallel_load is not None:
+            self.PARALLEL_LOAD = parallel_load
+        # 도메인 레지스트리 (지정 시 전역 설정 대체 → KB 파일 탐색/도메인별 인덱스 범위)
+        self.registry = registry or domain_registry
+        if registry is not None:
+            self.KB_DOMAINS = registry.kb_domains
+            self.DB_DOMAINS = registry.db_domains
+            self.DOMAIN_MAPPING = registry.db_to_kb
+            self.KB_TO_DB = registry.kb_to_db
+        # 병렬 파싱 워커 수 상한 (None이면 CPU 수)
+        self.max_workers = max_workers
+        # 마지막 인덱스 빌드 단계별 소요 시간 (ms)
+        self._load_timings: Dict[str, Any] = {}
+        # 검색 결과 캐시 (키에 인덱스 버전 포함, 인덱스/백엔드 교체 시 비움)
+        self.query_cache = KBQueryCache(
+            self.QUERY_CACHE_SIZE if query_cache_size is None else query_cache_size,
+            self.QUERY_CACHE_TTL if query_cache_ttl is _UNSET else query_cache_ttl
+        )
+        # 유사도 계산 백엔드 (기본 TF-IDF, set_backend()로 교체)
+        self._backend: RetrievalBackend = backend or TfidfBackend()
+        # 현재 인덱스 (불변 스냅샷, 재로드 시 참조만 원자적으로 교체)
+        self._index: KBIndex = KBIndex.empty()
+        self._index_version = 0
+        # 지연 로딩 상태 (최초 사용 시 1회 로드)
+        self._loaded = False
+        self._load_lock = threading.RLock()
+        # KB 파일 변경 감시 스레드
+        self._watcher_thread: Optional[threading.Thread] = None
+        self._watcher_stop = threading.Event()
+    
+    # === 현재 인덱스 접근 (읽기 전용) ===
+    
+    @property
+    def index(self) -> KBIndex:
+        """현재 KB 인덱스 스냅샷"""
+        return self._index
+    
+    @property
+    def kb_items(self) -> Mapping[str, Tuple[KBItem, ...]]:
+        return self._index.kb_items
+    
+    @property
+    def all_items(self) -> Tuple[KBItem, ...]:
+        return self._index.all_items
+    
+    @property
+    def vectorizer(self) -> Optional[KBQueryVectorizer]:
+        return self._index.vectorizer
+    
+    @property
+    def tfidf_matrix(self) -> Optional[csr_matrix]:
+        return self._index.tfidf_matrix
+    
+    @property
+    def domain_rows(self) -> Mapping[str, np.ndarray]:
+        return self._index.domain_rows
+    
+    @property
+    def domain_matrices(self) -> Mapping[str, csr_matrix]:
+        return self._index.domain_matrices
+    
+    @property
+    def backend(self) -> RetrievalBackend:
+        """현재 검색 백엔드"""
+        return self._backend
+    
+    def set_backend(self, backend: RetrievalBackend):
+        """
+        검색 백엔드 교체
+        
+        이미 로드된 경우 새 백엔드용 데이터(예: KB 임베딩)를 준비한 인덱스로 먼저 교체한 뒤
+        백엔드를 바꾼다 (검색은 백엔드 → 인덱스 순으로 참조하므로 준비 안 된 인덱스를 보지 않음)
+        """
+        with self._load_lock:
+            if self._loaded:
+                self._swap_index(backend.prepare(self._index, self._cache_dir(self._index.source_hash)))
+            self._backend = backend
+            self.query_cache.clear()
+        logger.info(f"[KB-SERVICE] Retrieval backend set: {backend.name}")
+    
+    def configure_query_cache(self, max_size: int, ttl: Optional[float] = None):
+        """검색 결과 캐시 설정 교체 (max_size=0이면 비활성화, 기존 항목/카운터 초기화)"""
+        self.query_cache = KBQueryCache(max_size, ttl)
+        logger.info(f"[KB-SERVICE] Query cache: max_size={max_size}, ttl={ttl}")
+    
+    @property
+    def is_loaded(self) -> bool:
+        """KB 로드 완료 여부"""
+        return self._loaded
+    
+    def ensure_loaded(self) -> bool:
+        """
+        KB 지연 로딩 (스레드 안전, 최초 호출 시에만 로드)
+        
+        Returns:
+            로드 성공 여부
+        """
+        if self._loaded:
+            return True
+        
+        with self._load_lock:
+            if not self._loaded:
+                logger.info("[KB-SERVICE] Loading KB on first use...")
+                try:
+                    load_stats = self.load_all_domains()
+                    logger.info(f"[KB-SERVICE] KB loaded successfully: {load_stats}")
+                except Exception as e:
+                    logger.error(f"[KB-SERVICE] KB load failed: {e}")
+        
+        return self._loaded
         
     def load_all_domains(self) -> Dict[str, int]:
-        """모든 도메인 KB 파일 로드"""
-        result = {}
-        for domain in self.KB_DOMAINS:
-            count = self.load_domain(domain)
-            result[domain] = count
-            logger.info(f"[OK] {domain}: {count} items loaded")
-        
-        # 전체 아이템 리스트 생성
-        self.all_items = []
-        for items in self.kb_items.values():
-            self.all_items.extend(items)
+        """
+        모든 도메인 KB 파일 로드
         
-        # TF-IDF 벡터라이저 준비
-        self._prepare_vectorizer()
+        KB 파일 내용 해시가 일치하는 인덱스 스냅샷이 있으면 파싱/학습 없이 로드하고,
+        없으면 파싱 + TF-IDF 학습 후 스냅샷을 저장한다.
+        새 인덱스를 완전히 빌드한 뒤 교체하므로 진행 중인 검색에는 영향이 없다.
+        """
+        with self._load_lock:
+            source_hash = compute_source_hash(self._kb_files(), self._index_params())
+            self._swap_index(self._build_index(source_hash))
+            self._loaded = True
         
-        logger.info(f"[OK] Total {len(self.all_items)} KB items loaded")
-        return result
+        return {domain: len(items) for domain, items in self.kb_items.items()}
     
-    def load_domain(self, domain: str) -> int:
-        """특정 도메인 KB 파일 로드"""
-        file_path = self.kb_dir / f"지식베이스생성_{domain}_구글스튜디오.md"
+    def reload(self, force: bool = False) -> Dict[str, Any]:
+        """
+        KB 재로드 (핫 리로드)
         
-        if not file_path.exists():
-            logger.error(f"[FAIL] KB file not found: {file_path}")
-            return 0
+        KB 파일 내용이 바뀐 경우에만 새 인덱스를 빌드하여 원자적으로 교체한다.
         
-        items = self._parse_kb_file(file_path, domain)
-        self.kb_items[domain] = items
-        return len(items)
+        Args:
+            force: 내용 해시가 같아도 강제 재빌드
+        
+        Returns:
+            {"reloaded": bool, **get_index_status()}
+        """
+        with self._load_lock:
+            source_hash = compute_source_hash(self._kb_files(), self._index_params())
+            
+            if self._loaded and not force and source_hash == self._index.source_hash:
+                logger.info(f"[KB-SERVICE] KB unchanged ({source_hash}), reload skipped")
+                return {"reloaded": False, **self.get_index_status()}
+            
+            logger.info("[KB-SERVICE] Rebuilding KB index...")
+            new_index = self._build_index(source_hash)
+            self._swap_index(new_index)
+            self._loaded = True
+        
+        logger.info(
+            f"[KB-SERVICE] KB index swapped: v{new_index.version} "
+            f"({len(new_index.all_items)} items)"
+        )
+        return {"reloaded": True, **self.get_index_status()}
     
-    def _parse_kb_file(self, file_path: Path, domain: str) -> List[KBItem]:
-        """KB 파일 파싱 (개별 인사이트 + 통합지식)"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+    def get_index_status(self) -> Dict[str, Any]:
+        """현재 인덱스 상태 (버전, 해시, 아이템 수, 빌드 시각)"""
+        index = self._index
+        return {
+            "loaded": self._loaded,
+            "version": index.version,
+            "source_hash": index.source_hash,
+            "total_items": len(index.all_items),
+            "items_by_domain": {domain: len(items) for domain, items in index.kb_items.items()},
+            "built_at": index.built_at.isoformat(),
+            "backend": self._backend.name,
+            "embedding_model": index.embedding_model,
+            "load_timings_ms": self._load_timings,
+            "query_cache": self.query_cache.stats(),
+        }
+    
+    def start_file_watcher(self, interval: float = 5.0) -> bool:
+        """
+        KB 파일 변경 감시 시작 (mtime/크기 폴링 → 변경 감지 시 재로드)
         
-        items = []
-        current_subcategory = None
-        kb_index = 1
+        Args:
+            interval: 폴링 주기 (초)
         
-        # 소분류 섹션별로 분할
-        lines = content.split('\n')
+        Returns:
+            새로 시작했는지 여부 (이미 실행 중이면 False)
+        """
+        if self._watcher_thread and self._watcher_thread.is_alive():
+            return False
         
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            
-            # 소분류 헤더 감지: ### **소분류: XXX**
-            subcategory_match = re.match(r'###\s+\*\*소분류:\s*(.+?)\*\*', line)
-            if subcategory_match:
-                current_subcategory = subcategory_match.group(1).strip()
-                i += 1
+        self._watcher_stop.clear()
+        self._watcher_thread = threading.Thread(
+            target=self._watch_kb_files,
+            args=(interval,),
+            name="kb-file-watcher",
+            daemon=True
+        )
+        self._watcher_thread.start()
+        logger.info(f"[KB-SERVICE] File watcher started (interval={interval}s)")
+        return True
+    
+    def stop_file_watcher(self):
+        """KB 파일 변경 감시 중지"""
+        self._watcher_stop.set()
+        if self._watcher_thread:
+            self._watcher_thread.join(timeout=5.0)
+            self._watcher_thread = None
+            logger.info("[KB-SERVICE] File watcher stopped")
+    
+    def _kb_files_signature(self) -> Tuple:
+        """KB 파일 (mtime, 크기) 서명 - 변경 감지용 (내용 해시보다 저렴)"""
+        signature = []
+        for domain, file_path in self._kb_files():
+            try:
+                stat = file_path.stat()
+                signature.append((domain, stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append((domain, None, None))
+        return tuple(signature)
+    
+    def _watch_kb_files(self, interval: float):
+        """감시 루프 (파일 서명 변경 시 reload → 내용이 실제로 바뀐 경우에만 재빌드)"""
+        last_signature = self._kb_files_signature()
+        
+        while not self._watcher_stop.wait(interval):
+            signature = self._kb_files_signature()
+            if signature == last_signature:
                 continue
+            last_signature = signature
             
-            # 테이블 행 파싱: | 인사이트 내용 | 참고 도서 |
-            if current_subcategory and line.strip().startswith('|') and not line.strip().startswith('| :'):
-                parts = [p.strip() for p in line.split('|')]
-                
-                # 유효한 테이블 행인지 확인 (최소 4개 파트: '', 인사이트, 도서, '')
-                if len(parts) >= 4 and parts[1] and parts[2]:
-                    insight_text = parts[1]
-                    books_text = parts[2]
-                    
-                    # 헤더 행 건너뛰기
-                    if '핵심 인사이트' in insight_text or '참고 도서' in books_text:
-                        i += 1
-                        continue
-                    
-                    # 융합형 플래그 감지
-                    is_fusion = '**(융합형)**' in insight_text
-                    if is_fusion:
-                        insight_text = insight_text.replace('**(융합형)**', '').strip()
-                    
-                    # 참고 도서 파싱 (쉼표로 구분)
-                    reference_books = [b.strip() for b in books_text.split(',')]
-                    
-                    # anchor_id 생성
-                    anchor_id = f"{domain}_{current_subcategory.replace('/', '_')}_{kb_index:03d}"
-                    
-                    # KBItem 생성
-                    item = KBItem(
-                        kb_id=f"kb_{domain}_{kb_index:04d}",
-                        domain=domain,
-                        subcategory=current_subcategory,
-                        anchor_id=anchor_id,
-                        content=insight_text,
-                        is_fusion=is_fusion,
-                        is_integrated_knowledge=False,
-                        reference_books=reference_books
-                    )
-                    items.append(item)
-                    kb_index += 1
-            
-            # 통합지식 섹션 감지: **통합 지식** 또는 **통합지식**
-            elif current_subcategory and re.match(r'\*\*통합\s*지식\*\*', line):
-                # 다음 줄부터 통합지식 내용 수집
-                integrated_content_lines = []
-                i += 1
-                
-                while i < len(lines):
-                    next_line = lines[i]
-                    # 다음 소분류 섹션이 시작되면 중단
-                    if re.match(r'###\s+\*\*소분류:', next_line):
-                        break
-                    # 내용 수집 (빈 줄 제외)
-                    if next_line.strip():
-                        integrated_content_lines.append(next_line.strip())
-                    i += 1
-                
-                # 통합지식 내용이 있으면 KBItem 생성
-                if integrated_content_lines:
-                    integrated_content = ' '.join(integrated_content_lines)
-                    
-                    # 통합지식 anchor_id: {domain}·{subcategory} 통합지식
-                    anchor_id = f"{domain}·{current_subcategory} 통합지식"
-                    
-                    item = KBItem(
-                        kb_id=f"kb_{domain}_integrated_{current_subcategory}",
-                        domain=domain,
-                        subcategory=current_subcategory,
-                        anchor_id=anchor_id,
-                        content=integrated_content,
-                        is_fusion=False,
-                        is_integrated_knowledge=True,
-                        reference_books=[]  # 통합지식은 참고 도서 없음
-                    )
-                    items.append(item)
-                    logger.info(f"[OK] Parsed integrated knowledge: {anchor_id}")
-                
+            # 아직 로드 전이면 최초 로드 시 최신 파일이 반영됨
+            if not self._loaded:
                 continue
             
-            i += 1
+            logger.info("[KB-SERVICE] KB file change detected")
+            try:
+                self.reload()
+            except Exception as e:
+                logger.error(f"[KB-SERVICE] KB reload failed (keeping current index): {e}")
+    
+    def _swap_index(self, new_index: KBIndex):
+        """인덱스 참조 교체 (단일 대입 → 원자적), 이전 인덱스 기준 캐시 항목 제거"""
+        self._index = new_index
+        self.query_cache.clear()
+    
+    def _next_version(self) -> int:
+        self._index_version += 1
+        return self._index_version
+    
+    def _build_index(self, source_hash: str) -> KBIndex:
+        """
+        새 인덱스 빌드 (현재 인덱스는 건드리지 않음)
+        
+        use_snapshot이면 해시가 일치하는 스냅샷을 로드하고, 없으면 빌드 후 스냅샷 저장.
+        이후 검색 백엔드 데이터(예: KB 임베딩)를 준비한다.
+        
+        Args:
+            source_hash: KB 원본 파일 내용 해시
+        """
+        index = self._check_integrity(self._load_or_fit_index(source_hash))
+        return self._backend.prepare(index, self._cache_dir(source_hash))
+    
+    def _check_integrity(self, index: KBIndex) -> KBIndex:
+        """로드 시 무결성 점검 (Counter 기반 선형 패스) → 리포트를 포함한 인덱스 반환"""
+        report = build_integrity_report(index.kb_items, self._kb_files())
+        
+        if not report.ok or report.has_warnings:
+            for line in format_integrity_report(report):
+                if "[FAIL]" in line or "[WARN]" in line:
+                    logger.warning(f"[KB-INTEGRITY] {line.strip()}")
+        status = "passed" if report.ok else "FAILED"
+        logger.info(f"[KB-INTEGRITY] Integrity check {status} ({report.elapsed_ms:.1f}ms)")
+        
+        return replace(index, integrity=report)
+    
+    def _cache_dir(self, source_hash: Optional[str]) -> Optional[Path]:
+        """백엔드 부가 데이터 캐시 위치 (스냅샷 디렉토리, 스냅샷 미사용 시 None)"""
+        if not self.use_snapshot or not source_hash:
+            return None
+        return self.index_dir / source_hash
+    
+    def _load_or_fit_index(self, source_hash: str) -> KBIndex:
+        """스냅샷 로드 또는 파싱 + TF-IDF 학습 (단계별 소요 시간 기록)"""
+        if self.use_snapshot:
+            start = time.perf_counter()
+            snapshot = load_snapshot(self.index_dir, source_hash)
+            if snapshot is not None:
+                index = KBIndex.build(
+                    snapshot["kb_items"],
+                    snapshot["vectorizer"],
+                    snapshot["tfidf_matrix"],
+                    version=self._next_version(),
+                    source_hash=source_hash
+                )
+                self._load_timings = {"mode": "snapshot", "snapshot": _elapsed_ms(start)}
+                logger.info(
+                    f"[OK] KB index snapshot loaded ({source_hash}): "
+                    f"{len(index.all_items)} items, {index.tfidf_matrix.shape[1]} features "
+                    f"({self._load_timings['snapshot']:.1f}ms)"
+                )
+                return index
+        
+        timings: Dict[str, Any] = {}
+        kb_items = self._parse_all_domains(timings)
+        
+        # TF-IDF 벡터라이저 준비
+        start = time.perf_counter()
+        all_items = [item for items in kb_items.values() for item in items]
+        vectorizer, tfidf_matrix = self._prepare_vectorizer(all_items)
+        timings["fit"] = _elapsed_ms(start)
+        self._load_timings = timings
+        logger.info(
+            f"[KB-SERVICE] Parse {timings['parse_total']:.1f}ms ({timings['mode']}), "
+            f"fit {timings['fit']:.1f}ms"
+        )
+        
+        index = KBIndex.build(
+            kb_items,
+            vectorizer,
+            tfidf_matrix,
+            version=self._next_version(),
+            source_hash=source_hash
+        )
+        
+        if self.use_snapshot and vectorizer is not None:
+            save_snapshot(
+                self.index_dir,
+                source_hash,
+                index.kb_items,
+                vectorizer.vocabulary_,
+                vectorizer.idf_,
+                tfidf_matrix,
+                analyzer=vectorizer.analyzer,
+                ngram_range=vectorizer.ngram_range,
+                params=self._index_params()
+            )
+        
+        logger.info(f"[OK] Total {len(index.all_items)} KB items loaded")
+        return index
+    
+    def _kb_file_path(self, domain: str) -> Path:
+        """도메인 KB 파일 경로 (레지스트리의 파일명 설정)"""
+        return self.kb_dir / self.registry.kb_file(domain)
+    
+    def _kb_files(self) -> List[tuple]:
+        """[(domain, file_path)] (레지스트리 KB_DOMAINS 순서)"""
+        return [(domain, self._kb_file_path(domain)) for domain in self.KB_DOMAINS]
+    
+    def _index_params(self) -> Dict:
+        """스냅샷 해시에 포함되는 인덱싱 파라미터"""
+        params = {"max_features": self.MAX_FEATURES, "analyzer": self.ANALYZER}
+        if self.ANALYZER == "char":
+            params["ngram_range"] = list(self.NGRAM_RANGE)
+        return params
+    
+    def _parse_all_domains(self, timings: Dict[str, Any]) -> Dict[str, List[KBItem]]:
+        """
+        모든 도메인 KB 파일 파싱
+        
+        PARALLEL_LOAD면 도메인별로 프로세스 풀에서 파싱한 뒤 KB_DOMAINS 순서로 병합하므로
+        완료 순서와 무관하게 all_items 순서(= 매트릭스 행 순서)가 항상 같다.
+        
+        Args:
+            timings: 단계별 소요 시간 기록 대상 (parse:{domain}, parse_total, mode)
+        
+        Returns:
+            {domain: items} (KB_DOMAINS 순서, 파일 없는 도메인 제외)
+        """
+        start = time.perf_counter()
+        
+        files = []
+        for domain, file_path in self._kb_files():
+            if file_path.exists():
+                files.append((domain, file_path))
+            else:
+                logger.error(f"[FAIL] KB file not found: {file_path}")
+        
+        results = None
+        if self.PARALLEL_LOAD and len(files) > 1:
+            results = self._parse_parallel(files)
+        timings["mode"] = "parallel" if results is not None else "sequential"
+        
+        if results is None:
+            results = {}
+            for domain, file_path in files:
+                domain_start = time.perf_counter()
+                items = self._parse_kb_file(file_path, domain)
+                results[domain] = (items, time.perf_counter() - domain_start)
+        
+        kb_items = {}
+        for domain, _ in files:
+            items, elapsed = results[domain]
+            kb_items[domain] = items
+            timings[f"parse:{domain}"] = elapsed * 1000
+            logger.info(f"[OK] {domain}: {len(items)} items loaded ({elapsed * 1000:.1f}ms)")
+        
+        timings["parse_total"] = _elapsed_ms(start)
+        return kb_items
+    
+    def _parse_parallel(self, files: List[Tuple[str, Path]]) -> Optional[Dict[str, Tuple[List[KBItem], float]]]:
+        """
+        도메인별 프로세스 풀 파싱
+        
+        스레드(워밍업/파일 감시)가 있는 서버 프로세스에서 fork는 락 상태를 복제할 수 있으므로
+        spawn 컨텍스트를 사용한다. 실패 시 None (순차 파싱으로 대체).
         
-        return items
+        Returns:
+            {domain: (items, 소요 시간(초))} 또는 None
+        """
+        workers = min(len(files), self.max_workers or os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn")
+            ) as pool:
+                futures = {
+                    domain: pool.submit(parse_kb_file_timed, file_path, domain)
+                    for domain, file_path in files
+                }
+                return {domain: future.result() for domain, future in futures.items()}
+        except Exception as e:
+            logger.warning(f"[WARN] Parallel KB parsing failed, falling back to sequential: {e}")
+            return None
+    
+    def _parse_domain(self, domain: str) -> Optional[List[KBItem]]:
+        """도메인 KB 파일 파싱 (파일 없으면 None)"""
+        file_path = self._kb_file_path(domain)
+        
+        if not file_path.exists():
+            logger.error(f"[FAIL] KB file not found: {file_path}")
+            return None
+        
+        return self._parse_kb_file(file_path, domain)
     
-    def _prepare_vectorizer(self):
-        """TF-IDF 벡터라이저 준비"""
-        if not self.all_items:
+    def load_domain(self, domain: str) -> int:
+        """특정 도메인 KB 파일 로드 (해당 도메인만 다시 파싱하여 새 인덱스로 교체)"""
+        items = self._parse_domain(domain)
+        if items is None:
+            return 0
+        
+        with self._load_lock:
+            kb_items = dict(self.kb_items)
+            kb_items[domain] = items
+            all_items = [item for domain_items in kb_items.values() for item in domain_items]
+            vectorizer, tfidf_matrix = self._prepare_vectorizer(all_items)
+            index = KBIndex.build(kb_items, vectorizer, tfidf_matrix, version=self._next_version())
+            self._swap_index(self._backend.prepare(self._check_integrity(index)))
+            self._loaded = True
+        
+        return len(items)
+    
+    def _parse_kb_file(self, file_path: Path, domain: str) -> List[KBItem]:
+        """KB 파일 파싱 (개별 인사이트 + 통합지식, 단일 패스 스트리밍 파서)"""
+        return parse_kb_file(file_path, domain)
+    
+    def _prepare_vectorizer(
+        self, all_items: List[KBItem]
+    ) -> Tuple[Optional[KBQueryVectorizer], Optional[csr_matrix]]:
+        """
+        TF-IDF 벡터라이저 준비
+        
+        Returns:
+            (쿼리 벡터라이저, 행 단위 L2 정규화된 TF-IDF 매트릭스)
+        """
+        if not all_items:
             logger.warning("[WARN] No KB items to vectorize")
-            return
+            return None, None
         
-        corpus = [item.content for item in self.all_items]
-        self.vectorizer = TfidfVectorizer(max_features=1000)
-        self.tfidf_matrix = self.vectorizer.fit_transform(corpus)
-        logger.info(f"[OK] TF-IDF vectorizer prepared with {len(corpus)} documents")
+        # scikit-learn은 학습 시에만 필요 (스냅샷 로드 경로에서는 import하지 않음)
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.preprocessing import normalize
+        
+        corpus = [item.content for item in all_items]
+        # 학습/쿼리 모두 kb_tokenizer 분석기 사용 (토큰화 일치 보장)
+        tfidf = TfidfVectorizer(
+            analyzer=get_analyzer(self.ANALYZER, self.NGRAM_RANGE),
+            max_features=self.MAX_FEATURES
+        )
+        # 행 단위 L2 정규화 → 코사인 유사도 = 내적 (검색 시 재정규화 불필요)
+        tfidf_matrix = normalize(tfidf.fit_transform(corpus), norm="l2").tocsr()
+        tfidf_matrix.sort_indices()
+        # 쿼리 벡터화는 학습된 어휘/IDF만 사용 (스냅샷 로드 시와 동일한 경로)
+        vectorizer = KBQueryVectorizer(
+            tfidf.vocabulary_, tfidf.idf_, analyzer=self.ANALYZER, ngram_range=self.NGRAM_RANGE
+        )
+        
+        logger.info(
+            f"[OK] TF-IDF vectorizer prepared with {len(corpus)} documents "
+            f"(analyzer={self.ANALYZER}, features={tfidf_matrix.shape[1]})"
+        )
+        return vectorizer, tfidf_matrix
     
     def search(
         self,
@@ -197,9 +603,9 @@ class KBService:
         top_k: int = 5,
         min_score: float = 0.0,
         prioritize_integrated: bool = True
-    ) -> List[KBSearchResult]:
+    ) -> List[KBHit]:
         """
-        KB 검색 (TF-IDF 유사도 기반)
+        KB 검색 (검색 백엔드 유사도 기반, 기본 TF-IDF)
         
         Args:
             query: 검색 쿼리
@@ -209,122 +615,299 @@ class KBService:
             prioritize_integrated: 통합지식 우선 반환 여부
         
         Returns:
-            검색 결과 리스트 (통합지식 우선)
+            검색 결과 리스트 (통합지식 우선, 경량 KBHit → API 응답 시 to_result()로 변환)
         """
-        # 도메인 필터링
-        candidates = self.all_items
-        if domain and domain in self.kb_items:
-            candidates = self.kb_items[domain]
+        self.ensure_loaded()
+        # 검색 시작 시점의 백엔드/인덱스만 사용 (재로드와 무관하게 일관된 스냅샷)
+        backend = self._backend
+        index = self._index
         
-        if not candidates or not self.vectorizer:
-            logger.warning("[WARN] No candidates or vectorizer not initialized")
-            return []
+        # 캐시 키: 정규화 쿼리 해시 + 검색 파라미터 + 인덱스 버전/백엔드
+        cache_key = (
+            "search", query_digest(query), domain, top_k, min_score, prioritize_integrated,
+            index.version, backend.name, index.embedding_model
+        )
+        cached = self.query_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
         
-        # 쿼리 벡터화
-        try:
-            query_vector = self.vectorizer.transform([query])
-        except Exception as e:
-            logger.error(f"[FAIL] Vectorization error: {e}")
+        ranked = self._search_rows(index, backend, query, domain, top_k, min_score, prioritize_integrated)
+        if ranked is None:
             return []
+        rows, scores = ranked
+        records = index.records
+        hits = tuple(KBHit(records[row], score) for row, score in zip(rows.tolist(), scores.tolist()))
+        self.query_cache.put(cache_key, hits)
+        return list(hits)
+    
+    def search_indices(
+        self,
+        query: str,
+        domain: Optional[str] = None,
+        top_k: int = 5,
+        min_score: float = 0.0,
+        prioritize_integrated: bool = True
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        KB 검색 (원시 배열 반환, 결과 객체 생성 없음)
         
-        # 후보군에 대한 TF-IDF 매트릭스 생성
-        candidate_indices = [self.all_items.index(item) for item in candidates if item in self.all_items]
-        if not candidate_indices:
-            return []
+        대량 검색/평가처럼 결과 객체가 필요 없는 호출용. 순위는 search()와 동일.
         
-        candidate_matrix = self.tfidf_matrix[candidate_indices]
+        Returns:
+            (행 인덱스, 유사도) 배열 쌍 (순위순, 행 인덱스는 검색 시점 index.all_items 기준)
+        """
+        self.ensure_loaded()
+        backend = self._backend
+        index = self._index
+        ranked = self._search_rows(index, backend, query, domain, top_k, min_score, prioritize_integrated)
+        if ranked is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        return ranked
+    
+    def _search_rows(
+        self,
+        index: KBIndex,
+        backend: RetrievalBackend,
+        query: str,
+        domain: Optional[str],
+        top_k: int,
+        min_score: float,
+        prioritize_integrated: bool
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """단일 쿼리 검색 → (전체 행 인덱스, 원래 유사도), 후보 없음/검색 오류 시 None"""
+        # 도메인 필터링 (후보군 = 도메인 행 구간)
+        block = index.domain_slice(domain)
         
-        # 유사도 계산
-        similarities = cosine_similarity(query_vector, candidate_matrix)[0]
+        if block.stop <= block.start or not index.vectorizer:
+            logger.warning("[WARN] No candidates or vectorizer not initialized")
+            return None
         
-        # 통합지식 우선 정렬
-        if prioritize_integrated:
-            # (is_integrated_knowledge, similarity) 튜플로 정렬
-            scored_candidates = []
-            for idx, score in enumerate(similarities):
-                item = candidates[idx]
-                # 통합지식이면 점수에 0.05 가중치 추가 (우선순위 향상)
-                adjusted_score = score + (0.05 if item.is_integrated_knowledge else 0.0)
-                scored_candidates.append((idx, adjusted_score, score))  # (idx, adjusted, original)
-            
-            # adjusted_score 기준으로 정렬
-            scored_candidates.sort(key=lambda x: x[1], reverse=True)
-            top_candidates = scored_candidates[:top_k]
-            
-            results = []
-            for idx, adjusted_score, original_score in top_candidates:
-                if original_score >= min_score:
-                    results.append(KBSearchResult(
-                        item=candidates[idx],
-                        similarity_score=original_score  # 원래 점수 반환
-                    ))
-        else:
-            # 기존 로직 (유사도만으로 정렬)
-            top_indices = np.argsort(similarities)[-top_k:][::-1]
-            
-            results = []
-            for idx in top_indices:
-                score = float(similarities[idx])
-                if score >= min_score:
-                    results.append(KBSearchResult(
-                        item=candidates[idx],
-                        similarity_score=score
-                    ))
+        # 유사도 계산 (쿼리당 행렬 곱 1회)
+        try:
+            similarities = backend.score(index, [query], domain)[0]
+        except Exception as e:
+            logger.error(f"[FAIL] Retrieval error ({backend.name}): {e}")
+            return None
         
-        return results
+        # 통합지식 우선: 사전 계산된 가산치 벡터를 더한 점수로 순위 결정 (반환 점수는 원래 유사도)
+        bonus = index.integrated_bonus[block] if prioritize_integrated else None
+        local = self._select_top_k(similarities, bonus, top_k, min_score)
+        return local + block.start, similarities[local]
+    
+    def search_many(
+        self,
+        queries: List[str],
+        domains: Optional[List[str]] = None,
+        top_k: int = 5,
+        min_score: float = 0.0,
+        prioritize_integrated: bool = True
+    ) -> List[Dict[str, List[KBHit]]]:
+        """
+        다중 쿼리 × 다중 도메인 일괄 KB 검색
+
+        모든 쿼리를 1회에 벡터화하고, 전체 KB에 대한
+        유사도 매트릭스(쿼리 × 아이템)를 한 번에 계산한 뒤 도메인별로 top-k를 선택
+
+        Args:
+            queries: 검색 쿼리 리스트
+            domains: 도메인 리스트 (None이면 KB_DOMAINS 전체)
+            top_k: (쿼리, 도메인)별 반환할 결과 개수
+            min_score: 최소 유사도 점수
+            prioritize_integrated: 통합지식 우선 반환 여부
+
+        Returns:
+            쿼리 순서대로 {domain: 검색 결과 리스트} (search()와 동일한 순위)
+        """
+        if domains is None:
+            domains = list(self.KB_DOMAINS)
+
+        if not queries:
+            return []
+
+        self.ensure_loaded()
+        backend = self._backend
+        index = self._index
+
+        if not index.all_items or not index.vectorizer:
+            logger.warning("[WARN] No candidates or vectorizer not initialized")
+            return [{domain: [] for domain in domains} for _ in queries]
+
+        cache_key = (
+            "search_many", tuple(query_digest(q) for q in queries), tuple(domains), top_k, min_score,
+            prioritize_integrated, index.version, backend.name, index.embedding_model
+        )
+        cached = self.query_cache.get(cache_key)
+        if cached is not None:
+            return [{domain: list(hits) for domain, hits in per_domain.items()} for per_domain in cached]
+
+        # 전체 KB 유사도 매트릭스 (n_queries × n_items), 쿼리 일괄 벡터화 + 행렬 곱 1회
+        try:
+            similarity_matrix = backend.score(index, queries)
+        except Exception as e:
+            logger.error(f"[FAIL] Retrieval error ({backend.name}): {e}")
+            return [{domain: [] for domain in domains} for _ in queries]
+
+        # 도메인별 행 구간 / 통합지식 가산치 (쿼리 간 공유)
+        domain_blocks = {}
+        for domain in domains:
+            block = index.domain_slice(domain)
+            domain_blocks[domain] = (block, index.integrated_bonus[block] if prioritize_integrated else None)
+
+        records = index.records
+        grouped_results = []
+        for q_idx in range(len(queries)):
+            per_domain = {}
+            for domain, (block, bonus) in domain_blocks.items():
+                similarities = similarity_matrix[q_idx, block]
+                local = self._select_top_k(similarities, bonus, top_k, min_score)
+                per_domain[domain] = tuple(
+                    KBHit(records[row], score)
+                    for row, score in zip((local + block.start).tolist(), similarities[local].tolist())
+                )
+            grouped_results.append(per_domain)
+
+        self.query_cache.put(cache_key, tuple(grouped_results))
+        return [{domain: list(hits) for domain, hits in per_domain.items()} for per_domain in grouped_results]
+
+    async def asearch(
+        self,
+        query: str,
+        domain: Optional[str] = None,
+        top_k: int = 5,
+        min_score: float = 0.0,
+        prioritize_integrated: bool = True
+    ) -> List[KBHit]:
+        """search()의 비동기 버전 (공유 스레드 풀에서 실행 → 이벤트 루프 비차단)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.search_executor(),
+            functools.partial(self.search, query, domain, top_k, min_score, prioritize_integrated)
+        )
+
+    async def asearch_many(
+        self,
+        queries: List[str],
+        domains: Optional[List[str]] = None,
+        top_k: int = 5,
+        min_score: float = 0.0,
+        prioritize_integrated: bool = True
+    ) -> List[Dict[str, List[KBHit]]]:
+        """search_many()의 비동기 버전 (공유 스레드 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.search_executor(),
+            functools.partial(self.search_many, queries, domains, top_k, min_score, prioritize_integrated)
+        )
+
+    @classmethod
+    def search_executor(cls) -> ThreadPoolExecutor:
+        """비동기 검색 공유 스레드 풀 (전체 서비스 인스턴스 공유, 최초 사용 시 생성)"""
+        if KBService._search_executor is None:
+            with KBService._search_executor_lock:
+                if KBService._search_executor is None:
+                    KBService._search_executor = ThreadPoolExecutor(
+                        max_workers=cls.SEARCH_WORKERS, thread_name_prefix="kb-search"
+                    )
+        return KBService._search_executor
+
+    @classmethod
+    def _select_top_k(
+        cls,
+        similarities: np.ndarray,
+        bonus: Optional[np.ndarray],
+        top_k: int,
+        min_score: float
+    ) -> np.ndarray:
+        """(유사도 + 가산치) 기준 상위 top_k 중 원래 유사도가 min_score 이상인 인덱스 (순위순)"""
+        ranking = similarities + bonus if bonus is not None else similarities
+        top = cls._top_k_indices(ranking, top_k)
+        return top[similarities[top] >= min_score]
+
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """점수 내림차순 상위 top_k 인덱스 (np.argpartition 부분 정렬)"""
+        n = scores.shape[0]
+        if top_k <= 0 or n == 0:
+            return np.empty(0, dtype=np.int64)
+        if top_k < n:
+            # k번째 점수(임계값) 초과 항목 + 임계값 동점 중 앞선 인덱스 (안정 정렬과 동일한 선택)
+            threshold = -np.partition(-scores, top_k - 1)[top_k - 1]
+            above = np.flatnonzero(scores > threshold)
+            ties = np.flatnonzero(scores == threshold)[:top_k - len(above)]
+            candidate_idx = np.concatenate([above, ties])
+        else:
+            candidate_idx = np.arange(n)
+        # 동점은 앞선 인덱스 우선 (안정 정렬)
+        order = np.lexsort((candidate_idx, -scores[candidate_idx]))
+        return candidate_idx[order]
     
     def get_stats(self) -> KBStats:
         """KB 통계"""
-        fusion_count = sum(1 for item in self.all_items if item.is_fusion)
+        self.ensure_loaded()
+        index = self._index
+        
+        fusion_count = sum(1 for item in index.all_items if item.is_fusion)
         
         items_by_domain = {}
-        for domain, items in self.kb_items.items():
+        for domain, items in index.kb_items.items():
             items_by_domain[domain] = len(items)
         
         items_by_subcategory = {}
-        for item in self.all_items:
+        for item in index.all_items:
             key = f"{item.domain}_{item.subcategory}"
             items_by_subcategory[key] = items_by_subcategory.get(key, 0) + 1
         
         return KBStats(
-            total_items=len(self.all_items),
+            total_items=len(index.all_items),
             fusion_items=fusion_count,
             items_by_domain=items_by_domain,
-            items_by_subcategory=items_by_subcategory
+            items_by_subcategory=items_by_subcategory,
+            integrity=index.integrity
         )
     
     def get_item_by_anchor(self, anchor_id: str) -> Optional[KBItem]:
-        """Anchor ID로 아이템 조회"""
-        for item in self.all_items:
-            if item.anchor_id == anchor_id:
-                return item
-        return None
+        """Anchor ID로 아이템 조회 (로드 시 생성된 anchor 인덱스, O(1))"""
+        self.ensure_loaded()
+        return self._index.anchor_index.get(anchor_id)
     
-    def validate_uniqueness(self) -> Dict[str, any]:
-        """KB 아이템 고유성 검증"""
-        anchor_ids = [item.anchor_id for item in self.all_items]
-        kb_ids = [item.kb_id for item in self.all_items]
+    def has_anchor(self, anchor_id: str) -> bool:
+        """KB에 존재하는 anchor_id인지 확인 (O(1))"""
+        self.ensure_loaded()
+        return anchor_id in self._index.anchor_set
+    
+    def get_anchor_ids(self) -> Tuple[str, ...]:
+        """전체 anchor_id (KB 행 순서, 인덱스와 함께 생성된 불변 튜플)"""
+        self.ensure_loaded()
+        return self._index.anchor_ids
+    
+    def get_anchor_set(self) -> FrozenSet[str]:
+        """유효 anchor_id 집합 (가짜 앵커 검증용)"""
+        self.ensure_loaded()
+        return self._index.anchor_set
+    
+    def validate_uniqueness(self) -> Dict[str, Any]:
+        """KB 아이템 고유성 검증 (Counter 기반, 아이템 수에 선형)"""
+        self.ensure_loaded()
+        index = self._index
         
-        duplicate_anchors = [aid for aid in anchor_ids if anchor_ids.count(aid) > 1]
-        duplicate_kb_ids = [kid for kid in kb_ids if kb_ids.count(kid) > 1]
+        anchor_counts = Counter(item.anchor_id for item in index.all_items)
+        kb_id_counts = Counter(item.kb_id for item in index.all_items)
+        
+        duplicate_anchors = [aid for aid, count in anchor_counts.items() if count > 1]
+        duplicate_kb_ids = [kid for kid, count in kb_id_counts.items() if count > 1]
         
         return {
-            "unique_anchors": len(set(anchor_ids)) == len(anchor_ids),
-            "unique_kb_ids": len(set(kb_ids)) == len(kb_ids),
-            "duplicate_anchors": list(set(duplicate_anchors)),
-            "duplicate_kb_ids": list(set(duplicate_kb_ids)),
-            "total_items": len(self.all_items)
+            "unique_anchors": not duplicate_anchors,
+            "unique_kb_ids": not duplicate_kb_ids,
+            "duplicate_anchors": duplicate_anchors,
+            "duplicate_kb_ids": duplicate_kb_ids,
+            "total_items": len(index.all_items)
         }
 
 
-# Global KB service instance
-kb_service = KBService()
+def _elapsed_ms(start: float) -> float:
+    return (time.perf_counter() - start) * 1000
 
-# Auto-load KB on module import
-logger.info("[KB-SERVICE] Auto-loading KB on module import...")
-try:
-    _load_stats = kb_service.load_all_domains()
-    logger.info(f"[KB-SERVICE] KB auto-loaded successfully: {_load_stats}")
-except Exception as e:
-    logger.error(f"[KB-SERVICE] KB auto-load failed: {e}")
 
+# Global KB service instance (지연 로딩: 최초 검색/조회 시 또는 ensure_loaded() 호출 시 로드)
+kb_service = KBService()
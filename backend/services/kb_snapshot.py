@@ -0,0 +1,242 @@
+"""KB Index Snapshot - 파싱된 KB 아이템 + TF-IDF 인덱스 디스크 스냅샷
+
+KB 원본 파일의 내용 해시로 키잉된 스냅샷을 저장/로드하여
+워커 프로세스 시작 시 파싱과 TF-IDF 학습(scikit-learn import 포함)을 생략한다.
+
+디렉토리 구조 ({index_dir}/{source_hash}/):
+- meta.json         포맷 버전, 해시, 도메인 순서, 매트릭스 shape, 분석기 설정
+- items.json        도메인별 KBItem 목록
+- vocabulary.json   TF-IDF 어휘 사전 {term: column}
+- idf.npy           IDF 벡터
+- matrix_*.npy      L2 정규화된 CSR 매트릭스 (data / indices / indptr)
+
+.npy 파일은 mmap_mode="r"로 로드되어 여러 워커가 동일한 페이지를 공유한다.
+(.npz 아카이브는 메모리 매핑이 불가능하므로 배열별 .npy로 저장)
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from backend.models.schemas import KBItem
+from backend.services.kb_tokenizer import DEFAULT_NGRAM_RANGE, get_analyzer
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 포맷 버전 (직렬화 구조나 인덱싱 로직이 바뀌면 증가)
+INDEX_FORMAT_VERSION = 3
+
+
+class KBQueryVectorizer:
+    """
+    고정 어휘/IDF 기반 쿼리 벡터화 (scikit-learn 없이 동작)
+
+    학습 시와 같은 분석기(kb_tokenizer)로 토큰화하며, TfidfVectorizer 기본 가중치
+    (raw TF × IDF, L2 정규화)와 동일한 결과를 생성한다.
+    """
+
+    def __init__(
+        self,
+        vocabulary: Dict[str, int],
+        idf: np.ndarray,
+        analyzer: str = "word",
+        ngram_range: Sequence[int] = DEFAULT_NGRAM_RANGE
+    ):
+        self.vocabulary_ = vocabulary
+        self.idf_ = np.asarray(idf, dtype=np.float64)
+        self.analyzer = analyzer
+        self.ngram_range = tuple(ngram_range)
+        self._analyze = get_analyzer(analyzer, self.ngram_range)
+
+    def transform(self, raw_documents: List[str]) -> csr_matrix:
+        """문서 리스트 → L2 정규화된 TF-IDF CSR 매트릭스"""
+        data: List[float] = []
+        indices: List[int] = []
+        indptr = [0]
+
+        for doc in raw_documents:
+            counts = Counter(
+                self.vocabulary_[token]
+                for token in self._analyze(doc)
+                if token in self.vocabulary_
+            )
+            columns = sorted(counts)
+            weights = np.array([counts[c] for c in columns], dtype=np.float64) * self.idf_[columns]
+            norm = np.sqrt(np.dot(weights, weights))
+            if norm > 0:
+                weights /= norm
+            data.extend(weights.tolist())
+            indices.extend(columns)
+            indptr.append(len(indices))
+
+        return csr_matrix(
+            (np.array(data, dtype=np.float64), np.array(indices, dtype=np.int32), np.array(indptr, dtype=np.int32)),
+            shape=(len(raw_documents), len(self.idf_))
+        )
+
+
+def compute_source_hash(kb_files: List[Tuple[str, Path]], params: Dict) -> str:
+    """
+    KB 원본 파일 내용 + 인덱싱 파라미터 해시
+
+    Args:
+        kb_files: [(domain, file_path)] (도메인 순서 포함)
+        params: 벡터라이저 파라미터 (변경 시 재빌드)
+    """
+    hasher = hashlib.sha256()
+    hasher.update(f"v{INDEX_FORMAT_VERSION}".encode())
+    hasher.update(json.dumps(params, sort_keys=True, ensure_ascii=False).encode())
+    for domain, file_path in kb_files:
+        hasher.update(domain.encode())
+        hasher.update(file_path.read_bytes() if file_path.exists() else b"<missing>")
+    return hasher.hexdigest()[:32]
+
+
+def save_snapshot(
+    index_dir: Path,
+    source_hash: str,
+    kb_items: Dict[str, List[KBItem]],
+    vocabulary: Dict[str, int],
+    idf: np.ndarray,
+    matrix: csr_matrix,
+    analyzer: str = "word",
+    ngram_range: Sequence[int] = DEFAULT_NGRAM_RANGE,
+    params: Optional[Dict] = None
+) -> Optional[Path]:
+    """
+    스냅샷 저장 (임시 디렉토리에 쓴 뒤 rename으로 원자적 공개)
+
+    params(해시에 포함된 인덱싱 파라미터)를 meta에 기록해 두고,
+    저장 후에는 같은 params의 이전 스냅샷만 정리한다.
+
+    Returns:
+        저장된 스냅샷 경로 (실패 시 None)
+    """
+    index_dir = Path(index_dir)
+    target = index_dir / source_hash
+    if target.exists():
+        return target
+
+    tmp_dir = index_dir / f".tmp_{source_hash}_{uuid.uuid4().hex[:8]}"
+    try:
+        tmp_dir.mkdir(parents=True)
+        matrix = matrix.tocsr()
+
+        meta = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "source_hash": source_hash,
+            "domains": list(kb_items.keys()),
+            "shape": list(matrix.shape),
+            "analyzer": analyzer,
+            "ngram_range": list(ngram_range),
+            "params": params,
+        }
+        (tmp_dir / "meta.json").write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        (tmp_dir / "items.json").write_text(
+            json.dumps(
+                {domain: [item.model_dump() for item in items] for domain, items in kb_items.items()},
+                ensure_ascii=False
+            ),
+            encoding="utf-8"
+        )
+        (tmp_dir / "vocabulary.json").write_text(
+            json.dumps({term: int(col) for term, col in vocabulary.items()}, ensure_ascii=False),
+            encoding="utf-8"
+        )
+        np.save(tmp_dir / "idf.npy", np.asarray(idf, dtype=np.float64))
+        np.save(tmp_dir / "matrix_data.npy", matrix.data)
+        np.save(tmp_dir / "matrix_indices.npy", matrix.indices)
+        np.save(tmp_dir / "matrix_indptr.npy", matrix.indptr)
+
+        try:
+            os.rename(tmp_dir, target)
+        except OSError:
+            # 다른 워커가 먼저 저장한 경우
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        _prune_stale_snapshots(index_dir, keep=source_hash, params=params)
+        logger.info(f"[OK] KB index snapshot saved: {target}")
+        return target
+
+    except Exception as e:
+        logger.error(f"[FAIL] KB index snapshot save error: {e}")
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return None
+
+
+def load_snapshot(index_dir: Path, source_hash: str) -> Optional[Dict]:
+    """
+    스냅샷 로드 (해시 일치 시에만, 매트릭스는 메모리 매핑)
+
+    Returns:
+        {"kb_items", "vectorizer", "tfidf_matrix"} 또는 None (없음/불일치/손상)
+    """
+    snapshot_dir = Path(index_dir) / source_hash
+    if not snapshot_dir.is_dir():
+        return None
+
+    try:
+        meta = json.loads((snapshot_dir / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("format_version") != INDEX_FORMAT_VERSION or meta.get("source_hash") != source_hash:
+            logger.warning(f"[WARN] KB index snapshot version mismatch: {snapshot_dir}")
+            return None
+
+        raw_items = json.loads((snapshot_dir / "items.json").read_text(encoding="utf-8"))
+        kb_items = {
+            domain: [KBItem(**item) for item in raw_items.get(domain, [])]
+            for domain in meta["domains"]
+        }
+        vocabulary = json.loads((snapshot_dir / "vocabulary.json").read_text(encoding="utf-8"))
+        idf = np.load(snapshot_dir / "idf.npy")
+
+        tfidf_matrix = csr_matrix(
+            (
+                np.load(snapshot_dir / "matrix_data.npy", mmap_mode="r"),
+                np.load(snapshot_dir / "matrix_indices.npy", mmap_mode="r"),
+                np.load(snapshot_dir / "matrix_indptr.npy", mmap_mode="r"),
+            ),
+            shape=tuple(meta["shape"]),
+            copy=False
+        )
+
+        return {
+            "kb_items": kb_items,
+            "vectorizer": KBQueryVectorizer(
+                vocabulary, idf, analyzer=meta["analyzer"], ngram_range=meta["ngram_range"]
+            ),
+            "tfidf_matrix": tfidf_matrix,
+        }
+
+    except Exception as e:
+        logger.error(f"[FAIL] KB index snapshot load error ({snapshot_dir}): {e}")
+        return None
+
+
+def _prune_stale_snapshots(index_dir: Path, keep: str, params: Optional[Dict] = None):
+    """
+    오래된 스냅샷 삭제 (best-effort)
+
+    index_dir는 다른 설정의 KBService 스냅샷과 임베딩 캐시(embeddings_*.npy)도 함께 쓰므로
+    같은 params로 만든 이전 KB 버전과 포맷 버전이 다른 스냅샷만 삭제한다.
+    meta.json이 없는 디렉토리는 스냅샷이 아니므로 건드리지 않는다.
+    """
+    for path in index_dir.iterdir():
+        if not path.is_dir() or path.name == keep or path.name.startswith(".tmp_"):
+            continue
+        meta_path = path / "meta.json"
+        if not meta_path.exists():
+            continue
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if meta.get("format_version") != INDEX_FORMAT_VERSION or meta.get("params") == params:
+            shutil.rmtree(path, ignore_errors=True)
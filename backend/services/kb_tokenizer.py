@@ -0,0 +1,112 @@
+"""KB Tokenizer - KB 검색용 분석기 (단어 / 형태소(조사·어미 제거) / 문자 n-gram)
+
+scikit-learn 기본 토크나이저는 한국어를 공백 단위로만 분리하므로
+"경제의", "경제는", "경제를"이 모두 다른 어휘가 된다. 여기의 분석기는 순수 Python으로
+동작하며, TF-IDF 학습(TfidfVectorizer)과 쿼리 벡터화(KBQueryVectorizer)에서
+동일한 함수를 사용해 학습/검색 시 토큰화가 항상 일치하도록 한다.
+
+분석기:
+- word:     scikit-learn 기본 토큰 패턴 (2자 이상 단어, 소문자화)
+- morpheme: word + 한글 토큰의 조사/어미 접미사 제거 (경량 규칙 기반)
+- char:     단어 경계 기준 문자 n-gram (char_wb, 기본 2~3자)
+"""
+import re
+from typing import Callable, List, Sequence, Tuple
+
+# scikit-learn TfidfVectorizer 기본 토큰 패턴 (lowercase=True)
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# 형태소 분석기용 토큰 패턴 (1자 토큰도 접미사 제거 후 판단)
+_WORD_PATTERN = re.compile(r"(?u)\b\w+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+ANALYZERS = ("word", "morpheme", "char")
+DEFAULT_NGRAM_RANGE = (2, 3)
+
+# 제거 대상 조사/어미 (긴 접미사 우선 매칭)
+KOREAN_SUFFIXES = tuple(sorted({
+    # 조사
+    "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도", "만",
+    "에서", "에게", "으로", "로서", "로써", "부터", "까지", "보다", "처럼", "마다",
+    "이나", "이며", "이고", "라는", "이라", "이란", "과의", "와의", "에는", "에도",
+    "에서는", "에서도", "에게서", "으로서", "으로써", "으로는", "이라는", "까지는",
+    # 복수/파생 접미사
+    "들", "들의", "들은", "들이", "들을", "들과", "적", "적인", "적으로", "적이다",
+    # 용언 어미 (하다/되다 계열)
+    "하는", "하고", "하며", "하여", "해야", "했다", "한다", "하게", "하기", "함으로써",
+    "된다", "되는", "되어", "되고", "되며", "됐다",
+    "이다", "였다", "이었다", "인",
+}, key=len, reverse=True))
+
+# 1음절 접미사는 어간이 2자 이상 남을 때만 제거 ("나이" → "나" 같은 과잉 절단 방지)
+_MIN_STEM_FOR_SHORT_SUFFIX = 2
+
+
+def _is_hangul(char: str) -> bool:
+    return "가" <= char <= "힣"
+
+
+def strip_korean_suffix(token: str) -> str:
+    """한글 토큰 끝의 조사/어미 하나 제거 (가장 긴 매칭 우선)"""
+    if not token or not _is_hangul(token[-1]):
+        return token
+    for suffix in KOREAN_SUFFIXES:
+        if not token.endswith(suffix):
+            continue
+        stem = token[:-len(suffix)]
+        min_stem = _MIN_STEM_FOR_SHORT_SUFFIX if len(suffix) == 1 else 1
+        # 영문/숫자 뒤 조사도 제거 ("AI가" → "ai")
+        if len(stem) >= min_stem and stem[-1].isalnum():
+            return stem
+    return token
+
+
+def word_tokens(text: str) -> List[str]:
+    """scikit-learn 기본 word 분석기와 동일한 토큰"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def morpheme_tokens(text: str) -> List[str]:
+    """단어 토큰 + 한글 조사/어미 제거 ("경제의", "경제는" → "경제")"""
+    tokens = []
+    for token in _WORD_PATTERN.findall(text.lower()):
+        stem = strip_korean_suffix(token)
+        # 원래 1자 토큰은 word 분석기와 동일하게 제외, 접미사 제거로 생긴 1자 어간은 유지
+        if len(stem) >= 2 or (stem != token and stem):
+            tokens.append(stem)
+    return tokens
+
+
+def char_ngrams(text: str, ngram_range: Sequence[int] = DEFAULT_NGRAM_RANGE) -> List[str]:
+    """단어 경계 기준 문자 n-gram (각 단어 양끝에 공백 패딩, scikit-learn char_wb와 동일한 방식)"""
+    min_n, max_n = ngram_range
+    ngrams = []
+    for word in _WHITESPACE.sub(" ", text.lower()).split():
+        padded = f" {word} "
+        for n in range(min_n, max_n + 1):
+            ngrams.extend(padded[i:i + n] for i in range(len(padded) - n + 1))
+    return ngrams
+
+
+def get_analyzer(
+    name: str = "word",
+    ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE
+) -> Callable[[str], List[str]]:
+    """
+    분석기 이름 → 토큰화 함수
+
+    Args:
+        name: "word" | "morpheme" | "char"
+        ngram_range: char 분석기의 (최소, 최대) n
+
+    Raises:
+        ValueError: 알 수 없는 분석기 이름
+    """
+    if name == "word":
+        return word_tokens
+    if name == "morpheme":
+        return morpheme_tokens
+    if name == "char":
+        min_n, max_n = int(ngram_range[0]), int(ngram_range[1])
+        return lambda text: char_ngrams(text, (min_n, max_n))
+    raise ValueError(f"Unknown KB analyzer: {name} (expected one of {ANALYZERS})")
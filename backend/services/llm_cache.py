@@ -0,0 +1,256 @@
+"""LLM Response Cache - 노드 LLM 응답 정확 일치 캐시 (LangChain BaseCache 구현)
+
+같은 도서를 같은 입력으로 다시 생성하면 AnchorMapper/Reviewer/Integrator/Producer가
+동일한 요청을 OpenAI에 그대로 다시 보낸다. 응답을 요청 내용 해시로 보관하여
+결정적 노드(temperature 0)는 반복 run에서 즉시 반환한다.
+
+키 = blake2b(llm_string + 직렬화된 메시지 전체)
+  - llm_string: LangChain이 만드는 호출 파라미터 문자열 (model, temperature,
+    with_structured_output이 바인딩한 tools/response_format 스키마 포함)
+
+저장소:
+  - memory: 프로세스 내 LRU (재시작 시 소멸)
+  - sqlite: 로컬 파일 (단일 노드, API/워커 프로세스 공유)
+  - postgres: Supabase llm_cache 테이블 (다중 노드 공유)
+
+노드별 사용 여부는 models_config.use_response_cache가 결정한다 (LLMClientRegistry).
+"""
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration
+
+logger = logging.getLogger(__name__)
+
+CACHE_BACKENDS = ("none", "memory", "sqlite", "postgres")
+
+
+def response_cache_key(prompt: str, llm_string: str) -> str:
+    """(메시지, 호출 파라미터) → 고정 길이 키"""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(llm_string.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _serialize(generations: RETURN_VAL_TYPE) -> str:
+    """채팅 응답 → 메시지 dict JSON (tool_calls 등 구조화 출력 포함)"""
+    return json.dumps([message_to_dict(generation.message) for generation in generations], ensure_ascii=False)
+
+
+def _deserialize(value: str) -> Optional[RETURN_VAL_TYPE]:
+    try:
+        return [ChatGeneration(message=message) for message in messages_from_dict(json.loads(value))]
+    except Exception as e:
+        # 직렬화 형식이 바뀐 항목 → 미스로 처리 (다음 호출 결과로 덮어씀)
+        logger.warning(f"[LLM-CACHE] Unreadable cache entry ignored: {e}")
+        return None
+
+
+class LLMResponseCache(BaseCache):
+    """
+    히트/미스 카운터 공통 구현 (저장소는 get_value/put_value/_clear 구현, BaseCache와 같은 ABC)
+
+    get_value/put_value는 문자열 키-값 저장소로도 사용된다 (리뷰 메모 등 다른 캐시 계층이
+    같은 저장소를 공유, 키 접두사로 구분).
+    """
+
+    backend_name = "base"
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @abstractmethod
+    def get_value(self, key: str) -> Optional[str]:
+        """키 → 저장된 문자열 (없으면 None)"""
+
+    @abstractmethod
+    def put_value(self, key: str, value: str):
+        """키-값 저장 (있으면 덮어쓰기)"""
+
+    @abstractmethod
+    def _clear(self):
+        """전체 삭제"""
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        value = self.get_value(response_cache_key(prompt, llm_string))
+        generations = _deserialize(value) if value is not None else None
+        if generations is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        self.put_value(response_cache_key(prompt, llm_string), _serialize(return_val))
+
+    def clear(self, **kwargs: Any):
+        self._clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend_name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class InMemoryLLMCache(LLMResponseCache):
+    """프로세스 내 LRU (이벤트 루프에서 직접 조회, 스레드 전환 없음)"""
+
+    backend_name = "memory"
+
+    def __init__(self, max_size: int = 512):
+        super().__init__()
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_value(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put_value(self, key: str, value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def _clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        return self.lookup(prompt, llm_string)
+
+    async def aupdate(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE):
+        self.update(prompt, llm_string, return_val)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            stats.update(size=len(self._entries), max_size=self.max_size)
+        return stats
+
+
+class SQLiteLLMCache(LLMResponseCache):
+    """SQLite 파일 캐시 (비동기 조회는 BaseCache 기본 구현대로 스레드 풀에서)"""
+
+    backend_name = "sqlite"
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__()
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get_value(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def put_value(self, key: str, value: str):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+            (key, value, time.time())
+        )
+
+    def _clear(self):
+        self._connect().execute("DELETE FROM llm_cache")
+
+    def stats(self) -> Dict[str, Any]:
+        stats = super().stats()
+        stats["size"] = self._connect().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        return stats
+
+
+class PostgresLLMCache(LLMResponseCache):
+    """Supabase(Postgres) llm_cache 테이블 캐시 (다중 노드 공유, 조회 실패는 미스로 처리)"""
+
+    backend_name = "postgres"
+    TABLE = "llm_cache"
+
+    def __init__(self, client: Any = None):
+        super().__init__()
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from backend.core.database import get_supabase_admin
+            self._client = get_supabase_admin()
+        return self._client
+
+    def get_value(self, key: str) -> Optional[str]:
+        try:
+            result = self.client.table(self.TABLE).select("value").eq("key", key).limit(1).execute()
+        except Exception as e:
+            logger.warning(f"[LLM-CACHE] Lookup failed: {e}")
+            return None
+        return result.data[0]["value"] if result.data else None
+
+    def put_value(self, key: str, value: str):
+        try:
+            self.client.table(self.TABLE).upsert({"key": key, "value": value}).execute()
+        except Exception as e:
+            logger.warning(f"[LLM-CACHE] Update failed: {e}")
+
+    def _clear(self):
+        self.client.table(self.TABLE).delete().neq("key", "").execute()
+
+
+def create_llm_cache(
+    backend: str,
+    path: Optional[Union[str, Path]] = None,
+    max_size: int = 512
+) -> Optional[LLMResponseCache]:
+    """
+    설정 → 응답 캐시 생성
+
+    Args:
+        backend: "none" | "memory" | "sqlite" | "postgres"
+        path: sqlite 파일 경로
+        max_size: memory LRU 최대 항목 수
+
+    Returns:
+        캐시 (none이면 None)
+    """
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryLLMCache(max_size=max_size)
+    if backend == "sqlite":
+        return SQLiteLLMCache(path or ".cache/llm_cache.db")
+    if backend == "postgres":
+        return PostgresLLMCache()
+    raise ValueError(f"Unknown LLM cache backend: {backend} (expected one of {CACHE_BACKENDS})")
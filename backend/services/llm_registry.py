@@ -0,0 +1,234 @@
+"""LLM Client Registry - 노드 설정별 ChatOpenAI 클라이언트 재사용
+
+노드가 호출마다 ChatOpenAI를 새로 만들고 with_structured_output을 다시 바인딩하면
+클라이언트 생성 비용이 매번 들고 keep-alive 연결도 재사용되지 않는다.
+레지스트리는 (model, temperature, 구조화 출력 스키마)별 클라이언트를 1회만 만들고,
+모든 클라이언트가 연결 풀 설정을 조정한 공유 httpx 클라이언트를 사용한다.
+
+httpx.AsyncClient의 연결은 생성된 이벤트 루프에 묶이므로 비동기 클라이언트와
+이를 사용하는 ChatOpenAI 인스턴스는 이벤트 루프별로 보관한다 (서버는 루프 1개).
+
+응답 캐시(llm_cache)가 설정되면 models_config.use_response_cache가 허용한 노드의
+클라이언트에만 연결한다 (temperature 0 노드는 반복 run에서 API 호출 없이 반환).
+"""
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import httpx
+from langchain_core.caches import BaseCache
+from langchain_openai import ChatOpenAI
+
+from backend.core.models_config import models_config
+
+logger = logging.getLogger(__name__)
+
+
+class LLMClientRegistry:
+    """(model, temperature, schema) → 재사용 가능한 ChatOpenAI (구조화 출력 바인딩 포함)"""
+
+    # 공유 연결 풀 기본값 (노드 7회 호출 × 동시 run 수 기준)
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 60.0
+    TIMEOUT = 120.0
+    CONNECT_TIMEOUT = 10.0
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        if max_connections is not None:
+            self.MAX_CONNECTIONS = max_connections
+        if max_keepalive_connections is not None:
+            self.MAX_KEEPALIVE_CONNECTIONS = max_keepalive_connections
+        if keepalive_expiry is not None:
+            self.KEEPALIVE_EXPIRY = keepalive_expiry
+        if timeout is not None:
+            self.TIMEOUT = timeout
+
+        self._lock = threading.Lock()
+        self._sync_http: Optional[httpx.Client] = None
+        # 이벤트 루프별 (비동기 httpx 클라이언트, {key: 클라이언트}), 루프 종료 시 자동 제거
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, Dict]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # 실행 중인 루프가 없을 때 (동기 invoke 전용)
+        self._sync_only_clients: Dict[Hashable, Any] = {}
+        self.response_cache: Optional[BaseCache] = None
+        # 설정 변경으로 닫는 중인 비동기 클라이언트 종료 작업 (완료 전 GC 방지)
+        self._closing: set = set()
+        self.created = 0
+        self.reused = 0
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.MAX_CONNECTIONS,
+            max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=self.KEEPALIVE_EXPIRY,
+        )
+
+    def _timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.TIMEOUT, connect=self.CONNECT_TIMEOUT)
+
+    def _get_sync_http(self) -> httpx.Client:
+        if self._sync_http is None:
+            self._sync_http = httpx.Client(limits=self._limits(), timeout=self._timeout())
+        return self._sync_http
+
+    def _clients_for_current_loop(self) -> Tuple[Optional[httpx.AsyncClient], Dict]:
+        """현재 이벤트 루프의 (비동기 httpx 클라이언트, 클라이언트 캐시)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None, self._sync_only_clients
+
+        entry = self._loop_clients.get(loop)
+        if entry is None:
+            entry = (httpx.AsyncClient(limits=self._limits(), timeout=self._timeout()), {})
+            self._loop_clients[loop] = entry
+        return entry
+
+    def get_client(
+        self,
+        model: str,
+        temperature: float,
+        schema: Optional[type] = None,
+        cached: bool = False
+    ) -> Any:
+        """
+        ChatOpenAI 클라이언트 조회/생성
+
+        Args:
+            model: 모델 이름
+            temperature: 샘플링 온도
+            schema: 구조화 출력 pydantic 모델 (지정 시 with_structured_output 바인딩 결과 반환)
+            cached: 응답 캐시 사용 (response_cache가 설정된 경우에만 적용)
+
+        Returns:
+            invoke/ainvoke 가능한 Runnable (같은 키면 동일 인스턴스)
+        """
+        cache = self.response_cache if cached else None
+        key = (model, temperature, schema, cache is not None)
+        with self._lock:
+            async_http, clients = self._clients_for_current_loop()
+            client = clients.get(key)
+            if client is not None:
+                self.reused += 1
+                return client
+
+            llm = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                http_client=self._get_sync_http(),
+                http_async_client=async_http,
+                cache=cache if cache is not None else False,
+            )
+            client = llm.with_structured_output(schema) if schema is not None else llm
+            clients[key] = client
+            self.created += 1
+
+        logger.info(f"[LLM] Client created: model={model}, temperature={temperature}, "
+                    f"schema={schema.__name__ if schema else None}, cached={cache is not None}")
+        return client
+
+    def for_node(self, node_name: str, schema: Optional[type] = None) -> Any:
+        """노드 이름 → models_config의 모델/온도/응답 캐시 설정으로 클라이언트 조회"""
+        return self.get_client(
+            models_config.get_model(node_name),
+            models_config.get_temperature(node_name),
+            schema,
+            cached=models_config.use_response_cache(node_name)
+        )
+
+    def configure_response_cache(self, cache: Optional[BaseCache]):
+        """응답 캐시 교체 (None이면 비활성화, ChatOpenAI는 다음 조회 시 재생성, httpx 연결 풀은 유지)"""
+        with self._lock:
+            if cache is self.response_cache:
+                return
+            self.response_cache = cache
+            self._sync_only_clients = {}
+            for _, clients in self._loop_clients.values():
+                clients.clear()
+        logger.info(f"[LLM] Response cache: {getattr(cache, 'backend_name', None) or 'disabled'}")
+
+    def configure(
+        self,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        timeout: float
+    ):
+        """연결 풀 설정 변경 (설정이 바뀌면 기존 클라이언트를 닫고, 다음 조회 시 새 설정으로 생성)"""
+        with self._lock:
+            current = (self.MAX_CONNECTIONS, self.MAX_KEEPALIVE_CONNECTIONS, self.KEEPALIVE_EXPIRY, self.TIMEOUT)
+            if current == (max_connections, max_keepalive_connections, keepalive_expiry, timeout):
+                return
+            self.MAX_CONNECTIONS = max_connections
+            self.MAX_KEEPALIVE_CONNECTIONS = max_keepalive_connections
+            self.KEEPALIVE_EXPIRY = keepalive_expiry
+            self.TIMEOUT = timeout
+            sync_http, loop_entries = self._sync_http, list(self._loop_clients.items())
+            self._reset()
+        self._close_clients(sync_http, loop_entries)
+        logger.info(
+            f"[LLM] Connection pool: max={max_connections}, keepalive={max_keepalive_connections}, "
+            f"expiry={keepalive_expiry}s, timeout={timeout}s"
+        )
+
+    async def aclose(self):
+        """공유 httpx 클라이언트 종료 (앱 종료 시)"""
+        with self._lock:
+            async_clients = [entry[0] for entry in self._loop_clients.values()]
+            sync_http = self._sync_http
+            self._reset()
+        for client in async_clients:
+            await client.aclose()
+        if sync_http is not None:
+            sync_http.close()
+
+    def _close_clients(self, sync_http: Optional[httpx.Client], loop_entries: list):
+        """교체된 httpx 클라이언트 종료 (비동기 클라이언트는 자신이 만들어진 이벤트 루프에서)"""
+        if sync_http is not None:
+            sync_http.close()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for loop, (async_http, _) in loop_entries:
+            if loop.is_closed():
+                continue  # 루프와 함께 연결도 종료됨
+            if loop is running:
+                task = loop.create_task(async_http.aclose())
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(async_http.aclose(), loop)
+            else:
+                loop.run_until_complete(async_http.aclose())
+
+    def _reset(self):
+        self._sync_http = None
+        self._loop_clients = weakref.WeakKeyDictionary()
+        self._sync_only_clients = {}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "clients": len(self._sync_only_clients) + sum(len(entry[1]) for entry in self._loop_clients.values()),
+                "event_loops": len(self._loop_clients),
+                "created": self.created,
+                "reused": self.reused,
+                "max_connections": self.MAX_CONNECTIONS,
+                "max_keepalive_connections": self.MAX_KEEPALIVE_CONNECTIONS,
+                "response_cache": self.response_cache.stats() if hasattr(self.response_cache, "stats") else None,
+            }
+
+
+# 전역 레지스트리 (노드 공유)
+llm_registry = LLMClientRegistry()
@@ -0,0 +1,105 @@
+"""Review Memo - Reviewer 출력 메모이제이션 (run 간 재사용)
+
+Reviewer 결과는 도서(요약/제목/주제), 도메인, 할당 앵커, 프롬프트에만 의존한다.
+같은 도서를 format만 바꿔 다시 생성하면 Reviewer 4회 호출을 건너뛰고
+Integrator/Producer만 실행된다.
+
+키 = review:{book_id}:{domain}:{anchor_id}:{prompt_version}:{input_digest}
+  - prompt_version: 시스템 프롬프트 + 출력 스키마 + 모델/온도 해시 (템플릿 수정 시 무효화)
+  - input_digest: 렌더링된 사용자 프롬프트 해시 (도서 내용/KB 참조가 바뀌면 무효화)
+
+저장소는 LLM 응답 캐시(llm_cache)와 공유한다 (memory | sqlite | postgres).
+"""
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+
+from backend.services.llm_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+
+def _digest(*parts: str) -> str:
+    digest = hashlib.blake2b(digest_size=12)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def review_prompt_version(system_prompt: str, schema: type, model: str, temperature: float) -> str:
+    """프롬프트 버전 해시 (시스템 프롬프트, 구조화 출력 스키마, 모델, 온도)"""
+    return _digest(
+        system_prompt,
+        json.dumps(schema.model_json_schema(), ensure_ascii=False, sort_keys=True),
+        model,
+        repr(temperature)
+    )
+
+
+class ReviewMemo:
+    """(book, domain, anchor, prompt version, 입력) → 리뷰 dict (저장소 미설정 시 비활성화)"""
+
+    PREFIX = "review"
+
+    def __init__(self, store: Optional[LLMResponseCache] = None):
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    def configure(self, store: Optional[LLMResponseCache]):
+        """저장소 교체 (None이면 비활성화)"""
+        self.store = store
+        logger.info(f"[MEMO] Reviewer memo: {getattr(store, 'backend_name', None) or 'disabled'}")
+
+    def key(self, book_id: str, domain: str, anchor_id: str, prompt_version: str, user_prompt: str) -> str:
+        return f"{self.PREFIX}:{book_id}:{domain}:{anchor_id}:{prompt_version}:{_digest(user_prompt)}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """메모 조회 (없거나 읽을 수 없으면 None)"""
+        if not self.enabled:
+            return None
+        value = self.store.get_value(key)
+        review = None
+        if value is not None:
+            try:
+                review = json.loads(value)
+            except ValueError:
+                logger.warning(f"[MEMO] Unreadable memo ignored: {key}")
+        if review is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return review
+
+    def put(self, key: str, review: Dict[str, Any]):
+        if self.enabled:
+            self.store.put_value(key, json.dumps(review, ensure_ascii=False))
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """비동기 조회 (sqlite/postgres 저장소 I/O는 스레드에서)"""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self.get, key)
+
+    async def aput(self, key: str, review: Dict[str, Any]):
+        if self.enabled:
+            await asyncio.to_thread(self.put, key, review)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "backend": getattr(self.store, "backend_name", None),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# 전역 메모 (Reviewer 노드 공유, 저장소는 시작 시 configure)
+review_memo = ReviewMemo()
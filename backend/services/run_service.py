@@ -1,13 +1,48 @@
-"""Run Service - 백그라운드 1p 생성 작업 관리"""
+"""Run Service - 백그라운드 1p 생성 작업 관리
+
+파이프라인은 이벤트 루프에서 graph.astream으로 실행된다 (LLM 호출은 ainvoke).
+여러 run이 하나의 이벤트 루프를 공유하며, 동기 Supabase 호출만 스레드로 넘긴다.
+
+RUN_QUEUE_BACKEND=sqlite이면 API는 run을 작업 큐에 넣기만 하고,
+별도 워커 프로세스(backend/worker.py)가 클레임하여 execute_pipeline을 실행한다.
+"""
+import asyncio
 import logging
-from typing import List, Dict, Any
+import threading
+import time
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+from backend.core.config import settings
 from backend.core.database import get_supabase_admin
-from backend.langgraph_pipeline.graph import graph  # 이미 컴파일된 graph 사용
+from backend.langgraph_pipeline.checkpointer import compact_thread, evict_threads, reset_thread
+from backend.langgraph_pipeline.graph import (  # get_graph: 최초 실행 시 컴파일 (지연 초기화)
+    RERUN_NODES,
+    get_graph,
+    resolve_rerun_node,
+)
+from backend.services.job_queue import JobQueue, create_job_queue
 from supabase import Client
 
 logger = logging.getLogger(__name__)
 
+_run_queue: Optional[JobQueue] = None
+_run_queue_lock = threading.Lock()
+
+
+def get_run_queue() -> JobQueue:
+    """설정 기반 run 작업 큐 (최초 호출 시 생성, API/워커 프로세스가 같은 파일 공유)"""
+    global _run_queue
+    if _run_queue is None:
+        with _run_queue_lock:
+            if _run_queue is None:
+                _run_queue = create_job_queue(
+                    settings.run_queue_backend,
+                    settings.run_queue_path,
+                    max_pending=settings.run_queue_max_pending,
+                    max_attempts=settings.run_queue_max_attempts
+                )
+    return _run_queue
+
 
 def update_run_status(
     run_id: str,
@@ -43,6 +78,35 @@ def update_run_status(
         logger.error(f"[RUN {run_id}] Error updating status: {e}")
 
 
+def update_run_claim(run_id: str, worker_id: Optional[str], attempts: int):
+    """워커 클레임 기록 (runs.worker_id / heartbeat_at / attempts)"""
+    try:
+        supabase = get_supabase_admin()
+        supabase.table("runs") \
+            .update({
+                "worker_id": worker_id,
+                "heartbeat_at": datetime.now().isoformat(),
+                "attempts": attempts
+            }) \
+            .eq("id", run_id) \
+            .execute()
+    except Exception as e:
+        logger.error(f"[RUN {run_id}] Error recording claim: {e}")
+
+
+def update_run_heartbeat(run_id: str, worker_id: str):
+    """워커 하트비트 기록 (runs.heartbeat_at)"""
+    try:
+        supabase = get_supabase_admin()
+        supabase.table("runs") \
+            .update({"heartbeat_at": datetime.now().isoformat()}) \
+            .eq("id", run_id) \
+            .eq("worker_id", worker_id) \
+            .execute()
+    except Exception as e:
+        logger.error(f"[RUN {run_id}] Error recording heartbeat: {e}")
+
+
 def update_run_progress(
     run_id: str,
     current_node: str,
@@ -124,33 +188,134 @@ def save_artifact_to_storage(
         return ""
 
 
-def execute_pipeline(
+# 노드별 진행률 매핑 (9개 노드)
+NODE_PROGRESS = {
+    "anchor_mapper": 11.1,
+    "review_domain": 33.3,  # 4개 병렬
+    "integrator": 55.6,
+    "producer": 77.8,
+    "validator": 88.9,
+    "assemble": 100.0
+}
+
+_last_checkpoint_sweep: Optional[float] = None
+
+
+async def _maintain_checkpoints(run_id: str, graph):
+    """
+    완료된 run의 체크포인트 정리 (실패해도 run 결과에는 영향 없음)
+    
+    - 압축: 최신 체크포인트 + 재실행 포크 지점(RERUN_NODES 실행 직전)만 유지
+    - 만료: CHECKPOINT_SWEEP_INTERVAL마다 보존 기간/최대 thread 수를 넘은 run 삭제
+    """
+    global _last_checkpoint_sweep
+    try:
+        if settings.checkpoint_compact:
+            removed = await compact_thread(graph, run_id, RERUN_NODES)
+            logger.info(f"[RUN {run_id}] Checkpoints compacted ({removed} removed)")
+        
+        now = time.monotonic()
+        if _last_checkpoint_sweep is None or now - _last_checkpoint_sweep >= settings.checkpoint_sweep_interval:
+            _last_checkpoint_sweep = now
+            retention_hours = settings.checkpoint_retention_hours
+            await evict_threads(
+                graph.checkpointer,
+                retention_seconds=retention_hours * 3600 if retention_hours > 0 else None,
+                max_threads=settings.checkpoint_max_threads or None
+            )
+    except Exception as e:
+        logger.warning(f"[RUN {run_id}] Checkpoint maintenance failed: {e}")
+
+
+async def _stream_graph(run_id: str, graph, inputs: Optional[Dict[str, Any]], config: Dict[str, Any]) -> bool:
+    """
+    그래프 실행 + 진행률 기록 + 최종 1p 저장 (inputs가 None이면 체크포인트에서 이어서 실행)
+    
+    Returns:
+        성공 여부 (실패 시 run은 failed로 기록됨)
+    """
+    try:
+        # 그래프 실행 (비동기 스트리밍, Reviewer LLM 대기가 이벤트 루프에서 겹침)
+        logger.info(f"[RUN {run_id}] Executing LangGraph pipeline...")
+        
+        async for event in graph.astream(inputs, config):
+            node_name = list(event.keys())[0]
+            
+            # 진행률 업데이트
+            percent = NODE_PROGRESS.get(node_name, 0.0)
+            await asyncio.to_thread(update_run_progress, run_id, node_name, percent)
+            
+            logger.info(f"[RUN {run_id}] Node completed: {node_name}")
+        
+        # 최종 state는 checkpointer에서 가져오기
+        final_state = await graph.aget_state(config)
+        
+        # 최종 결과물 추출
+        if final_state and "onepager_md" in final_state.values:
+            onepager_content = final_state.values["onepager_md"]
+            
+            # Artifact 저장
+            artifact_url = await asyncio.to_thread(save_artifact_to_storage, run_id, onepager_content, format="md")
+            
+            if not artifact_url:
+                raise Exception("Failed to save artifact")
+            
+            # Run 상태를 completed로 변경
+            await asyncio.to_thread(update_run_status, run_id, "completed", completed_at=datetime.now())
+            
+            logger.info(f"[RUN {run_id}] Pipeline completed successfully")
+            await _maintain_checkpoints(run_id, graph)
+            return True
+            
+        else:
+            raise Exception("No onepager_md in final state")
+        
+    except Exception as e:
+        logger.error(f"[RUN {run_id}] Pipeline failed: {e}")
+        
+        # Run 상태를 failed로 변경
+        await asyncio.to_thread(
+            update_run_status,
+            run_id,
+            "failed",
+            error_message=str(e),
+            completed_at=datetime.now()
+        )
+        return False
+
+
+async def execute_pipeline(
     run_id: str,
     book_ids: List[str],
     mode: str,
     format: str
-):
+) -> bool:
     """
-    LangGraph 파이프라인 실행 (백그라운드 작업)
+    LangGraph 파이프라인 실행 (백그라운드 작업, 비동기)
     
     Args:
         run_id: Run ID
         book_ids: 도서 ID 리스트 (1개만 지원 - 1권당 1p)
         mode: synthesis 또는 simple_merge
         format: content 또는 service
+    
+    Returns:
+        성공 여부 (실패 시 run은 이미 failed로 기록됨)
     """
     try:
         logger.info(f"[RUN {run_id}] Starting pipeline with {len(book_ids)} books (mode={mode})")
         
         # Run 상태를 running으로 변경
-        update_run_status(run_id, "running")
+        await asyncio.to_thread(update_run_status, run_id, "running")
         
         # 도서 정보 조회
         supabase = get_supabase_admin()
-        books_result = supabase.table("books") \
-            .select("*") \
-            .in_("id", book_ids) \
-            .execute()
+        books_result = await asyncio.to_thread(
+            supabase.table("books")
+            .select("*")
+            .in_("id", book_ids)
+            .execute
+        )
         
         if not books_result.data:
             raise Exception("Books not found")
@@ -163,7 +328,8 @@ def execute_pipeline(
         
         logger.info(f"[RUN {run_id}] Processing book: {book_meta['title']}")
         
-        # LangGraph 워크플로우는 이미 컴파일되어 있음 (graph.py의 전역 변수)
+        # LangGraph 워크플로우 (최초 실행 시 컴파일, 이후 재사용)
+        graph = get_graph()
         
         # 입력 데이터 준비 (create_initial_state 헬퍼 사용)
         from backend.langgraph_pipeline.state import create_initial_state
@@ -178,69 +344,114 @@ def execute_pipeline(
             book_author=book_meta.get("author", ""),
             book_topic=book_meta.get("topic", "")
         )
+    
+    except Exception as e:
+        logger.error(f"[RUN {run_id}] Pipeline failed: {e}")
+        await asyncio.to_thread(
+            update_run_status,
+            run_id,
+            "failed",
+            error_message=str(e),
+            completed_at=datetime.now()
+        )
+        return False
+    
+    # Config 설정 (thread_id로 상태 추적)
+    config = {
+        "configurable": {"thread_id": run_id},
+        "recursion_limit": 50
+    }
+    return await _stream_graph(run_id, graph, inputs, config)
+
+
+async def find_rerun_checkpoint(source_run_id: str, from_node: str):
+    """
+    원본 run의 체크포인트 이력에서 from_node 실행 직전 상태 찾기
+    
+    Returns:
+        StateSnapshot (없으면 None - 체크포인트 만료/미실행)
+    """
+    graph = get_graph()
+    async for snapshot in graph.aget_state_history({"configurable": {"thread_id": source_run_id}}):
+        if from_node in snapshot.next:
+            return snapshot
+    return None
+
+
+async def execute_rerun(
+    run_id: str,
+    source_run_id: str,
+    from_node: str,
+    format: Optional[str] = None
+) -> bool:
+    """
+    완료된 run을 from_node부터 재실행 (새 run_id thread로 포크, 이전 노드는 재사용)
+    
+    Args:
+        run_id: 새 Run ID (포크된 thread)
+        source_run_id: 원본 Run ID
+        from_node: 재실행 시작 노드 (RERUN_NODES)
+        format: 형식 변경 (None이면 원본 유지)
+    
+    Returns:
+        성공 여부
+    """
+    config = {
+        "configurable": {"thread_id": run_id},
+        "recursion_limit": 50
+    }
+    try:
+        logger.info(f"[RUN {run_id}] Re-running {source_run_id} from {from_node}")
+        await asyncio.to_thread(update_run_status, run_id, "running")
         
-        # Config 설정 (thread_id로 상태 추적)
-        config = {
-            "configurable": {"thread_id": run_id},
-            "recursion_limit": 50
-        }
-        
-        # 노드별 진행률 매핑 (9개 노드)
-        node_progress = {
-            "anchor_mapper": 11.1,
-            "review_domain": 33.3,  # 4개 병렬
-            "integrator": 55.6,
-            "producer": 77.8,
-            "validator": 88.9,
-            "assemble": 100.0
-        }
-        
-        # 그래프 실행 (스트리밍)
-        logger.info(f"[RUN {run_id}] Executing LangGraph pipeline...")
-        
-        for event in graph.stream(inputs, config):
-            node_name = list(event.keys())[0]
-            
-            # 진행률 업데이트
-            percent = node_progress.get(node_name, 0.0)
-            update_run_progress(run_id, node_name, percent)
-            
-            logger.info(f"[RUN {run_id}] Node completed: {node_name}")
-        
-        # 최종 state는 checkpointer에서 가져오기
-        final_state = graph.get_state(config)
+        snapshot = await find_rerun_checkpoint(source_run_id, from_node)
+        if snapshot is not None:
+            # format 변경 시 integrator부터 (큐에 들어간 이전 payload 포함)
+            resolved = resolve_rerun_node(from_node, snapshot.values.get("format"), format)
+            if resolved != from_node:
+                logger.info(f"[RUN {run_id}] Format changed, re-running from {resolved}")
+                from_node = resolved
+                snapshot = await find_rerun_checkpoint(source_run_id, from_node)
+        if snapshot is None:
+            raise Exception(f"No checkpoint before '{from_node}' for run {source_run_id}")
         
-        # 최종 결과물 추출
-        if final_state and "onepager_md" in final_state.values:
-            onepager_content = final_state.values["onepager_md"]
-            
-            # Artifact 저장
-            artifact_url = save_artifact_to_storage(run_id, onepager_content, format="md")
-            
-            if not artifact_url:
-                raise Exception("Failed to save artifact")
-            
-            # Run 상태를 completed로 변경
-            update_run_status(run_id, "completed", completed_at=datetime.now())
-            
-            logger.info(f"[RUN {run_id}] Pipeline completed successfully")
-            
-        else:
-            raise Exception("No onepager_md in final state")
+        values = dict(snapshot.values)
+        if format:
+            values["format"] = format
         
+        # 새 thread에 from_node 직전 상태 기록 → 이어서 실행하면 from_node부터 진행
+        graph = get_graph()
+        await graph.aupdate_state(config, values, as_node=RERUN_NODES[from_node])
+    
     except Exception as e:
-        logger.error(f"[RUN {run_id}] Pipeline failed: {e}")
-        
-        # Run 상태를 failed로 변경
-        update_run_status(
+        logger.error(f"[RUN {run_id}] Re-run failed: {e}")
+        await asyncio.to_thread(
+            update_run_status,
             run_id,
             "failed",
             error_message=str(e),
             completed_at=datetime.now()
         )
+        return False
+    
+    return await _stream_graph(run_id, graph, None, config)
+
+
+async def execute_job(run_id: str, payload: Dict[str, Any], attempt: int = 1) -> bool:
+    """
+    작업 큐 payload → 전체 실행 또는 재실행 (워커용)
+    
+    재시도(리스 만료 재클레임, fail 후 재시도)는 이전 시도의 체크포인트를 지우고 처음부터 실행
+    (같은 thread에 누적 필드가 중복되지 않도록)
+    """
+    if attempt > 1 and await reset_thread(get_graph().checkpointer, run_id):
+        logger.info(f"[RUN {run_id}] Cleared checkpoints of previous attempt (attempt {attempt})")
+    if payload.get("rerun_of"):
+        return await execute_rerun(run_id, payload["rerun_of"], payload["from_node"], payload.get("format"))
+    return await execute_pipeline(run_id, payload["book_ids"], payload["mode"], payload["format"])
 
 
-def execute_pipeline_async(
+async def execute_pipeline_async(
     run_id: str,
     book_ids: List[str],
     mode: str,
@@ -249,10 +460,23 @@ def execute_pipeline_async(
     """
     비동기 파이프라인 실행 래퍼
     
-    FastAPI BackgroundTasks에서 호출
+    FastAPI BackgroundTasks에서 호출 (코루틴이므로 스레드풀이 아닌 이벤트 루프에서 실행)
     """
     try:
-        execute_pipeline(run_id, book_ids, mode, format)
+        await execute_pipeline(run_id, book_ids, mode, format)
     except Exception as e:
         logger.error(f"[RUN {run_id}] Async execution error: {e}")
 
+
+async def execute_rerun_async(
+    run_id: str,
+    source_run_id: str,
+    from_node: str,
+    format: Optional[str] = None
+):
+    """비동기 재실행 래퍼 (FastAPI BackgroundTasks용)"""
+    try:
+        await execute_rerun(run_id, source_run_id, from_node, format)
+    except Exception as e:
+        logger.error(f"[RUN {run_id}] Async re-run error: {e}")
+
@@ -1,6 +1,6 @@
 -- ideator-books Database Schema
 -- PostgreSQL + Supabase
--- 8 Tables: users, libraries, books, kb_items, runs, artifacts, reminders, audits
+-- 9 Tables: users, libraries, books, kb_items, runs, artifacts, reminders, audits, llm_cache
 
 -- Enable UUID extension
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
@@ -73,13 +73,24 @@ CREATE TABLE IF NOT EXISTS runs (
     status TEXT NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'running', 'completed', 'failed')),
     progress_json JSONB DEFAULT '{}'::JSONB,
     error_message TEXT,
+    worker_id TEXT,
+    heartbeat_at TIMESTAMPTZ,
+    attempts INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMPTZ DEFAULT NOW(),
     completed_at TIMESTAMPTZ
 );
 
+-- 기존 DB 마이그레이션 (작업 큐 워커 클레임/하트비트 컬럼)
+ALTER TABLE runs ADD COLUMN IF NOT EXISTS worker_id TEXT;
+ALTER TABLE runs ADD COLUMN IF NOT EXISTS heartbeat_at TIMESTAMPTZ;
+ALTER TABLE runs ADD COLUMN IF NOT EXISTS attempts INTEGER NOT NULL DEFAULT 0;
+
 COMMENT ON TABLE runs IS '1-pager generation job tracking';
 COMMENT ON COLUMN runs.params_json IS 'Job parameters: {book_ids, mode, format, remind_enabled}';
 COMMENT ON COLUMN runs.progress_json IS 'Progress tracking: {current_node, percent, timestamp}';
+COMMENT ON COLUMN runs.worker_id IS 'Worker that claimed the run (job queue mode)';
+COMMENT ON COLUMN runs.heartbeat_at IS 'Last worker heartbeat (stale = worker lost, lease reclaimed)';
+COMMENT ON COLUMN runs.attempts IS 'Number of worker claims (retries after failure/lease expiry)';
 
 -- ============================================
 -- 6. Artifacts Table (generated 1p files)
@@ -131,6 +142,19 @@ COMMENT ON COLUMN audits.anchored_by_ok IS 'All sentences anchored to KB (100%)'
 COMMENT ON COLUMN audits.unique3_ok IS 'At least 3 unique sentences';
 COMMENT ON COLUMN audits.external0_ok IS 'No external frameworks (0 external references)';
 
+-- ============================================
+-- 9. LLM Cache Table (node response cache, LLM_CACHE_BACKEND=postgres)
+-- ============================================
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+COMMENT ON TABLE llm_cache IS 'Exact-match LLM response cache (service role only)';
+COMMENT ON COLUMN llm_cache.key IS 'blake2b(call parameters + serialized messages)';
+COMMENT ON COLUMN llm_cache.value IS 'Serialized response messages (JSON)';
+
 -- ============================================
 -- Indexes for Performance
 -- ============================================
@@ -176,6 +200,7 @@ ALTER TABLE runs ENABLE ROW LEVEL SECURITY;
 ALTER TABLE artifacts ENABLE ROW LEVEL SECURITY;
 ALTER TABLE reminders ENABLE ROW LEVEL SECURITY;
 ALTER TABLE audits ENABLE ROW LEVEL SECURITY;
+ALTER TABLE llm_cache ENABLE ROW LEVEL SECURITY;  -- 정책 없음 (서비스 키 전용)
 
 -- ============================================
 -- RLS Policies: KB Items (Public Read-Only)
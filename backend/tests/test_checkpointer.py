@@ -0,0 +1,221 @@
+"""SQLite 체크포인터 테스트 (재시작 후 상태 유지, 중간 노드부터 새 thread로 포크, 압축/만료)"""
+import asyncio
+import operator
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Annotated, List, TypedDict
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 그래프 구조만 사용 (API 호출 없음)
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from langgraph.graph import END, START, StateGraph
+
+from backend.langgraph_pipeline.checkpointer import (
+    BoundedMemorySaver,
+    SQLiteCheckpointSaver,
+    compact_thread,
+    evict_threads,
+    reset_thread,
+)
+from backend.langgraph_pipeline.graph import compile_graph, create_workflow, resolve_rerun_node
+from backend.langgraph_pipeline.state import create_initial_state
+
+
+class PipelineState(TypedDict):
+    format: str
+    steps: Annotated[List[str], operator.add]
+    result: str
+
+
+def build_graph(saver, calls: List[str]):
+    """analyze → integrate → produce (파이프라인 축소판, 노드 실행 기록)"""
+
+    def node(name: str):
+        async def run(state: PipelineState):
+            calls.append(name)
+            return {"steps": [name], "result": f"{name}:{state['format']}"}
+        return run
+
+    workflow = StateGraph(PipelineState)
+    for name in ("analyze", "integrate", "produce"):
+        workflow.add_node(name, node(name))
+    workflow.add_edge(START, "analyze")
+    workflow.add_edge("analyze", "integrate")
+    workflow.add_edge("integrate", "produce")
+    workflow.add_edge("produce", END)
+    return workflow.compile(checkpointer=saver)
+
+
+def test_checkpoints_survive_restart_and_fork():
+    """파일에 저장된 체크포인트로 재시작 후 produce만 새 thread에서 재실행"""
+    print("\n" + "=" * 60)
+    print("[TEST] SQLite Checkpointer Fork")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "checkpoints.db"
+        calls: List[str] = []
+        graph = build_graph(SQLiteCheckpointSaver(path), calls)
+        source = {"configurable": {"thread_id": "run-1"}}
+        asyncio.run(graph.ainvoke({"format": "content", "steps": []}, source))
+        assert calls == ["analyze", "integrate", "produce"]
+
+        # 재시작: 새 저장소 인스턴스 (같은 파일)
+        calls.clear()
+        graph = build_graph(SQLiteCheckpointSaver(path), calls)
+        final = graph.get_state(source)
+        assert final.values["steps"] == ["analyze", "integrate", "produce"]
+
+        async def fork():
+            snapshot = None
+            async for state in graph.aget_state_history(source):
+                if "produce" in state.next:
+                    snapshot = state
+                    break
+            assert snapshot is not None
+            target = {"configurable": {"thread_id": "run-2"}}
+            await graph.aupdate_state(target, {**snapshot.values, "format": "service"}, as_node="integrate")
+            assert (await graph.aget_state(target)).next == ("produce",)
+            return await graph.ainvoke(None, target)
+
+        result = asyncio.run(fork())
+        assert calls == ["produce"]
+        assert result["steps"] == ["analyze", "integrate", "produce"]
+        assert result["result"] == "produce:service"
+
+        # 원본 thread는 그대로
+        assert graph.get_state(source).values["result"] == "produce:content"
+        history = list(graph.get_state_history(source))
+        assert len(history) == 5  # input + 3 nodes + START
+        print(f"[OK] Forked run-1 → run-2 from 'produce' ({len(history)} source checkpoints)")
+
+
+def test_compaction_keeps_fork_point_and_eviction():
+    """완료 thread는 최신 + 포크 지점만 남고, 보존 한도를 넘은 thread는 삭제"""
+    print("\n" + "=" * 60)
+    print("[TEST] Checkpoint Compaction / Eviction")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for saver in (SQLiteCheckpointSaver(Path(tmp) / "checkpoints.db"), BoundedMemorySaver(max_threads=2)):
+            calls: List[str] = []
+            graph = build_graph(saver, calls)
+
+            async def scenario():
+                for thread_id in ("run-1", "run-2", "run-3"):
+                    config = {"configurable": {"thread_id": thread_id}}
+                    await graph.ainvoke({"format": "content", "steps": []}, config)
+
+                source = {"configurable": {"thread_id": "run-3"}}
+                removed = await compact_thread(graph, "run-3", keep_next=["produce"])
+                history = [state async for state in graph.aget_state_history(source)]
+                assert removed == 3
+                assert [state.next for state in history] == [(), ("produce",)]
+                assert history[0].values["steps"] == ["analyze", "integrate", "produce"]
+
+                # 압축 후에도 포크 가능
+                calls.clear()
+                target = {"configurable": {"thread_id": "run-4"}}
+                await graph.aupdate_state(target, {**history[1].values, "format": "service"}, as_node="integrate")
+                result = await graph.ainvoke(None, target)
+                assert calls == ["produce"]
+                assert result["steps"] == ["analyze", "integrate", "produce"]
+
+                # 최신 2개 thread만 유지
+                await evict_threads(saver, max_threads=2)
+                alive = [
+                    thread_id for thread_id in ("run-1", "run-2", "run-3", "run-4")
+                    if (await graph.aget_state({"configurable": {"thread_id": thread_id}})).values
+                ]
+                assert alive == ["run-3", "run-4"]
+
+                # 보존 기간 0 → 전부 만료
+                assert sorted(await evict_threads(saver, retention_seconds=0)) == ["run-3", "run-4"]
+                assert not (await graph.aget_state(source)).values
+
+            asyncio.run(scenario())
+            if isinstance(saver, BoundedMemorySaver):
+                assert not saver.blobs and not saver.writes
+            print(f"[OK] {type(saver).__name__}: compacted run-3, evicted old threads")
+
+
+def test_retry_after_crash_does_not_duplicate_reducers():
+    """재시도 전 reset_thread → 같은 thread 재실행 시 누적 필드(operator.add) 중복 없음"""
+    print("\n" + "=" * 60)
+    print("[TEST] Retry on Same Thread")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        saver = SQLiteCheckpointSaver(Path(tmp) / "checkpoints.db")
+        calls: List[str] = []
+        graph = build_graph(saver, calls)
+        config = {"configurable": {"thread_id": "run-1"}}
+        inputs = {"format": "content", "steps": []}
+
+        # 1차 시도: integrate 이후 워커 장애 (analyze 결과는 체크포인트에 남음)
+        async def crashed_attempt():
+            async for event in graph.astream(inputs, config):
+                if "integrate" in event:
+                    raise RuntimeError("worker crashed")
+
+        try:
+            asyncio.run(crashed_attempt())
+        except RuntimeError:
+            pass
+
+        # 초기화 없이 다시 실행하면 이전 시도 값에 이어 붙음
+        duplicated = asyncio.run(graph.ainvoke(inputs, config))
+        assert duplicated["steps"].count("analyze") == 2
+
+        # 재시도: 이전 시도 체크포인트 삭제 후 처음부터
+        assert asyncio.run(reset_thread(saver, "run-1"))
+        result = asyncio.run(graph.ainvoke(inputs, config))
+        assert result["steps"] == ["analyze", "integrate", "produce"]
+        assert not asyncio.run(reset_thread(saver, "run-unknown"))
+        print("[OK] retried run-1 without duplicated steps")
+
+
+def test_format_change_reruns_integrator():
+    """format을 바꾼 재실행은 producer가 아닌 integrator 직전 체크포인트에서 포크"""
+    print("\n" + "=" * 60)
+    print("[TEST] Re-run Format Change")
+    print("=" * 60)
+
+    assert resolve_rerun_node("producer", "content") == "producer"
+    assert resolve_rerun_node("producer", "content", "content") == "producer"
+    assert resolve_rerun_node("producer", "content", "service") == "integrator"
+    assert resolve_rerun_node("integrator", "content", "service") == "integrator"
+
+    # 파이프라인 그래프에 Reviewer/Integrator 완료 상태 기록 (LLM 호출 없음)
+    graph = compile_graph(create_workflow(), checkpointer=BoundedMemorySaver())
+    source = {"configurable": {"thread_id": "run-1"}}
+
+    async def fork_point(from_node: str, format: str):
+        state = create_initial_state(book_ids=["book-1"], mode="synthesis", format="content", book_summary="요약")
+        await graph.aupdate_state(source, {**state, "reviews": [{"domain": "경제경영"}]}, as_node="review_domain")
+        await graph.aupdate_state(source, {"integration_result": "content용 통합"}, as_node="integrator")
+        node = resolve_rerun_node(from_node, "content", format)
+        async for snapshot in graph.aget_state_history(source):
+            if node in snapshot.next:
+                return snapshot
+        return None
+
+    snapshot = asyncio.run(fork_point("producer", "service"))
+    assert snapshot.next == ("integrator",)
+    assert snapshot.values.get("integration_result") is None  # 이전 format의 통합 결과는 재사용하지 않음
+    assert asyncio.run(fork_point("producer", "content")).next == ("producer",)
+    print("[OK] format change forks before integrator")
+
+
+if __name__ == "__main__":
+    test_checkpoints_survive_restart_and_fork()
+    test_compaction_keeps_fork_point_and_eviction()
+    test_retry_after_crash_does_not_duplicate_reducers()
+    test_format_change_reruns_integrator()
+    print("\n[SUCCESS] All checkpointer tests passed!")
@@ -0,0 +1,147 @@
+"""Run 작업 큐 테스트 (클레임 배타성, 리스 만료 재클레임, 재시도 한도, 백프레셔, 하트비트)"""
+import asyncio
+import sqlite3
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.job_queue import QueueFullError, SQLiteJobQueue, keep_lease
+
+PAYLOAD = {"book_ids": ["book-1"], "mode": "synthesis", "format": "content"}
+
+
+def test_claim_is_exclusive_and_backpressure():
+    """동시 클레임은 작업당 1개 워커만 성공, 대기 상한 초과 시 QueueFullError"""
+    print("\n" + "=" * 60)
+    print("[TEST] Job Queue Claim / Backpressure")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = SQLiteJobQueue(Path(tmp) / "queue.db", max_pending=5)
+        for i in range(5):
+            queue.enqueue(f"run-{i}", PAYLOAD)
+        assert not queue.has_capacity()
+        try:
+            queue.enqueue("run-overflow", PAYLOAD)
+            raise AssertionError("QueueFullError expected")
+        except QueueFullError:
+            pass
+
+        # 워커 8개가 동시에 클레임 (별도 연결) → 5개 작업이 중복 없이 분배
+        workers = [SQLiteJobQueue(queue.path) for _ in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            jobs = list(pool.map(lambda i: workers[i].claim(f"worker-{i}", 60.0), range(8)))
+        claimed = [job.run_id for job in jobs if job is not None]
+        assert sorted(claimed) == [f"run-{i}" for i in range(5)]
+        assert queue.has_capacity()
+        assert queue.stats()["running"] == 5
+
+        job = next(job for job in jobs if job is not None)
+        assert job.payload == PAYLOAD
+        assert queue.complete(job.id, job.worker_id)
+        assert not queue.heartbeat(job.id, job.worker_id, 60.0)
+        assert queue.stats()["done"] == 1
+        print(f"[OK] {queue.stats()}")
+
+
+def test_lease_expiry_and_retries():
+    """리스 만료 작업은 다른 워커가 재클레임, 한도 소진 시 reap_expired로 실패 처리"""
+    print("\n" + "=" * 60)
+    print("[TEST] Job Queue Lease Expiry / Retry")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = SQLiteJobQueue(Path(tmp) / "queue.db", max_attempts=2)
+        queue.enqueue("run-1", PAYLOAD)
+
+        first = queue.claim("worker-a", 0.05)
+        assert first.attempts == 1
+        assert queue.claim("worker-b", 60.0) is None  # 리스 유효
+
+        time.sleep(0.1)
+        second = queue.claim("worker-b", 0.05)
+        assert second.id == first.id and second.attempts == 2
+        # 리스를 잃은 워커의 하트비트/완료는 거부
+        assert not queue.heartbeat(first.id, "worker-a", 60.0)
+        assert not queue.complete(first.id, "worker-a")
+
+        time.sleep(0.1)
+        assert queue.claim("worker-c", 60.0) is None  # 한도 소진 → 재클레임 안 함
+        assert queue.reap_expired() == ["run-1"]
+        assert queue.stats()["failed"] == 1
+
+        # 실패 재시도: 한도 내에서는 대기 상태로 복귀, retry=False면 즉시 실패
+        queue.enqueue("run-2", PAYLOAD)
+        job = queue.claim("worker-a", 60.0)
+        assert queue.fail(job.id, "worker-a", "boom")
+        job = queue.claim("worker-a", 60.0)
+        assert job.attempts == 2
+        assert not queue.fail(job.id, "worker-a", "boom")
+        queue.enqueue("run-3", PAYLOAD)
+        job = queue.claim("worker-a", 60.0)
+        assert not queue.fail(job.id, "worker-a", "pipeline failed", retry=False)
+        assert queue.stats()["failed"] == 3 and queue.stats()["pending"] == 0
+        print(f"[OK] {queue.stats()}")
+
+
+class FlakyHeartbeatQueue(SQLiteJobQueue):
+    """처음 N번 하트비트가 예외 (SQLite 잠금 등 일시 오류)"""
+
+    def __init__(self, path, failures: int):
+        super().__init__(path)
+        self.failures = failures
+
+    def heartbeat(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        if self.failures > 0:
+            self.failures -= 1
+            raise sqlite3.OperationalError("database is locked")
+        return super().heartbeat(job_id, worker_id, lease_seconds)
+
+
+def test_heartbeat_survives_transient_errors():
+    """하트비트 예외 후에도 리스 연장 계속, 리스를 잃었을 때만 keep_lease 반환"""
+    print("\n" + "=" * 60)
+    print("[TEST] Job Queue Heartbeat Errors")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = FlakyHeartbeatQueue(Path(tmp) / "queue.db", failures=2)
+        queue.enqueue("run-1", PAYLOAD)
+        job = queue.claim("worker-a", 1.0)
+        renewed = []
+
+        def lease_expires_at() -> float:
+            return queue._connect().execute(
+                "SELECT lease_expires_at FROM jobs WHERE id = ?", (job.id,)
+            ).fetchone()[0]
+
+        async def scenario():
+            async def on_renew():
+                renewed.append(time.time())
+                raise RuntimeError("runs table unavailable")  # 부가 기록 실패도 루프 유지
+
+            keeper = asyncio.create_task(keep_lease(queue, job, "worker-a", 1.0, 0.05, on_renew=on_renew))
+            await asyncio.sleep(0.4)
+            assert not keeper.done()  # 예외 2회 후에도 계속 실행
+            assert queue.failures == 0 and len(renewed) >= 2
+            assert lease_expires_at() > job.lease_expires_at
+
+            # 다른 워커가 가져간 것처럼 종료 → 리스 상실로 반환
+            assert queue.complete(job.id, "worker-a")
+            await asyncio.wait_for(keeper, timeout=1.0)
+
+        asyncio.run(scenario())
+        print(f"[OK] lease renewed {len(renewed)} times despite heartbeat errors")
+
+
+if __name__ == "__main__":
+    test_claim_is_exclusive_and_backpressure()
+    test_lease_expiry_and_retries()
+    test_heartbeat_survives_transient_errors()
+    print("\n[SUCCESS] All job queue tests passed!")
@@ -0,0 +1,313 @@
+"""KB 검색 정확성 테스트 (사전 계산 인덱스 vs 브루트포스, 밀집/하이브리드 백엔드)"""
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.models.schemas import KBSearchResult
+from backend.services.kb_record import KBHit
+from backend.services.kb_retrieval import DenseBackend, HashingEmbedder, HybridBackend
+from backend.services.kb_service import KBService, kb_service
+
+# KB 지연 로딩 → 테스트 전에 명시적으로 로드
+kb_service.ensure_loaded()
+
+
+QUERIES = [
+    "부동산 투자",
+    "인공지능과 디지털 전환",
+    "역사적 교훈과 제도",
+    "감정과 심리, 자기계발 습관",
+]
+
+
+def _brute_force_scores(query: str, domain: str) -> dict:
+    """도메인 후보 전체에 대해 cosine_similarity 직접 계산 (기준값)"""
+    candidates = kb_service.kb_items[domain]
+    rows = [kb_service.all_items.index(item) for item in candidates]
+    query_vector = kb_service.vectorizer.transform([query])
+    scores = cosine_similarity(query_vector, kb_service.tfidf_matrix[rows])[0]
+    return {item.anchor_id: float(score) for item, score in zip(candidates, scores)}
+
+
+def test_domain_rows_cover_kb_items():
+    """도메인별 행 인덱스가 kb_items 순서와 일치하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Domain Row Index")
+    print("=" * 60)
+
+    for domain, items in kb_service.kb_items.items():
+        rows = kb_service.domain_rows[domain]
+        assert len(rows) == len(items)
+        assert kb_service.domain_matrices[domain].shape[0] == len(items)
+        assert [kb_service.all_items[r].anchor_id for r in rows] == [i.anchor_id for i in items]
+        print(f"[OK] {domain}: {len(rows)} rows")
+
+
+def test_domain_search_matches_brute_force():
+    """도메인 필터 검색 결과가 브루트포스 코사인 유사도와 일치하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Domain Search vs Brute Force")
+    print("=" * 60)
+
+    for query in QUERIES:
+        for domain in kb_service.KB_DOMAINS:
+            expected = _brute_force_scores(query, domain)
+            results = kb_service.search(query, domain=domain, top_k=5, prioritize_integrated=False)
+
+            top_expected = sorted(expected.values(), reverse=True)[:5]
+            assert np.allclose([r.similarity_score for r in results], top_expected, atol=1e-9)
+            for r in results:
+                assert r.item.domain == domain
+                assert abs(expected[r.item.anchor_id] - r.similarity_score) < 1e-9
+
+        print(f"[OK] '{query}' matches brute force in all domains")
+
+
+def test_search_many_matches_search():
+    """search_many 일괄 검색이 개별 search 호출과 동일한 결과를 반환하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] search_many vs search")
+    print("=" * 60)
+
+    domains = kb_service.KB_DOMAINS + [None]
+    for prioritize in (True, False):
+        grouped = kb_service.search_many(
+            QUERIES, domains=domains, top_k=3, prioritize_integrated=prioritize
+        )
+        assert len(grouped) == len(QUERIES)
+
+        for query, per_domain in zip(QUERIES, grouped):
+            for domain in domains:
+                expected = kb_service.search(
+                    query, domain=domain, top_k=3, prioritize_integrated=prioritize
+                )
+                actual = per_domain[domain]
+                assert [r.item.anchor_id for r in actual] == [r.item.anchor_id for r in expected]
+                assert np.allclose(
+                    [r.similarity_score for r in actual],
+                    [r.similarity_score for r in expected],
+                    atol=1e-9,
+                )
+
+        print(f"[OK] prioritize_integrated={prioritize}: {len(QUERIES)} queries x {len(domains)} domains")
+
+
+def test_integrated_boost_ranking():
+    """가산치 벡터 + 부분 선택 순위가 (가산 점수 안정 정렬) 기준과 같고, 원시 배열 API와 일치하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Integrated Knowledge Boost Ranking")
+    print("=" * 60)
+
+    index = kb_service.index
+    assert index.integrated_bonus.shape == (len(index.all_items),)
+    assert all(
+        (bonus > 0) == item.is_integrated_knowledge
+        for bonus, item in zip(index.integrated_bonus, index.all_items)
+    )
+
+    for domain in kb_service.KB_DOMAINS + [None]:
+        candidates = kb_service.kb_items[domain] if domain else kb_service.all_items
+        for query in QUERIES:
+            scores = _brute_force_scores(query, domain) if domain else None
+            results = kb_service.search(query, domain=domain, top_k=7, min_score=0.01)
+            if scores is not None:
+                # 기준: (원래 점수 + 통합지식 0.05) 내림차순 안정 정렬 → 상위 7 → min_score 필터
+                ranked = sorted(
+                    candidates,
+                    key=lambda item: scores[item.anchor_id] + (0.05 if item.is_integrated_knowledge else 0.0),
+                    reverse=True
+                )[:7]
+                expected = [item.anchor_id for item in ranked if scores[item.anchor_id] >= 0.01]
+                assert [r.item.anchor_id for r in results] == expected
+
+            rows, sims = kb_service.search_indices(query, domain=domain, top_k=7, min_score=0.01)
+            assert [index.all_items[row].anchor_id for row in rows] == [r.item.anchor_id for r in results]
+            assert np.allclose(sims, [r.similarity_score for r in results])
+    print("[OK] Boosted top-k matches stable-sort reference, raw arrays match results")
+
+
+def test_search_hits_are_lightweight():
+    """검색 결과가 경량 레코드(KBHit/KBRecord)이고, API 경계에서 KBSearchResult로 변환되는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Lightweight Search Hits")
+    print("=" * 60)
+
+    hits = kb_service.search(QUERIES[0], top_k=3)
+    assert hits and all(isinstance(hit, KBHit) for hit in hits)
+    assert not hasattr(hits[0], "__dict__") and not hasattr(hits[0].item, "__dict__")
+
+    for hit in hits:
+        result = hit.to_result()
+        assert isinstance(result, KBSearchResult)
+        assert result.item == kb_service.get_item_by_anchor(hit.item.anchor_id)
+        assert result.similarity_score == hit.similarity_score
+    print("[OK] Slotted hits convert to KBSearchResult at the boundary")
+
+
+def test_query_cache():
+    """동일 쿼리(공백 정규화) 재검색은 캐시 히트, 파라미터 변경은 미스, 재로드 시 무효화되는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Query Result Cache")
+    print("=" * 60)
+
+    service = KBService(use_snapshot=False, query_cache_size=2, query_cache_ttl=None)
+    service.ensure_loaded()
+    cache = service.query_cache
+
+    first = service.search("부동산  투자\n", domain="경제경영", top_k=3)
+    again = service.search(" 부동산 투자", domain="경제경영", top_k=3)
+    assert again == first and again is not first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    service.search("부동산 투자", domain="경제경영", top_k=4)
+    service.search_many(["부동산 투자"], domains=["경제경영"], top_k=3)
+    assert (cache.misses, cache.evictions) == (3, 1)
+    assert service.search_many(["부동산 투자"], domains=["경제경영"], top_k=3)[0]["경제경영"] == first
+    assert cache.hits == 2
+
+    # 재로드 → 인덱스 버전 변경, 이전 결과 제거
+    service.reload(force=True)
+    assert cache.stats()["size"] == 0
+    assert service.search("부동산 투자", domain="경제경영", top_k=3) == first
+    assert cache.misses == 4
+    assert service.get_index_status()["query_cache"]["hits"] == 2
+
+    # TTL 만료
+    service.configure_query_cache(8, ttl=0.0)
+    service.search("부동산 투자", top_k=3)
+    service.search("부동산 투자", top_k=3)
+    assert (service.query_cache.hits, service.query_cache.misses) == (0, 2)
+    print(f"[OK] {cache.stats()}")
+
+
+def test_async_search_and_tool():
+    """asearch 동시 실행 결과가 search와 같고, kb_search 도구의 비동기/JSON 모드가 동작하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Async KB Search Tool")
+    print("=" * 60)
+
+    from backend.tools.kb_search import create_kb_search_tool
+
+    async def run_concurrently():
+        return await asyncio.gather(*[kb_service.asearch(q, top_k=5) for q in QUERIES])
+
+    for query, hits in zip(QUERIES, asyncio.run(run_concurrently())):
+        assert hits == kb_service.search(query, top_k=5)
+    print(f"[OK] {len(QUERIES)} concurrent asearch calls match search")
+
+    text_tool = create_kb_search_tool()
+    json_tool = create_kb_search_tool(output_format="json")
+    assert asyncio.run(text_tool.ainvoke(QUERIES[0])) == text_tool.invoke(QUERIES[0])
+
+    payload = json.loads(asyncio.run(json_tool.ainvoke(QUERIES[0])))
+    expected = kb_service.search(QUERIES[0], top_k=5)
+    assert payload["query"] == QUERIES[0]
+    assert [r["anchor_id"] for r in payload["results"]] == [hit.item.anchor_id for hit in expected]
+    assert payload["results"][0]["rank"] == 1
+    print("[OK] Tool coroutine and JSON output mode")
+
+
+def test_anchor_lookup_index():
+    """anchor 인덱스 조회가 선형 탐색과 동일한 결과를 반환하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Anchor Lookup Index")
+    print("=" * 60)
+
+    anchor_ids = kb_service.get_anchor_ids()
+    assert anchor_ids == tuple(item.anchor_id for item in kb_service.all_items)
+    assert kb_service.get_anchor_set() == frozenset(anchor_ids)
+
+    for anchor_id in anchor_ids:
+        expected = next(item for item in kb_service.all_items if item.anchor_id == anchor_id)
+        assert kb_service.get_item_by_anchor(anchor_id) is expected
+        assert kb_service.has_anchor(anchor_id)
+
+    assert kb_service.get_item_by_anchor("투자전략_최적화_001") is None
+    assert not kb_service.has_anchor("투자전략_최적화_001")
+    print(f"[OK] {len(anchor_ids)} anchors resolved via index")
+
+
+class _CountingEmbedder(HashingEmbedder):
+    """호출된 텍스트 수를 기록하는 결정적 로컬 임베딩"""
+
+    def __init__(self):
+        super().__init__(dim=128)
+        self.embedded = 0
+
+    def __call__(self, texts):
+        self.embedded += len(texts)
+        return super().__call__(texts)
+
+
+def test_dense_and_hybrid_backends():
+    """밀집 백엔드가 브루트포스 코사인과 일치하고, 임베딩이 메모리 매핑 캐시로 재사용되는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Dense / Hybrid Retrieval Backends")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        embedder = _CountingEmbedder()
+        dense = DenseBackend(embedder, model_name="hashing-test")
+        service = KBService(index_dir=index_dir, backend=dense)
+        service.ensure_loaded()
+        n_items = len(service.all_items)
+        assert embedder.embedded == n_items
+        assert service.index.embeddings.dtype == np.float32
+        assert isinstance(service.index.embeddings, np.memmap)
+
+        # 브루트포스: 아이템/쿼리 임베딩 직접 계산 후 코사인
+        item_vectors = embedder([item.content for item in service.all_items])
+        for query in QUERIES:
+            for domain in service.KB_DOMAINS:
+                candidates = service.kb_items[domain]
+                rows = [service.all_items.index(item) for item in candidates]
+                scores = np.clip(cosine_similarity(embedder([query]), item_vectors[rows])[0], 0.0, 1.0)
+                results = service.search(query, domain=domain, top_k=5, prioritize_integrated=False)
+                assert np.allclose(
+                    [r.similarity_score for r in results], sorted(scores, reverse=True)[:5], atol=1e-5
+                )
+        print(f"[OK] Dense search matches brute force ({n_items} items)")
+
+        # 같은 스냅샷으로 재로드 시 KB 임베딩 재계산 없음 (쿼리 임베딩만)
+        reloaded_embedder = _CountingEmbedder()
+        reloaded = KBService(index_dir=index_dir, backend=DenseBackend(reloaded_embedder, "hashing-test"))
+        reloaded.ensure_loaded()
+        assert reloaded_embedder.embedded == 0
+        print("[OK] KB embeddings reused from memory-mapped cache")
+
+        # 하이브리드 = alpha × dense + (1 - alpha) × tfidf
+        sparse_service = KBService(index_dir=index_dir)
+        hybrid_service = KBService(index_dir=index_dir, backend=HybridBackend(dense, alpha=0.3))
+        def all_scores(svc, query):
+            results = svc.search(query, top_k=n_items, prioritize_integrated=False)
+            return {r.item.anchor_id: r.similarity_score for r in results}
+
+        for query in QUERIES:
+            dense_scores = all_scores(service, query)
+            sparse_scores = all_scores(sparse_service, query)
+            for r in hybrid_service.search(query, top_k=5, prioritize_integrated=False):
+                expected = 0.3 * dense_scores[r.item.anchor_id] + 0.7 * sparse_scores[r.item.anchor_id]
+                assert abs(r.similarity_score - expected) < 1e-5
+        print("[OK] Hybrid scores fuse dense and TF-IDF scores")
+
+
+if __name__ == "__main__":
+    test_domain_rows_cover_kb_items()
+    test_domain_search_matches_brute_force()
+    test_search_many_matches_search()
+    test_integrated_boost_ranking()
+    test_search_hits_are_lightweight()
+    test_query_cache()
+    test_async_search_and_tool()
+    test_anchor_lookup_index()
+    test_dense_and_hybrid_backends()
+    print("\n[SUCCESS] All KB search tests passed!")
@@ -0,0 +1,305 @@
+"""KB 인덱스 스냅샷 테스트 (저장 → 로드 → 검색 결과 동일성, 핫 리로드)"""
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.core.domain_registry import load_domain_registry
+from backend.services.kb_service import KBService
+from backend.services.kb_snapshot import KBQueryVectorizer, save_snapshot
+from backend.services.kb_tokenizer import ANALYZERS, get_analyzer, morpheme_tokens
+
+
+QUERIES = ["부동산 투자", "인공지능", "역사적 교훈", "자기계발 습관"]
+
+
+def _search_all(service: KBService) -> list:
+    return [
+        [(r.item.anchor_id, r.similarity_score) for r in service.search(q, domain=d, top_k=5)]
+        for q in QUERIES
+        for d in [None] + service.KB_DOMAINS
+    ]
+
+
+def test_query_vectorizer_matches_sklearn():
+    """KBQueryVectorizer가 TfidfVectorizer.transform과 동일한 벡터를 생성하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] KBQueryVectorizer vs TfidfVectorizer")
+    print("=" * 60)
+
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    corpus = ["경제 성장과 투자 전략", "인공지능 시대의 노동", "투자 투자 리스크 관리", "Deep Learning AI"]
+    tfidf = TfidfVectorizer(max_features=1000).fit(corpus)
+    encoder = KBQueryVectorizer(tfidf.vocabulary_, tfidf.idf_)
+
+    queries = ["투자 전략과 리스크", "AI와 인공지능 인공지능", "관련 없는 쿼리"]
+    assert np.allclose(encoder.transform(queries).toarray(), tfidf.transform(queries).toarray())
+    print("[OK] Query vectors match (sklearn default)")
+
+    # kb_tokenizer 분석기별로 학습/쿼리 벡터 일치
+    for analyzer in ANALYZERS:
+        tfidf = TfidfVectorizer(analyzer=get_analyzer(analyzer)).fit(corpus)
+        encoder = KBQueryVectorizer(tfidf.vocabulary_, tfidf.idf_, analyzer=analyzer)
+        assert np.allclose(encoder.transform(queries).toarray(), tfidf.transform(queries).toarray())
+        print(f"[OK] Query vectors match (analyzer={analyzer}, {len(tfidf.vocabulary_)} terms)")
+
+
+def test_morpheme_analyzer_strips_particles():
+    """형태소 분석기가 조사/어미를 제거해 같은 어간으로 모으는지 확인"""
+    assert morpheme_tokens("경제의 성장은 경제를 바꾼다") == ["경제", "성장", "경제", "바꾼다"]
+    assert morpheme_tokens("기술적인 혁신으로 AI가") == ["기술", "혁신", "ai"]
+    # 1음절 조사는 어간이 2자 이상일 때만 제거 ("나이" 유지)
+    assert morpheme_tokens("나이 돈을") == ["나이", "돈을"]
+    print("[OK] Morpheme analyzer strips particles")
+
+
+def test_snapshot_roundtrip():
+    """스냅샷 저장 후 재로드 시 파싱 없이 동일한 검색 결과를 반환하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] KB Index Snapshot Roundtrip")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        built = KBService(index_dir=index_dir)
+        built.load_all_domains()
+        snapshots = [p for p in Path(index_dir).iterdir() if p.is_dir()]
+        assert len(snapshots) == 1
+        print(f"[OK] Snapshot saved: {snapshots[0].name}")
+
+        loaded = KBService(index_dir=index_dir)
+        # 스냅샷 경로에서는 파싱이 호출되지 않아야 함
+        loaded._parse_kb_file = lambda *args, **kwargs: (_ for _ in ()).throw(
+            AssertionError("KB file parsed despite valid snapshot")
+        )
+        counts = loaded.load_all_domains()
+
+        assert counts == {d: len(items) for d, items in built.kb_items.items()}
+        assert [i.anchor_id for i in loaded.all_items] == [i.anchor_id for i in built.all_items]
+        # 매트릭스는 메모리 매핑된 읽기 전용 배열, 도메인 서브 매트릭스는 그 뷰
+        assert not loaded.tfidf_matrix.data.flags.writeable
+        for domain_matrix in loaded.domain_matrices.values():
+            assert np.shares_memory(domain_matrix.data, loaded.tfidf_matrix.data)
+
+        for expected, actual in zip(_search_all(built), _search_all(loaded)):
+            assert [a for a, _ in expected] == [a for a, _ in actual]
+            assert np.allclose([s for _, s in expected], [s for _, s in actual])
+
+        print(f"[OK] {len(loaded.all_items)} items loaded from snapshot with identical search results")
+
+
+def test_snapshot_invalidated_on_param_change():
+    """인덱싱 파라미터가 바뀌면 다른 해시로 재빌드되는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] KB Index Snapshot Invalidation")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        KBService(index_dir=index_dir).load_all_domains()
+        first = {p.name for p in Path(index_dir).iterdir() if p.is_dir()}
+
+        service = KBService(index_dir=index_dir)
+        service.MAX_FEATURES = 500
+        service.load_all_domains()
+        second = {p.name for p in Path(index_dir).iterdir() if p.is_dir()}
+
+        assert first != second
+        assert service.tfidf_matrix.shape[1] <= 500
+        print("[OK] Snapshot rebuilt after parameter change")
+
+
+def test_prune_keeps_other_configurations():
+    """같은 index_dir를 쓰는 다른 설정의 스냅샷/임베딩은 유지하고 같은 설정의 이전 스냅샷만 정리하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] KB Index Snapshot Pruning")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        embeddings = Path(index_dir) / "embeddings_test.npy"
+        np.save(embeddings, np.zeros((2, 3), dtype=np.float32))
+
+        default = KBService(index_dir=index_dir)
+        default.load_all_domains()
+        small = KBService(index_dir=index_dir)
+        small.MAX_FEATURES = 500
+        small.load_all_domains()
+
+        snapshots = {p.name for p in Path(index_dir).iterdir() if p.is_dir()}
+        assert snapshots == {default.index.source_hash, small.index.source_hash}
+        assert embeddings.exists()
+        print("[OK] Snapshots of both configurations kept")
+
+        # 같은 params로 KB 내용만 바뀐 새 스냅샷 → 이전 스냅샷만 삭제
+        save_snapshot(
+            Path(index_dir), "newer-kb", {}, {"투자": 0}, np.ones(1), csr_matrix((0, 1)),
+            params=small._index_params()
+        )
+        snapshots = {p.name for p in Path(index_dir).iterdir() if p.is_dir()}
+        assert snapshots == {default.index.source_hash, "newer-kb"}
+        assert embeddings.exists()
+        print("[OK] Only the stale snapshot of the same configuration pruned")
+
+
+def test_reload_swaps_index_atomically():
+    """KB 파일 변경 후 reload 시 새 인덱스로 교체되고 기존 인덱스는 그대로인지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] KB Hot Reload")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = Path(tmp) / "docs"
+        kb_dir.mkdir()
+        for file_path in (project_root / "docs").glob("지식베이스생성_*_구글스튜디오.md"):
+            shutil.copy(file_path, kb_dir / file_path.name)
+
+        service = KBService(kb_dir=str(kb_dir), index_dir=str(Path(tmp) / "index"))
+        service.ensure_loaded()
+        old_index = service.index
+        old_count = len(old_index.all_items)
+
+        # 내용 변경 없음 → 재빌드 생략
+        assert service.reload()["reloaded"] is False
+        assert service.index is old_index
+
+        # 새 소분류/인사이트 추가
+        target = kb_dir / "지식베이스생성_경제경영_구글스튜디오.md"
+        with open(target, "a", encoding="utf-8") as f:
+            f.write(
+                "\n### **소분류: 핫리로드테스트**\n\n"
+                "| 핵심 인사이트 | 참고 도서 |\n| :---- | :---- |\n"
+                "| 양자 얽힘 기반 물류 최적화 인사이트 | 테스트 도서 |\n"
+            )
+
+        status = service.reload()
+        assert status["reloaded"] is True
+        assert status["version"] == old_index.version + 1
+        assert len(service.all_items) == old_count + 1
+
+        # 기존 인덱스 객체는 변경되지 않음 (진행 중 검색은 일관된 스냅샷 사용)
+        assert len(old_index.all_items) == old_count
+        results = service.search("양자 얽힘 물류 최적화", domain="경제경영", top_k=1)
+        assert results and results[0].item.subcategory == "핫리로드테스트"
+
+        print(f"[OK] Index v{old_index.version} → v{status['version']} ({old_count} → {status['total_items']} items)")
+
+
+def test_parallel_load_is_deterministic():
+    """병렬 파싱 결과가 순차 파싱과 같은 순서/내용인지, 도메인별 소요 시간이 기록되는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Parallel KB Loading")
+    print("=" * 60)
+
+    sequential = KBService(use_snapshot=False)
+    sequential.load_all_domains()
+    parallel = KBService(use_snapshot=False, parallel_load=True, max_workers=2)
+    parallel.load_all_domains()
+
+    assert [i.model_dump() for i in parallel.all_items] == [i.model_dump() for i in sequential.all_items]
+    assert list(parallel.kb_items) == list(sequential.kb_items)
+
+    timings = parallel.get_index_status()["load_timings_ms"]
+    assert timings["mode"] == "parallel"
+    assert all(f"parse:{domain}" in timings for domain in parallel.kb_items)
+    print(f"[OK] Parallel parse matches sequential ({timings['parse_total']:.1f}ms total)")
+
+
+def test_integrity_report():
+    """로드 시 무결성 리포트가 중복 ID / 빈 인사이트 / 고아 소분류를 검출하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] KB Integrity Report")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = Path(tmp) / "docs"
+        kb_dir.mkdir()
+        for file_path in (project_root / "docs").glob("지식베이스생성_*_구글스튜디오.md"):
+            shutil.copy(file_path, kb_dir / file_path.name)
+
+        service = KBService(kb_dir=str(kb_dir), use_snapshot=False)
+        service.load_all_domains()
+        report = service.get_stats().integrity
+        assert report.ok and not report.has_warnings
+        assert sum(f.integrated_sections for f in report.files) == sum(
+            1 for item in service.all_items if item.is_integrated_knowledge
+        )
+        print(f"[OK] Clean KB passes ({report.elapsed_ms:.1f}ms)")
+
+        # 고아 소분류 + 빈 융합형 인사이트 + 같은 소분류 통합지식 2회(anchor_id/kb_id 중복) 추가
+        target = kb_dir / "지식베이스생성_인문자기계발_구글스튜디오.md"
+        with open(target, "a", encoding="utf-8") as f:
+            f.write(
+                "\n### **소분류: 빈소분류**\n\n"
+                "### **소분류: 무결성테스트**\n\n"
+                "| 핵심 인사이트 | 참고 도서 |\n| :---- | :---- |\n"
+                "| **(융합형)** | 테스트 도서 |\n"
+                "\n**통합 지식**\n\n첫 번째 통합지식\n"
+                "\n### **소분류: 무결성테스트**\n\n**통합 지식**\n\n두 번째 통합지식\n"
+            )
+
+        service.load_all_domains()
+        report = service.get_stats().integrity
+        file_report = next(f for f in report.files if f.domain == "인문자기계발")
+        assert not report.ok and report.has_warnings
+        assert "빈소분류" in file_report.orphan_subcategories
+        assert len(file_report.empty_insights) == 1
+        assert report.duplicate_anchor_ids == {"인문자기계발·무결성테스트 통합지식": 2}
+        assert len(report.duplicate_kb_ids) == 1
+        assert service.validate_uniqueness()["duplicate_anchors"] == ["인문자기계발·무결성테스트 통합지식"]
+        print("[OK] Duplicates, empty insights and orphan subcategories detected")
+
+
+def test_domain_registry_drives_kb_discovery():
+    """설정 파일의 도메인 목록/파일명이 KB 파일 탐색과 도메인별 인덱스를 결정하는지 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Domain Registry")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        kb_dir = Path(tmp) / "docs"
+        kb_dir.mkdir()
+        # 과학기술은 비활성화, 역사사회는 다른 파일명으로 등록
+        shutil.copy(project_root / "docs" / "지식베이스생성_경제경영_구글스튜디오.md", kb_dir)
+        shutil.copy(project_root / "docs" / "지식베이스생성_역사사회_구글스튜디오.md", kb_dir / "history.md")
+        config = Path(tmp) / "domains.json"
+        config.write_text(
+            '{"domains": ['
+            '{"name": "경제/경영", "kb_name": "경제경영"},'
+            '{"name": "과학/기술", "kb_name": "과학기술", "enabled": false},'
+            '{"name": "역사/사회", "kb_name": "역사사회", "kb_file": "history.md"}'
+            ']}',
+            encoding="utf-8"
+        )
+
+        registry = load_domain_registry(config)
+        assert registry.kb_domains == ["경제경영", "역사사회"]
+        assert registry.kb_to_db == {"경제경영": "경제/경영", "역사사회": "역사/사회"}
+
+        service = KBService(kb_dir=str(kb_dir), use_snapshot=False, registry=registry)
+        service.load_all_domains()
+        assert service.KB_DOMAINS == ["경제경영", "역사사회"]
+        assert list(service.kb_items) == ["경제경영", "역사사회"]
+        assert service.index.integrity.ok
+        results = service.search_many(["역사적 교훈"], domains=service.KB_DOMAINS, top_k=3)[0]
+        assert set(results) == {"경제경영", "역사사회"}
+        assert all(r.item.domain == "역사사회" for r in results["역사사회"])
+        print(f"[OK] {len(service.all_items)} items from {len(registry)} configured domains")
+
+
+if __name__ == "__main__":
+    test_query_vectorizer_matches_sklearn()
+    test_morpheme_analyzer_strips_particles()
+    test_snapshot_roundtrip()
+    test_snapshot_invalidated_on_param_change()
+    test_prune_keeps_other_configurations()
+    test_reload_swaps_index_atomically()
+    test_parallel_load_is_deterministic()
+    test_integrity_report()
+    test_domain_registry_drives_kb_discovery()
+    print("\n[SUCCESS] All KB snapshot tests passed!")
@@ -0,0 +1,98 @@
+"""KB 스트리밍 파서 테스트 (줄 단위 상태 머신, 증분 yield)"""
+import io
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from backend.services.kb_parser import iter_kb_items, parse_kb_file
+
+
+SAMPLE_KB = """intro | 소분류 전 행은 무시 | row |
+**통합 지식**
+### **소분류: 경제예측/금융투자**
+| 핵심 인사이트 | 참고 도서 |
+| :---- | :---- |
+| 첫 인사이트 **(융합형)** | 책1, 책2 |
+|  | 인사이트 없는 행 |
+| 열 부족 |
+   | 들여쓴 행 | 책3 |
+**통합지식**
+통합 첫 줄
+
+| 표 안의 | 통합 |
+###  **소분류:** 헤더 아님
+### **소분류: 경영**
+| 두 번째 소분류 | 책4 |
+**통합 지식**
+마지막 통합지식
+"""
+
+
+def test_streaming_parser_state_machine():
+    """소분류/테이블/통합지식 블록 전이와 anchor_id 순번 확인"""
+    print("\n" + "=" * 60)
+    print("[TEST] Streaming KB Parser")
+    print("=" * 60)
+
+    items = list(iter_kb_items(io.StringIO(SAMPLE_KB), "경제경영"))
+
+    assert [item.anchor_id for item in items] == [
+        "경제경영_경제예측_금융투자_001",
+        "경제경영_경제예측_금융투자_002",
+        "경제경영·경제예측/금융투자 통합지식",
+        "경제경영_경영_003",
+        "경제경영·경영 통합지식",
+    ]
+    assert items[0].is_fusion and items[0].content == "첫 인사이트"
+    assert items[0].reference_books == ["책1", "책2"]
+    # 통합지식 블록은 다음 소분류 섹션 시작 줄 전까지 (빈 줄 제외) 수집
+    assert items[2].content == "통합 첫 줄 | 표 안의 | 통합 |"
+    assert items[2].is_integrated_knowledge and items[2].reference_books == []
+    # 파일 끝의 통합지식 블록도 반영
+    assert items[4].content == "마지막 통합지식"
+    print(f"[OK] {len(items)} items parsed")
+
+
+def test_streaming_parser_is_incremental():
+    """첫 아이템이 입력 전체를 읽기 전에 yield되는지 확인 (제한된 메모리)"""
+    print("\n" + "=" * 60)
+    print("[TEST] Streaming KB Parser Incremental Yield")
+    print("=" * 60)
+
+    consumed = []
+
+    def lines():
+        yield "### **소분류: 테스트**\n"
+        for i in range(1000):
+            consumed.append(i)
+            yield f"| 인사이트 {i} | 책 |\n"
+
+    items = iter_kb_items(lines(), "과학기술")
+    first = next(items)
+    assert first.content == "인사이트 0"
+    assert len(consumed) == 1
+    print("[OK] First item yielded after reading 2 lines")
+
+
+def test_parse_real_kb_files():
+    """실제 KB 파일 파싱 결과 기본 검증"""
+    print("\n" + "=" * 60)
+    print("[TEST] Streaming KB Parser on KB Files")
+    print("=" * 60)
+
+    for file_path in sorted((project_root / "docs").glob("지식베이스생성_*_구글스튜디오.md")):
+        domain = file_path.name.split("_")[1]
+        items = parse_kb_file(file_path, domain)
+        assert items and all(item.domain == domain and item.content for item in items)
+        assert any(item.is_integrated_knowledge for item in items)
+        print(f"[OK] {domain}: {len(items)} items")
+
+
+if __name__ == "__main__":
+    test_streaming_parser_state_machine()
+    test_streaming_parser_is_incremental()
+    test_parse_real_kb_files()
+    print("\n[SUCCESS] All streaming parser tests passed!")
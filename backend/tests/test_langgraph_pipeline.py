@@ -1,5 +1,6 @@
 """LangGraph Pipeline Test Script"""
 
+import asyncio
 import sys
 from pathlib import Path
 import os
@@ -60,6 +61,20 @@ def test_kb_loading():
     return total > 0
 
 
+def iter_astream(graph, inputs, config):
+    """graph.astream을 동기 이터레이터로 실행 (노드가 비동기이므로 graph.stream 대신 사용)"""
+    loop = asyncio.new_event_loop()
+    events = graph.astream(inputs, config).__aiter__()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(events.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.close()
+
+
 def test_single_node_anchor_mapper():
     """AnchorMapper 노드 단독 테스트"""
     print("\n" + "=" * 60)
@@ -74,7 +89,7 @@ def test_single_node_anchor_mapper():
     )
 
     try:
-        result = anchor_mapper_node(test_state)
+        result = asyncio.run(anchor_mapper_node(test_state))
 
         if "anchors" in result:
             print("[OK] Anchors mapped:")
@@ -190,7 +205,7 @@ def test_pipeline_execution():
 
         # 스트리밍 실행
         node_count = 0
-        for event in graph.stream(initial_state, config):
+        for event in iter_astream(graph, initial_state, config):
             node_name = list(event.keys())[0]
             node_data = event[node_name]
             node_count += 1
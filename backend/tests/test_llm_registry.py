@@ -0,0 +1,172 @@
+"""LLM 클라이언트 레지스트리 테스트 (설정별 재사용, 공유 연결 풀, 이벤트 루프별 분리, 응답 캐시)"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 클라이언트 생성만 확인 (API 호출 없음)
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from langchain_core.load import dumps
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+from backend.core.models_config import models_config
+from backend.langgraph_pipeline.nodes.reviewers import DomainReview
+from backend.services.llm_cache import InMemoryLLMCache
+from backend.services.llm_registry import LLMClientRegistry
+
+
+def test_clients_reused_per_configuration():
+    """같은 (model, temperature, schema)는 같은 인스턴스, 모든 클라이언트가 httpx 풀 공유"""
+    print("\n" + "=" * 60)
+    print("[TEST] LLM Client Registry")
+    print("=" * 60)
+
+    registry = LLMClientRegistry(max_connections=8, max_keepalive_connections=4)
+
+    plain = registry.for_node("reviewer")
+    assert registry.for_node("reviewer") is plain
+    structured = registry.for_node("reviewer", DomainReview)
+    assert structured is not plain
+    assert registry.for_node("reviewer", DomainReview) is structured
+    other = registry.get_client("gpt-4.1-mini", 0.9)
+    assert other is not plain
+
+    assert plain.http_client is other.http_client
+    pool = plain.http_client._transport._pool
+    assert pool._max_connections == 8 and pool._max_keepalive_connections == 4
+    assert registry.stats()["created"] == 3 and registry.stats()["reused"] == 2
+    print(f"[OK] {registry.stats()}")
+
+
+def test_async_clients_bound_to_event_loop():
+    """비동기 httpx 클라이언트는 이벤트 루프별로 생성되고, 같은 루프에서는 재사용"""
+    print("\n" + "=" * 60)
+    print("[TEST] LLM Client Registry per Event Loop")
+    print("=" * 60)
+
+    registry = LLMClientRegistry()
+
+    async def lookup():
+        first = registry.for_node("producer")
+        assert registry.for_node("producer") is first
+        return first
+
+    client_a = asyncio.run(lookup())
+    client_b = asyncio.run(lookup())
+    assert client_a is not client_b
+    assert client_a.http_async_client is not client_b.http_async_client
+    assert client_a.http_client is client_b.http_client
+
+    asyncio.run(registry.aclose())
+    assert registry.stats()["clients"] == 0
+    print("[OK] Async clients isolated per loop, sync pool shared")
+
+
+def test_reconfigure_closes_replaced_clients():
+    """설정이 같으면 유지, 바뀌면 기존 httpx 클라이언트 종료, 응답 캐시 교체는 연결 풀 유지"""
+    print("\n" + "=" * 60)
+    print("[TEST] LLM Client Registry Reconfigure")
+    print("=" * 60)
+
+    registry = LLMClientRegistry(max_connections=8, max_keepalive_connections=4, keepalive_expiry=60.0, timeout=120.0)
+
+    async def scenario():
+        llm = registry.for_node("producer")
+        sync_http, async_http = llm.http_client, llm.http_async_client
+
+        registry.configure(8, 4, 60.0, 120.0)
+        registry.configure_response_cache(InMemoryLLMCache())
+        rebuilt = registry.for_node("producer")
+        assert rebuilt is not llm  # 캐시 설정 반영
+        assert rebuilt.http_client is sync_http and rebuilt.http_async_client is async_http
+
+        registry.configure(16, 4, 60.0, 120.0)
+        await asyncio.sleep(0)
+        assert sync_http.is_closed and async_http.is_closed
+        assert registry.for_node("producer").http_client is not sync_http
+
+    asyncio.run(scenario())
+    asyncio.run(registry.aclose())
+    print("[OK] Replaced clients closed")
+
+
+def test_response_cache_for_deterministic_nodes():
+    """temperature 0 노드만 캐시 연결, 캐시 히트는 API 호출 없이 반환 (invoke/ainvoke)"""
+    print("\n" + "=" * 60)
+    print("[TEST] LLM Response Cache")
+    print("=" * 60)
+
+    registry = LLMClientRegistry()
+    cache = InMemoryLLMCache(max_size=8)
+    registry.configure_response_cache(cache)
+
+    # anchor_mapper(0.0)는 캐시 사용, producer(0.7)는 샘플링 노드라 우회
+    llm = registry.for_node("anchor_mapper")
+    assert llm.cache is cache
+    assert registry.for_node("producer").cache is False
+
+    messages = [HumanMessage(content="도서 요약: 테스트")]
+    cached = AIMessage(content="cached analysis")
+    cache.update(dumps(messages), llm._get_llm_string(), [ChatGeneration(message=cached)])
+
+    # 더미 API 키라 실제 호출이면 실패 → 응답이 오면 캐시 히트
+    assert llm.invoke(messages).content == "cached analysis"
+    assert asyncio.run(llm.ainvoke(messages)).content == "cached analysis"
+    assert cache.stats()["hits"] == 2
+
+    # 온도가 다르면 다른 키 (미스)
+    other = registry.get_client("gpt-4.1-mini", 0.5, cached=True)
+    assert cache.lookup(dumps(messages), other._get_llm_string()) is None
+    print(f"[OK] {cache.stats()}")
+
+
+def test_structured_output_cache_hit():
+    """구조화 출력(json_schema) 응답도 캐시에서 복원되어 pydantic 객체로 파싱"""
+    print("\n" + "=" * 60)
+    print("[TEST] LLM Response Cache (Structured Output)")
+    print("=" * 60)
+
+    # reviewer(0.3)는 샘플링 노드 → 테스트 동안만 캐시 허용
+    allow_sampling = models_config.RESPONSE_CACHE_ALLOW_SAMPLING
+    type(models_config).RESPONSE_CACHE_ALLOW_SAMPLING = ("reviewer",)
+    try:
+        registry = LLMClientRegistry()
+        cache = InMemoryLLMCache(max_size=8)
+        registry.configure_response_cache(cache)
+        structured = registry.for_node("reviewer", DomainReview)
+    finally:
+        type(models_config).RESPONSE_CACHE_ALLOW_SAMPLING = allow_sampling
+
+    # with_structured_output = (response_format 바인딩된 ChatOpenAI) | parser
+    # (ls_structured_output_format은 호출 시 추적용으로 빠지고 키에 포함되지 않음)
+    bound = structured.first
+    assert bound.bound.cache is cache
+    call_kwargs = {k: v for k, v in bound.kwargs.items() if k != "ls_structured_output_format"}
+    review = DomainReview(advantages="장점", problems="문제", conditions="조건")
+    messages = [HumanMessage(content="도서 요약: 테스트")]
+    cache.update(
+        dumps(messages),
+        bound.bound._get_llm_string(**call_kwargs),
+        [ChatGeneration(message=AIMessage(content=review.model_dump_json(), additional_kwargs={"parsed": review}))]
+    )
+
+    # 캐시 저장은 JSON(dict) → 파서가 DomainReview로 복원 (더미 API 키라 호출이면 실패)
+    assert structured.invoke(messages) == review
+    assert asyncio.run(structured.ainvoke(messages)) == review
+    assert cache.stats()["hits"] == 2
+    print(f"[OK] {cache.stats()}")
+
+
+if __name__ == "__main__":
+    test_clients_reused_per_configuration()
+    test_async_clients_bound_to_event_loop()
+    test_reconfigure_closes_replaced_clients()
+    test_response_cache_for_deterministic_nodes()
+    test_structured_output_cache_hit()
+    print("\n[SUCCESS] All LLM registry tests passed!")
@@ -24,6 +24,7 @@ from backend.langgraph_pipeline.state import create_initial_state
 from backend.langgraph_pipeline.graph import graph
 from backend.langgraph_pipeline.utils import assemble_final_1p
 from backend.core.models_config import models_config
+from backend.tests.test_langgraph_pipeline import iter_astream
 
 # 모델명 가져오기 (파일명에 사용)
 model_name = models_config.PRODUCER_MODEL.replace('/', '_').replace('.', '_')
@@ -136,7 +137,7 @@ def test_phase1_5_quality():
     validator_output = None  # Validator 출력 별도 저장
     
     try:
-        for event in graph.stream(initial_state, config):
+        for event in iter_astream(graph, initial_state, config):
             node_name = list(event.keys())[0]
             node_count += 1
             
@@ -0,0 +1,93 @@
+"""Reviewer 메모이제이션 테스트 (같은 입력 재사용, 프롬프트/입력 변경 시 무효화)"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 메모 히트 경로만 확인 (API 호출 없음)
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from backend.langgraph_pipeline.nodes.reviewers import DomainReview, review_domain_node
+from backend.langgraph_pipeline.state import create_reviewer_input
+from backend.services.llm_cache import InMemoryLLMCache
+from backend.services.review_memo import review_memo, review_prompt_version
+
+
+def test_reviewer_reuses_memoized_review():
+    """첫 run 결과가 메모에 있으면 Reviewer는 LLM 호출 없이 같은 리뷰 반환"""
+    print("\n" + "=" * 60)
+    print("[TEST] Reviewer Memo")
+    print("=" * 60)
+
+    store = InMemoryLLMCache()
+    review_memo.configure(store)
+    state = {
+        "book_ids": ["book-1"],
+        "book_summary": "습관은 작은 반복으로 만들어진다.",
+        "book_title": "습관의 힘",
+        "book_topic": "자기계발",
+        "anchors": {"경제경영": "경제경영_01"},
+        "kb_hits": {"경제경영": [{"anchor_id": "경제경영_01", "content": "복리 효과"}]},
+    }
+    review = {
+        "domain": "경제경영",
+        "anchor_id": "경제경영_01",
+        "advantages": "a",
+        "problems": "b",
+        "conditions": "c",
+        "raw_content": "장점: a\n\n문제: b\n\n조건: c",
+    }
+
+    # 노드가 계산한 메모 키를 기록하고 중단 (LLM 호출 전)
+    keys = []
+    original_aget = review_memo.aget
+
+    class KeyRecorded(Exception):
+        pass
+
+    async def record_key(key):
+        keys.append(key)
+        raise KeyRecorded
+
+    def node_key(node_state):
+        review_memo.aget = record_key
+        try:
+            asyncio.run(review_domain_node(create_reviewer_input(node_state, "경제경영")))
+        except KeyRecorded:
+            return keys[-1]
+        finally:
+            review_memo.aget = original_aget
+        raise AssertionError("memo lookup expected")
+
+    try:
+        key = node_key(state)
+        assert key.startswith("review:book-1:경제경영:경제경영_01:")
+        assert node_key(state) == key
+
+        # 첫 run이 저장한 리뷰 → 두 번째 run은 LLM 호출 없이 재사용 (더미 API 키)
+        review_memo.put(key, review)
+        result = asyncio.run(review_domain_node(create_reviewer_input(state, "경제경영")))
+        assert result["reviews"] == [review]
+        assert review_memo.stats()["hits"] == 1
+
+        # 앵커/도서 내용이 바뀌면 다른 키
+        assert node_key({**state, "anchors": {"경제경영": "경제경영_02"}}) != key
+        assert node_key({**state, "book_summary": "다른 요약"}) != key
+    finally:
+        review_memo.configure(None)
+
+    # 프롬프트/스키마/모델 변경 시 버전 변경
+    version = review_prompt_version("prompt", DomainReview, "gpt-4.1-mini", 0.3)
+    assert version == review_prompt_version("prompt", DomainReview, "gpt-4.1-mini", 0.3)
+    assert version != review_prompt_version("prompt v2", DomainReview, "gpt-4.1-mini", 0.3)
+    assert version != review_prompt_version("prompt", DomainReview, "gpt-4.1", 0.3)
+    print(f"[OK] {review_memo.stats()}")
+
+
+if __name__ == "__main__":
+    test_reviewer_reuses_memoized_review()
+    print("\n[SUCCESS] All review memo tests passed!")
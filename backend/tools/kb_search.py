@@ -1,55 +1,112 @@
 """LangChain Tool for KB search"""
 from langchain.tools import Tool
-from typing import Optional
+from typing import List, Optional
+from backend.core.domain_registry import domain_registry
+from backend.services.kb_record import KBHit
 from backend.services.kb_service import kb_service
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 도구 출력 형식 (text: 포맷된 문자열, json: 구조화된 JSON 문자열)
+OUTPUT_FORMATS = ("text", "json")
 
-def create_kb_search_tool() -> Tool:
+
+def format_results_text(query: str, results: List[KBHit]) -> str:
+    """검색 결과 → 번호 매긴 텍스트 (에이전트 프롬프트용)"""
+    if not results:
+        return f"No KB items found for query: '{query}'"
+
+    formatted_results = []
+    for i, result in enumerate(results, 1):
+        item = result.item
+        fusion_mark = "[FUSION]" if item.is_fusion else ""
+        score = f"(score: {result.similarity_score:.3f})"
+
+        formatted_results.append(
+            f"{i}. {fusion_mark} [{item.anchor_id}] {item.content}\n"
+            f"   출처: {', '.join(item.reference_books)} {score}"
+        )
+
+    return "\n\n".join(formatted_results)
+
+
+def format_results_json(query: str, results: List[KBHit]) -> str:
+    """검색 결과 → JSON 문자열 ({query, results: [...]}, 에이전트가 필드 단위로 파싱)"""
+    return json.dumps(
+        {
+            "query": query,
+            "results": [
+                {
+                    "rank": rank,
+                    "anchor_id": result.item.anchor_id,
+                    "domain": result.item.domain,
+                    "subcategory": result.item.subcategory,
+                    "content": result.item.content,
+                    "is_fusion": result.item.is_fusion,
+                    "is_integrated_knowledge": result.item.is_integrated_knowledge,
+                    "reference_books": list(result.item.reference_books),
+                    "score": round(result.similarity_score, 4),
+                }
+                for rank, result in enumerate(results, 1)
+            ],
+        },
+        ensure_ascii=False
+    )
+
+
+def create_kb_search_tool(output_format: str = "text") -> Tool:
     """
     KB 검색 LangChain Tool 생성
-    
-    LangGraph의 Reviewer 에이전트가 사용할 도구
+
+    LangGraph의 Reviewer 에이전트가 사용할 도구.
+    동기(func)와 비동기(coroutine) 구현을 모두 제공하므로 ainvoke/astream 실행 시
+    여러 검색이 공유 스레드 풀에서 동시에 수행된다 (이벤트 루프 비차단).
+
+    Args:
+        output_format: "text" (포맷된 문자열) 또는 "json" (구조화된 결과)
     """
-    
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format} (expected one of {OUTPUT_FORMATS})")
+
+    formatter = format_results_json if output_format == "json" else format_results_text
+
+    def format_error(e: Exception) -> str:
+        logger.error(f"[FAIL] KB search error: {e}")
+        if output_format == "json":
+            return json.dumps({"error": str(e)}, ensure_ascii=False)
+        return f"Error during KB search: {str(e)}"
+
     def search_kb(query: str, domain: Optional[str] = None, top_k: int = 5) -> str:
         """
         KB 검색 실행
-        
+
         Args:
             query: 검색 쿼리 (도서 요약 또는 개념)
-            domain: 도메인 필터 (경제경영/과학기술/역사사회/인문자기계발)
+            domain: 도메인 필터 (도메인 레지스트리의 KB 도메인)
             top_k: 반환할 결과 개수
-        
+
         Returns:
-            검색 결과 (포맷된 문자열)
+            검색 결과 (포맷된 문자열 또는 JSON)
         """
         try:
-            results = kb_service.search(query, domain=domain, top_k=top_k)
-            
-            if not results:
-                return f"No KB items found for query: '{query}'"
-            
-            # 결과 포맷팅
-            formatted_results = []
-            for i, result in enumerate(results, 1):
-                item = result.item
-                fusion_mark = "[FUSION]" if item.is_fusion else ""
-                score = f"(score: {result.similarity_score:.3f})"
-                
-                formatted_results.append(
-                    f"{i}. {fusion_mark} [{item.anchor_id}] {item.content}\n"
-                    f"   출처: {', '.join(item.reference_books)} {score}"
-                )
-            
-            return "\n\n".join(formatted_results)
-        
+            return formatter(query, kb_service.search(query, domain=domain, top_k=top_k))
+        except Exception as e:
+            return format_error(e)
+
+    async def asearch_kb(query: str, domain: Optional[str] = None, top_k: int = 5) -> str:
+        """KB 검색 실행 (비동기, 유사도 계산은 공유 스레드 풀에서)"""
+        try:
+            return formatter(query, await kb_service.asearch(query, domain=domain, top_k=top_k))
         except Exception as e:
-            logger.error(f"[FAIL] KB search error: {e}")
-            return f"Error during KB search: {str(e)}"
-    
+            return format_error(e)
+
+    output_hint = (
+        "Returns a JSON object with a 'results' list (anchor_id, domain, content, score, ...). "
+        if output_format == "json" else ""
+    )
+
     return Tool(
         name="kb_search",
         description=(
@@ -57,29 +114,18 @@ def create_kb_search_tool() -> Tool:
             "Useful when you need to find domain-specific expert knowledge "
             "related to book summaries or concepts. "
             "Input should be a search query string. "
-            "Optionally specify domain as one of: 경제경영, 과학기술, 역사사회, 인문자기계발"
+            f"{output_hint}"
+            f"Optionally specify domain as one of: {domain_registry.describe()}"
         ),
-        func=search_kb
+        func=search_kb,
+        coroutine=asearch_kb
     )
 
 
-def search_kb_by_domain(query: str, domain: str, top_k: int = 3) -> str:
-    """
-    도메인별 KB 검색 (간편 함수)
-    
-    Args:
-        query: 검색 쿼리
-        domain: 도메인 (경제경영/과학기술/역사사회/인문자기계발)
-        top_k: 반환할 결과 개수
-    
-    Returns:
-        검색 결과 (포맷된 문자열)
-    """
-    results = kb_service.search(query, domain=domain, top_k=top_k)
-    
+def _format_domain_results(query: str, domain: str, results: List[KBHit]) -> str:
     if not results:
         return f"No results found in domain '{domain}' for query: '{query}'"
-    
+
     formatted_results = []
     for result in results:
         item = result.item
@@ -88,6 +134,25 @@ def search_kb_by_domain(query: str, domain: str, top_k: int = 3) -> str:
             f"{fusion_mark} [{item.anchor_id}] {item.content}\n"
             f"출처: {', '.join(item.reference_books)}"
         )
-    
+
     return "\n\n".join(formatted_results)
 
+
+def search_kb_by_domain(query: str, domain: str, top_k: int = 3) -> str:
+    """
+    도메인별 KB 검색 (간편 함수)
+
+    Args:
+        query: 검색 쿼리
+        domain: 도메인 (도메인 레지스트리의 KB 도메인)
+        top_k: 반환할 결과 개수
+
+    Returns:
+        검색 결과 (포맷된 문자열)
+    """
+    return _format_domain_results(query, domain, kb_service.search(query, domain=domain, top_k=top_k))
+
+
+async def asearch_kb_by_domain(query: str, domain: str, top_k: int = 3) -> str:
+    """도메인별 KB 검색 (비동기 간편 함수)"""
+    return _format_domain_results(query, domain, await kb_service.asearch(query, domain=domain, top_k=top_k))
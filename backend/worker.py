@@ -0,0 +1,187 @@
+"""Run Worker - 작업 큐에서 run을 클레임하여 파이프라인 실행
+
+RUN_QUEUE_BACKEND=sqlite일 때 API 프로세스와 별도로 실행한다.
+
+    python -m backend.worker --concurrency 4
+
+- 슬롯(동시 실행 수)마다 큐를 폴링하여 run을 클레임 (리스 부여, runs.worker_id 기록)
+- 실행 중에는 하트비트로 리스 연장 (runs.heartbeat_at 갱신)
+- 워커가 죽으면 리스 만료 후 다른 워커가 재클레임 (최대 RUN_QUEUE_MAX_ATTEMPTS회)
+- 리스를 잃으면 (다른 워커가 재클레임) 실행 중인 파이프라인을 취소
+"""
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from datetime import datetime
+
+from backend.core.config import settings
+# 프로세스 환경 설정 (KB/그래프 모듈 import 전에 적용)
+from backend.services.bootstrap import configure_logging, configure_services
+from backend.services.job_queue import Job, JobQueue, keep_lease
+from backend.services.run_service import (
+    execute_job,
+    get_run_queue,
+    update_run_claim,
+    update_run_heartbeat,
+    update_run_status,
+)
+
+logger = logging.getLogger("backend.worker")
+
+
+class RunWorker:
+    """동시 실행 슬롯 N개로 작업 큐를 처리하는 워커"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        concurrency: int,
+        lease_seconds: float,
+        heartbeat_interval: float,
+        poll_interval: float
+    ):
+        if heartbeat_interval >= lease_seconds:
+            raise ValueError("heartbeat_interval must be shorter than lease_seconds")
+        self.queue = queue
+        self.concurrency = concurrency
+        self.lease_seconds = lease_seconds
+        self.heartbeat_interval = heartbeat_interval
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self._stopping = asyncio.Event()
+
+    def stop(self):
+        """새 작업 클레임 중단 (실행 중인 run은 끝까지 처리)"""
+        if not self._stopping.is_set():
+            logger.info(f"[WORKER] Stopping {self.worker_id} (finishing in-flight runs)")
+            self._stopping.set()
+
+    async def run(self):
+        logger.info(
+            f"[WORKER] {self.worker_id} started: concurrency={self.concurrency}, "
+            f"lease={self.lease_seconds}s, heartbeat={self.heartbeat_interval}s"
+        )
+        await asyncio.gather(*(self._slot() for _ in range(self.concurrency)))
+        logger.info(f"[WORKER] {self.worker_id} stopped")
+
+    async def _slot(self):
+        while not self._stopping.is_set():
+            await self._reap_expired()
+            job = await asyncio.to_thread(self.queue.claim, self.worker_id, self.lease_seconds)
+            if job is None:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._process(job)
+
+    async def _reap_expired(self):
+        """재시도 한도를 다 쓴 리스 만료 작업 → run 실패 기록"""
+        for run_id in await asyncio.to_thread(self.queue.reap_expired):
+            logger.error(f"[WORKER] Run {run_id} abandoned (lease expired, max attempts reached)")
+            await asyncio.to_thread(
+                update_run_status,
+                run_id,
+                "failed",
+                error_message="Worker lease expired (max attempts reached)",
+                completed_at=datetime.now()
+            )
+
+    async def _process(self, job: Job):
+        logger.info(f"[WORKER] Claimed run {job.run_id} (attempt {job.attempts})")
+        await asyncio.to_thread(update_run_claim, job.run_id, self.worker_id, job.attempts)
+
+        pipeline = asyncio.create_task(execute_job(job.run_id, job.payload, job.attempts))
+        heartbeat = asyncio.create_task(self._heartbeat(job, pipeline))
+
+        try:
+            succeeded = await pipeline
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            # 리스 상실 → 다른 워커가 이어받음 (큐/run 상태는 건드리지 않음)
+            logger.warning(f"[WORKER] Run {job.run_id} cancelled (lease lost)")
+            return
+        except Exception as e:
+            # execute_job 밖으로 나온 예외 → 재시도 대상
+            retry = await asyncio.to_thread(self.queue.fail, job.id, self.worker_id, str(e))
+            logger.error(f"[WORKER] Run {job.run_id} crashed: {e} (retry={retry})")
+            if not retry:
+                await asyncio.to_thread(
+                    update_run_status, job.run_id, "failed",
+                    error_message=str(e), completed_at=datetime.now()
+                )
+            return
+        finally:
+            heartbeat.cancel()
+
+        if succeeded:
+            await asyncio.to_thread(self.queue.complete, job.id, self.worker_id)
+        else:
+            # 파이프라인 실패는 run에 이미 기록됨 (같은 입력 재실행은 하지 않음)
+            await asyncio.to_thread(self.queue.fail, job.id, self.worker_id, "pipeline failed", False)
+        logger.info(f"[WORKER] Finished run {job.run_id} (success={succeeded})")
+
+    async def _heartbeat(self, job: Job, pipeline: asyncio.Task):
+        # 일시적인 하트비트 오류는 keep_lease가 재시도, 리스를 실제로 잃었을 때만 취소
+        await keep_lease(
+            self.queue,
+            job,
+            self.worker_id,
+            self.lease_seconds,
+            self.heartbeat_interval,
+            on_renew=lambda: asyncio.to_thread(update_run_heartbeat, job.run_id, self.worker_id)
+        )
+        pipeline.cancel()
+
+
+async def main_async(args: argparse.Namespace):
+    from backend.langgraph_pipeline.graph import close_checkpointer, open_checkpointer
+
+    configure_services()
+    await open_checkpointer()
+    worker = RunWorker(
+        get_run_queue(),
+        concurrency=args.concurrency,
+        lease_seconds=args.lease_seconds,
+        heartbeat_interval=args.heartbeat_interval,
+        poll_interval=args.poll_interval
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:  # Windows
+            pass
+
+    try:
+        await worker.run()
+    finally:
+        from backend.services.llm_registry import llm_registry
+        await llm_registry.aclose()
+        await close_checkpointer()
+
+
+def main():
+    configure_logging()
+    parser = argparse.ArgumentParser(description="ideator-books run worker")
+    parser.add_argument("--concurrency", type=int, default=settings.worker_concurrency, help="동시 실행 run 수")
+    parser.add_argument("--lease-seconds", type=float, default=settings.worker_lease_seconds, help="클레임 리스 (초)")
+    parser.add_argument("--heartbeat-interval", type=float, default=settings.worker_heartbeat_interval, help="하트비트 주기 (초)")
+    parser.add_argument("--poll-interval", type=float, default=settings.worker_poll_interval, help="빈 큐 폴링 주기 (초)")
+    args = parser.parse_args()
+
+    if settings.run_queue_backend == "background":
+        parser.error("RUN_QUEUE_BACKEND=background (API 프로세스에서 실행) - 워커를 쓰려면 sqlite로 설정")
+
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()